@@ -1,3 +1,4 @@
 from arango.client import ArangoClient  # noqa: F401
 from arango.exceptions import *         # noqa: F401 F403
 from arango.http import *               # noqa: F401 F403
+from arango.vst import *                # noqa: F401 F403
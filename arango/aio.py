@@ -0,0 +1,623 @@
+from __future__ import absolute_import, unicode_literals
+
+__all__ = [
+    'AsyncArangoClient',
+    'AsyncConnection',
+    'AsyncCursor',
+    'AsyncHTTPClient',
+    'AsyncStandardDatabase',
+    'DefaultAsyncHTTPClient',
+]
+
+import json
+from abc import ABCMeta, abstractmethod
+
+from arango.connection import (
+    Connection,
+    _can_fail_over,
+    _is_connect_error
+)
+from arango.cursor import Cursor
+from arango.database import Database
+from arango.exceptions import (
+    CursorCloseError,
+    CursorEmptyError,
+    CursorNextError,
+    CursorStateError,
+    ServerConnectionError
+)
+from arango.executor import Executor
+from arango.request import Request
+from arango.resolver import get_host_resolver
+from arango.response import Response
+from arango.version import __version__
+
+
+class AsyncHTTPClient(object):  # pragma: no cover
+    """Abstract base class for asyncio HTTP clients."""
+
+    __metaclass__ = ABCMeta
+
+    @abstractmethod
+    async def send_request(self,
+                           method,
+                           url,
+                           headers=None,
+                           params=None,
+                           data=None,
+                           auth=None):
+        """Send an HTTP request.
+
+        This coroutine must be overridden by the user.
+
+        :param method: HTTP method in lowercase (e.g. "post").
+        :type method: str | unicode
+        :param url: Request URL.
+        :type url: str | unicode
+        :param headers: Request headers.
+        :type headers: dict
+        :param params: URL (query) parameters.
+        :type params: dict
+        :param data: Request payload.
+        :type data: str | unicode | bool | int | list | dict
+        :param auth: Username and password.
+        :type auth: tuple
+        :returns: HTTP response.
+        :rtype: arango.response.Response
+        """
+        raise NotImplementedError
+
+    async def close(self):
+        """Release the resources held by the client (e.g. open sockets)."""
+
+
+class DefaultAsyncHTTPClient(AsyncHTTPClient):
+    """Default asyncio HTTP client implementation.
+
+    The client is built on aiohttp_, which must be installed separately (e.g.
+    ``pip install python-arango[async]``). Its session is created lazily on
+    the first request so that it binds to the running event loop.
+
+    :param deserializer: Callable which deserializes JSON response bodies
+        (default: :func:`json.loads`).
+    :type deserializer: callable
+
+    .. _aiohttp: https://docs.aiohttp.org
+    """
+
+    def __init__(self, deserializer=json.loads):
+        self._session = None
+        self._deserializer = deserializer
+
+    async def send_request(self,
+                           method,
+                           url,
+                           params=None,
+                           data=None,
+                           headers=None,
+                           auth=None):
+        """Send an HTTP request.
+
+        :param method: HTTP method in lowercase (e.g. "post").
+        :type method: str | unicode
+        :param url: Request URL.
+        :type url: str | unicode
+        :param headers: Request headers.
+        :type headers: dict
+        :param params: URL (query) parameters.
+        :type params: dict
+        :param data: Request payload.
+        :type data: str | unicode | bool | int | list | dict
+        :param auth: Username and password.
+        :type auth: tuple
+        :returns: HTTP response.
+        :rtype: arango.response.Response
+        """
+        import aiohttp
+
+        if self._session is None:
+            self._session = aiohttp.ClientSession()
+
+        async with self._session.request(
+            method=method,
+            url=url,
+            params=params,
+            data=data,
+            headers=headers,
+            auth=None if auth is None else aiohttp.BasicAuth(*auth),
+        ) as raw_resp:
+            raw_body = await raw_resp.text()
+
+        return Response(
+            method=raw_resp.method,
+            url=str(raw_resp.url),
+            headers=raw_resp.headers,
+            status_code=raw_resp.status,
+            status_text=raw_resp.reason,
+            raw_body=raw_body,
+            deserializer=self._deserializer
+        )
+
+    async def close(self):
+        """Close the underlying aiohttp session."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+
+class AsyncConnection(Connection):
+    """Asyncio HTTP connection to specific ArangoDB database.
+
+    :param url: ArangoDB base URL, or a list of base URLs (e.g. one per
+        cluster coordinator).
+    :type url: str | unicode | [str | unicode]
+    :param db: Database name.
+    :type db: str | unicode
+    :param username: Username.
+    :type username: str | unicode
+    :param password: Password.
+    :type password: str | unicode
+    :param http_client: User-defined asyncio HTTP client.
+    :type http_client: arango.aio.AsyncHTTPClient
+    :param host_resolver: Host resolver. If not set, requests are sent to
+        the hosts in round-robin fashion.
+    :type host_resolver: arango.resolver.HostResolver
+    :param serializer: Callable which serializes request payloads into JSON
+        strings or bytes (default: :func:`json.dumps`).
+    :type serializer: callable
+    :param deserializer: Callable which deserializes JSON response bodies
+        split out of batch responses (default: :func:`json.loads`).
+    :type deserializer: callable
+    """
+
+    def __init__(self,
+                 url,
+                 db,
+                 username,
+                 password,
+                 http_client,
+                 host_resolver=None,
+                 serializer=json.dumps,
+                 deserializer=json.loads):
+        super(AsyncConnection, self).__init__(
+            url=url,
+            db=db,
+            username=username,
+            password=password,
+            http_client=http_client or DefaultAsyncHTTPClient(),
+            host_resolver=host_resolver,
+            serializer=serializer,
+            deserializer=deserializer
+        )
+
+    async def _send(self, request, host_index):
+        """Send an HTTP request to the given host.
+
+        :param request: HTTP request.
+        :type request: arango.request.Request
+        :param host_index: Host index.
+        :type host_index: int
+        :return: HTTP response.
+        :rtype: arango.response.Response
+        """
+        try:
+            response = await self._http_client.send_request(
+                method=request.method,
+                url=self._url_prefixes[host_index] + request.endpoint,
+                params=request.params,
+                data=request.serialize(self._serializer),
+                headers=request.headers,
+                auth=self._auth,
+            )
+        except IOError as err:
+            if _is_connect_error(err):
+                self._host_resolver.mark_down(host_index)
+            raise
+        finally:
+            self._host_resolver.release(host_index)
+        response.host_index = host_index
+        return response
+
+    async def _probe_hosts(self):
+        """Re-probe the down hosts which are due, and put the ones which
+        respond back into rotation."""
+        for host_index in self._host_resolver.hosts_to_probe():
+            self._host_resolver.acquire(host_index)
+            try:
+                response = await self._send(self._probe_request(), host_index)
+            except IOError:
+                continue
+            if response.status_code < 500:
+                self._host_resolver.mark_up(host_index)
+
+    async def send_request(self, request, host_index=None):
+        """Send an HTTP request to ArangoDB server.
+
+        :param request: HTTP request.
+        :type request: arango.request.Request
+        :param host_index: Index of the host to send the request to. If not
+            set, the host is picked by the host resolver.
+        :type host_index: int
+        :return: HTTP response.
+        :rtype: arango.response.Response
+        """
+        if host_index is not None:
+            self._host_resolver.acquire(host_index)
+            return await self._send(request, host_index)
+
+        await self._probe_hosts()
+        tried = set()
+        while True:
+            host_index = self._host_resolver.get_host_index(tried)
+            try:
+                return await self._send(request, host_index)
+            except IOError as err:
+                tried.add(host_index)
+                if (not _can_fail_over(request, err) or
+                        len(tried) == self._host_resolver.host_count):
+                    raise
+
+
+class AsyncCursor(Cursor):
+    """Cursor API wrapper for asyncio execution.
+
+    Supports ``async for`` iteration and ``async with`` blocks. Methods which
+    talk to the server (:func:`arango.aio.AsyncCursor.next`,
+    :func:`arango.aio.AsyncCursor.fetch` and
+    :func:`arango.aio.AsyncCursor.close`) are coroutines.
+
+    :param connection: Asyncio HTTP connection.
+    :type connection: arango.aio.AsyncConnection
+    :param init_data: Cursor initialization data.
+    :type init_data: dict | list
+    :param cursor_type: Cursor type ("cursor" or "export").
+    :type cursor_type: str | unicode
+    :param host_index: Index of the host which created the cursor.
+    :type host_index: int
+    """
+
+    __slots__ = []
+
+    def __iter__(self):
+        raise TypeError('use "async for" to iterate an async cursor')
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        return await self.next()
+
+    def __enter__(self):
+        raise TypeError('use "async with" to manage an async cursor')
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *_):
+        await self.close(ignore_missing=True)
+
+    def __repr__(self):
+        if self._id:
+            return '<AsyncCursor {}>'.format(self._id)
+        return '<AsyncCursor>'
+
+    async def next(self):
+        """Pop the next item from the current batch.
+
+        If current batch is empty/depleted, an API request is automatically
+        sent to ArangoDB server to fetch the next batch and update the cursor.
+
+        :return: Next item in current batch.
+        :rtype: str | unicode | bool | int | list | dict
+        :raise StopAsyncIteration: If the result set is depleted.
+        :raise arango.exceptions.CursorNextError: If batch retrieval fails.
+        :raise arango.exceptions.CursorStateError: If cursor ID is not set.
+        """
+        if self.empty():
+            if not self.has_more():
+                raise StopAsyncIteration
+            await self.fetch()
+
+        return self.pop()
+
+    def pop(self):
+        """Pop the next item from current batch.
+
+        If current batch is empty/depleted, an exception is raised. You must
+        await :func:`arango.aio.AsyncCursor.fetch` to manually fetch the next
+        batch from server.
+
+        :return: Next item in current batch.
+        :rtype: str | unicode | bool | int | list | dict
+        :raise arango.exceptions.CursorEmptyError: If current batch is empty.
+        """
+        if len(self._batch) == 0:
+            raise CursorEmptyError('current batch is empty')
+        return self._batch.popleft()
+
+    async def fetch(self):
+        """Fetch the next batch from server and update the cursor.
+
+        :return: New batch details.
+        :rtype: dict
+        :raise arango.exceptions.CursorNextError: If batch retrieval fails.
+        :raise arango.exceptions.CursorStateError: If cursor ID is not set.
+        """
+        if self._id is None:
+            raise CursorStateError('cursor ID not set')
+        request = Request(
+            method='put',
+            endpoint='/_api/{}/{}'.format(self._type, self._id)
+        )
+        resp = await self._conn.send_request(request, self._host_index)
+
+        if not resp.is_success:
+            raise CursorNextError(resp, request)
+        return self._update(resp.body)
+
+    async def close(self, ignore_missing=False):
+        """Close the cursor and free any server resources tied to it.
+
+        :param ignore_missing: Do not raise exception on missing cursors.
+        :type ignore_missing: bool
+        :return: True if cursor was closed successfully, False if cursor was
+            missing on the server and **ignore_missing** was set to True, None
+            if there are no cursors to close server-side (e.g. result set is
+            smaller than the batch size).
+        :rtype: bool | None
+        :raise arango.exceptions.CursorCloseError: If operation fails.
+        """
+        if self._id is None:
+            return None
+        request = Request(
+            method='delete',
+            endpoint='/_api/{}/{}'.format(self._type, self._id)
+        )
+        resp = await self._conn.send_request(request, self._host_index)
+        if resp.is_success:
+            return True
+        if resp.status_code == 404 and ignore_missing:
+            return False
+        raise CursorCloseError(resp, request)
+
+
+def _to_async_cursor(cursor):
+    """Return an async cursor carrying over the state of a regular cursor.
+
+    Response handlers shared with the synchronous API build regular cursors,
+    so they are converted here before being handed to the caller.
+
+    :param cursor: Regular cursor.
+    :type cursor: arango.cursor.Cursor
+    :return: Async cursor.
+    :rtype: arango.aio.AsyncCursor
+    """
+    async_cursor = AsyncCursor.__new__(AsyncCursor)
+    for field in Cursor.__slots__:
+        setattr(async_cursor, field, getattr(cursor, field))
+    return async_cursor
+
+
+class AsyncDefaultExecutor(Executor):
+    """Asyncio API executor.
+
+    API executions return coroutines which resolve to the same results the
+    default executor would return, except cursors which are returned as
+    instances of :class:`arango.aio.AsyncCursor`.
+
+    :param connection: Asyncio HTTP connection.
+    :type connection: arango.aio.AsyncConnection
+    """
+    context = 'asyncio'
+
+    def __init__(self, connection):
+        super(AsyncDefaultExecutor, self).__init__(connection)
+
+    async def execute(self, request, response_handler):
+        """Execute an API request and return the result.
+
+        :param request: HTTP request.
+        :type request: arango.request.Request
+        :param response_handler: HTTP response handler.
+        :type response_handler: callable
+        :return: API execution result.
+        :rtype: str | unicode | bool | int | list | dict
+        """
+        response = await self._conn.send_request(request)
+        result = response_handler(response)
+        if isinstance(result, Cursor):
+            return _to_async_cursor(result)
+        return result
+
+
+class AsyncStandardDatabase(Database):
+    """Standard database API wrapper for asyncio execution.
+
+    Every API method returns a coroutine. Convenience methods composed of
+    several API calls on the client side (e.g. ``has_collection``) are not
+    supported, as in other non-default execution contexts.
+
+    :param connection: Asyncio HTTP connection.
+    :type connection: arango.aio.AsyncConnection
+    """
+
+    def __init__(self, connection):
+        super(AsyncStandardDatabase, self).__init__(
+            connection=connection,
+            executor=AsyncDefaultExecutor(connection)
+        )
+
+    def __repr__(self):
+        return '<AsyncStandardDatabase {}>'.format(self.name)
+
+
+class AsyncArangoClient(object):
+    """ArangoDB client for asyncio applications.
+
+    Mirrors :class:`arango.client.ArangoClient`, but the databases it returns
+    execute API calls as coroutines. A single client (and hence a single
+    connection pool) can be shared by any number of tasks on one event loop.
+
+    :param protocol: Internet transfer protocol (default: "http").
+    :type protocol: str | unicode
+    :param host: ArangoDB host (default: "127.0.0.1").
+    :type host: str | unicode
+    :param port: ArangoDB port (default: 8529).
+    :type port: int
+    :param http_client: User-defined asyncio HTTP client.
+    :type http_client: arango.aio.AsyncHTTPClient
+    :param hosts: Base URLs of multiple ArangoDB hosts (e.g. cluster
+        coordinators). If set, parameters **protocol**, **host** and **port**
+        are ignored.
+    :type hosts: [str | unicode]
+    :param host_resolver: Strategy for picking the host of each request:
+        "roundrobin" (default), "random" or "least_outstanding", or a custom
+        instance of :class:`arango.resolver.HostResolver`.
+    :type host_resolver: str | unicode | arango.resolver.HostResolver
+    :param host_recheck_interval: Number of seconds a host is kept out of
+        rotation after a connection error before it is re-probed.
+    :type host_recheck_interval: int | float
+    :param serializer: Callable which serializes request payloads into JSON
+        strings or bytes (default: :func:`json.dumps`).
+    :type serializer: callable
+    :param deserializer: Callable which deserializes JSON response bodies
+        (default: :func:`json.loads`). If **http_client** is set, it is only
+        used for batch responses and the HTTP client must apply it to the
+        others itself.
+    :type deserializer: callable
+    """
+
+    def __init__(self,
+                 protocol='http',
+                 host='127.0.0.1',
+                 port=8529,
+                 http_client=None,
+                 hosts=None,
+                 host_resolver='roundrobin',
+                 host_recheck_interval=30,
+                 serializer=json.dumps,
+                 deserializer=json.loads):
+        self._protocol = protocol.strip('/')
+        self._host = host.strip('/')
+        self._port = int(port)
+        if hosts:
+            self._hosts = [url.rstrip('/') for url in hosts]
+        else:
+            self._hosts = ['{}://{}:{}'.format(protocol, host, port)]
+        self._url = self._hosts[0]
+        self._host_resolver = get_host_resolver(
+            host_resolver, len(self._hosts), host_recheck_interval)
+        self._http_client = (
+            http_client or DefaultAsyncHTTPClient(deserializer=deserializer)
+        )
+        self._serializer = serializer
+        self._deserializer = deserializer
+
+    def __repr__(self):
+        return '<AsyncArangoClient {}>'.format(','.join(self._hosts))
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *_):
+        await self.close()
+
+    @property
+    def version(self):
+        """Return the client version.
+
+        :return: Client version.
+        :rtype: str | unicode
+        """
+        return __version__
+
+    @property
+    def protocol(self):
+        """Return the internet transfer protocol (e.g. "http").
+
+        :return: Internet transfer protocol.
+        :rtype: str | unicode
+        """
+        return self._protocol
+
+    @property
+    def host(self):
+        """Return the ArangoDB host.
+
+        :return: ArangoDB host.
+        :rtype: str | unicode
+        """
+        return self._host
+
+    @property
+    def port(self):
+        """Return the ArangoDB port.
+
+        :return: ArangoDB port.
+        :rtype: int
+        """
+        return self._port
+
+    @property
+    def base_url(self):
+        """Return the ArangoDB base URL (of the first host if there are many).
+
+        :return: ArangoDB base URL.
+        :rtype: str | unicode
+        """
+        return self._url
+
+    @property
+    def hosts(self):
+        """Return the base URLs of all ArangoDB hosts.
+
+        :return: ArangoDB base URLs.
+        :rtype: [str | unicode]
+        """
+        return self._hosts
+
+    async def db(self,
+                 name='_system',
+                 username='root',
+                 password='',
+                 verify=False):
+        """Connect to a database and return the database API wrapper.
+
+        :param name: Database name.
+        :type name: str | unicode
+        :param username: Username for basic authentication.
+        :type username: str | unicode
+        :param password: Password for basic authentication.
+        :type password: str | unicode
+        :param verify: Verify the connection by sending a test request.
+        :type verify: bool
+        :return: Standard database API wrapper for asyncio execution.
+        :rtype: arango.aio.AsyncStandardDatabase
+        :raise arango.exceptions.ServerConnectionError: If **verify** was set
+            to True and the connection to ArangoDB fails.
+        """
+        connection = AsyncConnection(
+            url=self._hosts,
+            db=name,
+            username=username,
+            password=password,
+            http_client=self._http_client,
+            host_resolver=self._host_resolver,
+            serializer=self._serializer,
+            deserializer=self._deserializer
+        )
+        database = AsyncStandardDatabase(connection)
+
+        if verify:  # Check the server connection by making a read API call
+            try:
+                await database.ping()
+            except ServerConnectionError as err:
+                raise err
+            except Exception as err:
+                raise ServerConnectionError('bad connection: {}'.format(err))
+
+        return database
+
+    async def close(self):
+        """Close the HTTP client and release its connections."""
+        await self._http_client.close()
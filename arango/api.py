@@ -40,7 +40,7 @@ class APIWrapper(object):
         """Return the API execution context.
 
         :return: API execution context. Possible values are "default", "async",
-            "batch" and "transaction".
+            "batch", "transaction", "stream_transaction" and "asyncio".
         :rtype: str | unicode
         """
         return self._executor.context
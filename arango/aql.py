@@ -1,8 +1,9 @@
 from __future__ import absolute_import, unicode_literals
 
+from collections import OrderedDict
 from json import dumps
 
-__all__ = ['AQL', 'AQLQueryCache']
+__all__ = ['AQL', 'AQLQueryCache', 'PreparedQuery']
 
 from arango.api import APIWrapper
 from arango.cursor import Cursor
@@ -23,7 +24,12 @@ from arango.exceptions import (
     AQLCacheConfigureError,
     AQLCachePropertiesError
 )
+from arango.executor import BatchExecutor
 from arango.request import Request
+from arango.utils import is_aql_write
+
+# Max number of execution plans cached per prepared query.
+_MAX_CACHED_PLANS = 128
 
 
 class AQL(APIWrapper):
@@ -80,6 +86,77 @@ class AQL(APIWrapper):
                 query['runtime'] = query.pop('runTime')
         return body
 
+    # noinspection PyMethodMayBeStatic
+    def _build_data(self,
+                    query,
+                    count=False,
+                    batch_size=None,
+                    ttl=None,
+                    bind_vars=None,
+                    full_count=None,
+                    max_plans=None,
+                    optimizer_rules=None,
+                    cache=None,
+                    memory_limit=0,
+                    fail_on_warning=None,
+                    profile=None,
+                    max_transaction_size=None,
+                    max_warning_count=None,
+                    intermediate_commit_count=None,
+                    intermediate_commit_size=None,
+                    satellite_sync_wait=None,
+                    stream=None,
+                    skip_inaccessible_cols=None):
+        """Build the cursor API request payload of a query.
+
+        See :func:`arango.aql.AQL.execute` for parameter descriptions.
+
+        :return: Request payload.
+        :rtype: dict
+        """
+        data = {'query': query, 'count': count}
+        if batch_size is not None:
+            data['batchSize'] = batch_size
+        if ttl is not None:
+            data['ttl'] = ttl
+        if bind_vars is not None:
+            data['bindVars'] = bind_vars
+        if cache is not None:
+            data['cache'] = cache
+        if memory_limit is not None:
+            data['memoryLimit'] = memory_limit
+
+        options = {}
+        if full_count is not None:
+            options['fullCount'] = full_count
+        if max_plans is not None:
+            options['maxNumberOfPlans'] = max_plans
+        if optimizer_rules is not None:
+            options['optimizer'] = {'rules': optimizer_rules}
+        if fail_on_warning is not None:
+            options['failOnWarning'] = fail_on_warning
+        if profile is not None:
+            options['profile'] = profile
+        if max_transaction_size is not None:
+            options['maxTransactionSize'] = max_transaction_size
+        if max_warning_count is not None:
+            options['maxWarningCount'] = max_warning_count
+        if intermediate_commit_count is not None:
+            options['intermediateCommitCount'] = intermediate_commit_count
+        if intermediate_commit_size is not None:
+            options['intermediateCommitSize'] = intermediate_commit_size
+        if satellite_sync_wait is not None:
+            options['satelliteSyncWait'] = satellite_sync_wait
+        if stream is not None:
+            options['stream'] = stream
+        if skip_inaccessible_cols is not None:
+            options['skipInaccessibleCollections'] = skip_inaccessible_cols
+
+        if options:
+            data['options'] = options
+        data.update(options)
+        return data
+
     @property
     def cache(self):
         """Return the query cache API wrapper.
@@ -89,7 +166,12 @@ class AQL(APIWrapper):
         """
         return AQLQueryCache(self._conn, self._executor)
 
-    def explain(self, query, all_plans=False, max_plans=None, opt_rules=None):
+    def explain(self,
+                query,
+                all_plans=False,
+                max_plans=None,
+                opt_rules=None,
+                bind_vars=None):
         """Inspect the query and return its metadata without executing it.
 
         :param query: Query to inspect.
@@ -102,6 +184,8 @@ class AQL(APIWrapper):
         :type max_plans: int
         :param opt_rules: List of optimizer rules.
         :type opt_rules: list
+        :param bind_vars: Bind variables for the query.
+        :type bind_vars: dict
         :return: Execution plan, or plans if **all_plans** was set to True.
         :rtype: dict | list
         :raise arango.exceptions.AQLQueryExplainError: If explain fails.
@@ -112,10 +196,14 @@ class AQL(APIWrapper):
         if opt_rules is not None:
             options['optimizer'] = {'rules': opt_rules}
 
+        data = {'query': query, 'options': options}
+        if bind_vars is not None:
+            data['bindVars'] = bind_vars
+
         request = Request(
             method='post',
             endpoint='/_api/explain',
-            data={'query': query, 'options': options}
+            data=data
         )
 
         def response_handler(resp):
@@ -176,7 +264,8 @@ class AQL(APIWrapper):
                 read_collections=None,
                 write_collections=None,
                 stream=None,
-                skip_inaccessible_cols=None):
+                skip_inaccessible_cols=None,
+                prefetch=0):
         """Execute the query and return the result cursor.
 
         :param query: Query to execute.
@@ -264,51 +353,37 @@ class AQL(APIWrapper):
             available only for enterprise version of ArangoDB. Default value is
             False.
         :type skip_inaccessible_cols: bool
+        :param prefetch: Max number of result batches the cursor fetches ahead
+            in a background thread while the current batch is consumed. This
+            hides the round trip at each batch boundary when iterating over
+            large result sets, at the cost of holding up to **prefetch** extra
+            batches in memory. Value 0 (default) disables prefetching.
+        :type prefetch: int
         :return: Result cursor.
         :rtype: arango.cursor.Cursor
         :raise arango.exceptions.AQLQueryExecuteError: If execute fails.
         """
-        data = {'query': query, 'count': count}
-        if batch_size is not None:
-            data['batchSize'] = batch_size
-        if ttl is not None:
-            data['ttl'] = ttl
-        if bind_vars is not None:
-            data['bindVars'] = bind_vars
-        if cache is not None:
-            data['cache'] = cache
-        if memory_limit is not None:
-            data['memoryLimit'] = memory_limit
-
-        options = {}
-        if full_count is not None:
-            options['fullCount'] = full_count
-        if max_plans is not None:
-            options['maxNumberOfPlans'] = max_plans
-        if optimizer_rules is not None:
-            options['optimizer'] = {'rules': optimizer_rules}
-        if fail_on_warning is not None:
-            options['failOnWarning'] = fail_on_warning
-        if profile is not None:
-            options['profile'] = profile
-        if max_transaction_size is not None:
-            options['maxTransactionSize'] = max_transaction_size
-        if max_warning_count is not None:
-            options['maxWarningCount'] = max_warning_count
-        if intermediate_commit_count is not None:
-            options['intermediateCommitCount'] = intermediate_commit_count
-        if intermediate_commit_size is not None:
-            options['intermediateCommitSize'] = intermediate_commit_size
-        if satellite_sync_wait is not None:
-            options['satelliteSyncWait'] = satellite_sync_wait
-        if stream is not None:
-            options['stream'] = stream
-        if skip_inaccessible_cols is not None:
-            options['skipInaccessibleCollections'] = skip_inaccessible_cols
-
-        if options:
-            data['options'] = options
-        data.update(options)
+        data = self._build_data(
+            query=query,
+            count=count,
+            batch_size=batch_size,
+            ttl=ttl,
+            bind_vars=bind_vars,
+            full_count=full_count,
+            max_plans=max_plans,
+            optimizer_rules=optimizer_rules,
+            cache=cache,
+            memory_limit=memory_limit,
+            fail_on_warning=fail_on_warning,
+            profile=profile,
+            max_transaction_size=max_transaction_size,
+            max_warning_count=max_warning_count,
+            intermediate_commit_count=intermediate_commit_count,
+            intermediate_commit_size=intermediate_commit_size,
+            satellite_sync_wait=satellite_sync_wait,
+            stream=stream,
+            skip_inaccessible_cols=skip_inaccessible_cols
+        )
 
         command = 'db._query({}, {}, {}).toArray()'.format(
             dumps(query),
@@ -325,10 +400,154 @@ class AQL(APIWrapper):
             write=write_collections
         )
 
+        if (self.context == 'default' and
+                self._executor.result_cache is not None):
+            return self._execute_cached(request, data, prefetch)
+
         def response_handler(resp):
             if not resp.is_success:
                 raise AQLQueryExecuteError(resp, request)
-            return Cursor(self._conn, resp.body)
+            return Cursor(
+                self._conn,
+                resp.body,
+                host_index=resp.host_index,
+                prefetch=prefetch
+            )
+
+        return self._execute(request, response_handler)
+
+    def _execute_cached(self, request, data, prefetch):
+        """Execute the query using the query result cache.
+
+        Read-only queries are served from the cache if possible. Otherwise
+        their result sets are fetched and cached, unless they hold more than
+        the max number of rows of the cache, in which case the live cursor is
+        returned. Queries containing write operations are never cached (the
+        connection clears the cache when they are sent).
+
+        :param request: Cursor API request.
+        :type request: arango.request.Request
+        :param data: Cursor API request payload.
+        :type data: dict
+        :param prefetch: Max number of batches fetched ahead.
+        :type prefetch: int
+        :return: Result cursor.
+        :rtype: arango.cursor.Cursor
+        :raise arango.exceptions.AQLQueryExecuteError: If execute fails.
+        """
+        cache = self._executor.result_cache
+        writes = is_aql_write(data['query'])
+        if not writes:
+            key = (
+                self._conn.db_name,
+                self._conn.username,
+                dumps(data, sort_keys=True)
+            )
+            cached = cache.get(key)
+            if cached is not None:
+                return Cursor(self._conn, cached)
+            generation = cache.generation
+
+        def response_handler(resp):
+            if not resp.is_success:
+                raise AQLQueryExecuteError(resp, request)
+            cursor = Cursor(
+                self._conn,
+                resp.body,
+                host_index=resp.host_index,
+                prefetch=prefetch
+            )
+            if writes:
+                return cursor
+
+            max_rows = cache.max_rows
+            result = []
+            while True:
+                batch = cursor.batch()
+                size = len(result) + len(batch)
+                if max_rows is not None and size > max_rows:
+                    # Too large to cache, so hand the rows read so far back
+                    # to the cursor and let it fetch the rest.
+                    batch.extendleft(reversed(result))
+                    return cursor
+                result.extend(batch)
+                batch.clear()
+                if not cursor.has_more():
+                    break
+                cursor.fetch()
+
+            extra = {}
+            if cursor.statistics() is not None:
+                extra['stats'] = cursor.statistics()
+            if cursor.profile() is not None:
+                extra['profile'] = cursor.profile()
+            if cursor.warnings() is not None:
+                extra['warnings'] = cursor.warnings()
+            init_data = {'result': result, 'hasMore': False, 'extra': extra}
+            if cursor.count() is not None:
+                init_data['count'] = cursor.count()
+            if cursor.cached() is not None:
+                init_data['cached'] = cursor.cached()
+
+            cache.put(key, init_data, generation)
+            return Cursor(self._conn, init_data)
+
+        return self._execute(request, response_handler)
+
+    def prepare(self,
+                query,
+                read_collections=None,
+                write_collections=None,
+                prefetch=0,
+                **options):
+        """Validate the query and prepare it for repeated execution.
+
+        The request payload apart from bind variables is built and serialized
+        only once, so executions of the prepared query which differ only in
+        bind variables skip most of the per-call work of
+        :func:`arango.aql.AQL.execute`.
+
+        :param query: Query to prepare.
+        :type query: str | unicode
+        :param read_collections: Names of collections read during query
+            execution. Required for :doc:`transactions <transaction>`.
+        :type read_collections: [str | unicode]
+        :param write_collections: Names of collections written to during query
+            execution. Required for :doc:`transactions <transaction>`.
+        :type write_collections: [str | unicode]
+        :param prefetch: Max number of result batches the cursors fetch ahead
+            in a background thread.
+        :type prefetch: int
+        :param options: Other keyword arguments of
+            :func:`arango.aql.AQL.execute` (e.g. "batch_size"), except
+            **bind_vars** which are given per execution.
+        :type options: dict
+        :return: Prepared query.
+        :rtype: arango.aql.PreparedQuery
+        :raise arango.exceptions.AQLQueryValidateError: If validation fails.
+        """
+        data = self._build_data(query, **options)
+        if 'bindVars' in data:
+            raise TypeError('bind_vars are given per execution')
+
+        request = Request(
+            method='post',
+            endpoint='/_api/query',
+            data={'query': query}
+        )
+
+        def response_handler(resp):
+            if not resp.is_success:
+                raise AQLQueryValidateError(resp, request)
+            return PreparedQuery(
+                connection=self._conn,
+                executor=self._executor,
+                data=data,
+                bind_params=resp.body.get('bindVars', []),
+                read=read_collections,
+                write=write_collections,
+                prefetch=prefetch
+            )
 
         return self._execute(request, response_handler)
 
@@ -656,3 +875,247 @@ class AQLQueryCache(APIWrapper):
             return True
 
         return self._execute(request, response_handler)
+
+
+class PreparedQuery(APIWrapper):
+    """Query prepared for repeated execution with different bind variables.
+
+    Use :func:`arango.aql.AQL.prepare` to create instances.
+
+    :param connection: HTTP connection.
+    :type connection: arango.connection.Connection
+    :param executor: API executor.
+    :type executor: arango.executor.Executor
+    :param data: Cursor API request payload without bind variables.
+    :type data: dict
+    :param bind_params: Names of the bind parameters of the query.
+    :type bind_params: [str | unicode]
+    :param read: Names of collections read during query execution.
+    :type read: [str | unicode]
+    :param write: Names of collections written to during query execution.
+    :type write: [str | unicode]
+    :param prefetch: Max number of result batches the cursors fetch ahead.
+    :type prefetch: int
+    """
+
+    def __init__(self,
+                 connection,
+                 executor,
+                 data,
+                 bind_params,
+                 read=None,
+                 write=None,
+                 prefetch=0):
+        super(PreparedQuery, self).__init__(connection, executor)
+        self._data = data
+        self._bind_params = bind_params
+        self._read = read
+        self._write = write
+        self._prefetch = prefetch
+        self._plans = OrderedDict()
+
+        # Serialize the static part of the payload once. Bind variables are
+        # spliced in before its closing brace on each execution, unless the
+        # serializer output does not end with one, in which case the whole
+        # payload is serialized on each execution instead.
+        head = connection.serializer(data).rstrip()
+        self._sep = ', "bindVars": '
+        self._tail = '}'
+        if isinstance(head, bytes):
+            self._sep = self._sep.encode('utf-8')
+            self._tail = self._tail.encode('utf-8')
+        if head.endswith(self._tail):
+            self._head = head[:-1]
+        else:
+            self._head = None
+
+    def __repr__(self):
+        return '<PreparedQuery {}>'.format(self._data['query'])
+
+    @property
+    def query(self):
+        """Return the query text.
+
+        :return: Query text.
+        :rtype: str | unicode
+        """
+        return self._data['query']
+
+    @property
+    def bind_params(self):
+        """Return the names of the bind parameters of the query.
+
+        :return: Names of the bind parameters (collection bind parameters are
+            prefixed with "@").
+        :rtype: [str | unicode]
+        """
+        return list(self._bind_params)
+
+    def _build_request(self, bind_vars):
+        """Build the cursor API request of an execution.
+
+        :param bind_vars: Bind variables for the query.
+        :type bind_vars: dict | None
+        :return: Cursor API request.
+        :rtype: arango.request.Request
+        """
+        if self._head is None:
+            data = dict(self._data, bindVars=bind_vars or {})
+        elif bind_vars:
+            data = (
+                self._head +
+                self._sep +
+                self._conn.serializer(bind_vars) +
+                self._tail
+            )
+        else:
+            data = self._head + self._tail
+
+        if self._is_transaction:
+            command = 'db._query({}, {}, {}).toArray()'.format(
+                dumps(self._data['query']),
+                dumps(bind_vars),
+                dumps(dict(self._data, bindVars=bind_vars)),
+            )
+        else:
+            command = None
+
+        return Request(
+            method='post',
+            endpoint='/_api/cursor',
+            data=data,
+            command=command,
+            read=self._read,
+            write=self._write
+        )
+
+    def _response_handler(self, request):
+        """Return the response handler of an execution.
+
+        :param request: Cursor API request.
+        :type request: arango.request.Request
+        :return: Response handler.
+        :rtype: callable
+        """
+        def response_handler(resp):
+            if not resp.is_success:
+                raise AQLQueryExecuteError(resp, request)
+            return Cursor(
+                self._conn,
+                resp.body,
+                host_index=resp.host_index,
+                prefetch=self._prefetch
+            )
+
+        return response_handler
+
+    def run(self, bind_vars=None):
+        """Execute the query and return the result cursor.
+
+        :param bind_vars: Bind variables for the query.
+        :type bind_vars: dict
+        :return: Result cursor.
+        :rtype: arango.cursor.Cursor
+        :raise arango.exceptions.AQLQueryExecuteError: If execute fails.
+        """
+        request = self._build_request(bind_vars)
+        return self._execute(request, self._response_handler(request))
+
+    def run_many(self, bind_vars_list, max_parts=None, workers=1):
+        """Execute the query once per set of bind variables and return the
+        result cursors.
+
+        In the default API execution context, executions are sent together in
+        batch API requests (see :doc:`batch`), so many executions take a
+        single round trip. In other contexts they are executed one by one via
+        :func:`arango.aql.PreparedQuery.run`.
+
+        :param bind_vars_list: Bind variables of each execution.
+        :type bind_vars_list: [dict]
+        :param max_parts: Max number of executions per batch API request. If
+            not set, all executions are sent in one batch API request.
+        :type max_parts: int
+        :param workers: Max number of batch API requests sent concurrently.
+        :type workers: int
+        :return: Result cursors in the order of **bind_vars_list**.
+        :rtype: [arango.cursor.Cursor]
+        :raise arango.exceptions.AQLQueryExecuteError: If an execution fails.
+        :raise arango.exceptions.BatchExecuteError: If a batch API request
+            fails.
+        """
+        if self.context != 'default':
+            return [self.run(bind_vars) for bind_vars in bind_vars_list]
+
+        executor = BatchExecutor(
+            connection=self._conn,
+            return_result=True,
+            max_parts=max_parts,
+            workers=workers
+        )
+        for bind_vars in bind_vars_list:
+            request = self._build_request(bind_vars)
+            executor.execute(request, self._response_handler(request))
+        return [job.result() for job in executor.commit()]
+
+    def explain(self, bind_vars=None, all_plans=False, max_plans=None):
+        """Return the execution plan of the query.
+
+        Plans are cached per set of arguments: only the first call with given
+        arguments sends a request, and later calls return the cached plan.
+        The plans of the 128 most recently used sets of arguments are kept.
+
+        :param bind_vars: Bind variables for the query. Required if the query
+            has bind parameters. The plan may depend on their values.
+        :type bind_vars: dict
+        :param all_plans: If set to True, all possible execution plans are
+            returned in the result. If set to False, only the optimal plan
+            is returned.
+        :type all_plans: bool
+        :param max_plans: Total number of plans generated by the optimizer.
+        :type max_plans: int
+        :return: Execution plan, or plans if **all_plans** was set to True.
+        :rtype: dict | list
+        :raise arango.exceptions.AQLQueryExplainError: If explain fails.
+        """
+        key = (
+            dumps(bind_vars, sort_keys=True, default=repr)
+            if bind_vars else None,
+            all_plans,
+            max_plans
+        )
+        if key in self._plans:
+            plans = self._plans.pop(key)
+            self._plans[key] = plans
+            return plans
+
+        options = self._data.get('options', {})
+        opt_rules = options.get('optimizer', {}).get('rules')
+        if max_plans is None:
+            max_plans = options.get('maxNumberOfPlans')
+
+        options = {'allPlans': all_plans}
+        if max_plans is not None:
+            options['maxNumberOfPlans'] = max_plans
+        if opt_rules is not None:
+            options['optimizer'] = {'rules': opt_rules}
+
+        data = {'query': self._data['query'], 'options': options}
+        if bind_vars:
+            data['bindVars'] = bind_vars
+
+        request = Request(
+            method='post',
+            endpoint='/_api/explain',
+            data=data
+        )
+
+        def response_handler(resp):
+            if not resp.is_success:
+                raise AQLQueryExplainError(resp, request)
+            plans = resp.body['plan' if 'plan' in resp.body else 'plans']
+            self._plans[key] = plans
+            while len(self._plans) > _MAX_CACHED_PLANS:
+                self._plans.popitem(last=False)
+            return plans
+
+        return self._execute(request, response_handler)
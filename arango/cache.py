@@ -0,0 +1,316 @@
+from __future__ import absolute_import, unicode_literals
+
+__all__ = ['DocumentCache', 'QueryResultCache']
+
+import time
+from collections import OrderedDict
+from threading import Lock
+
+
+class DocumentCache(object):
+    """Client-side LRU cache of documents, keyed by document ID.
+
+    Attach the cache to a collection API wrapper (see
+    :func:`arango.database.StandardDatabase.collection`) to have
+    :func:`arango.collection.StandardCollection.get` serve repeated reads of
+    the same documents locally. Documents are stored serialized along with
+    their revisions, so callers always receive fresh copies.
+
+    An entry is *fresh* for **ttl** seconds after it was stored or last
+    validated. Fresh entries are returned without contacting the server.
+    Other entries are revalidated with a conditional request, which costs a
+    round trip but no document transfer if the document is unchanged.
+
+    The cache is thread-safe. Entries are invalidated automatically when
+    documents are written through the collection API wrappers using it.
+
+    :param maxsize: Max number of documents kept. The least recently used
+        documents are evicted first.
+    :type maxsize: int
+    :param ttl: Number of seconds entries stay fresh. If not set, entries stay
+        fresh until they are invalidated or evicted.
+    :type ttl: int | float
+    :param revalidate: If set to True, entries are never fresh: every read
+        is revalidated with the server, which guarantees up-to-date documents
+        even if they are modified by other clients.
+    :type revalidate: bool
+    """
+
+    def __init__(self, maxsize=1024, ttl=None, revalidate=False):
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._revalidate = revalidate
+        self._lock = Lock()
+        self._entries = OrderedDict()
+        self._stats = {
+            'hits': 0,
+            'misses': 0,
+            'revalidations': 0,
+            'evictions': 0,
+        }
+
+    def __repr__(self):
+        return '<DocumentCache {}/{}>'.format(len(self), self._maxsize)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, doc_id):
+        return doc_id in self._entries
+
+    @property
+    def maxsize(self):
+        """Return the max number of documents kept.
+
+        :return: Max number of documents.
+        :rtype: int
+        """
+        return self._maxsize
+
+    @property
+    def ttl(self):
+        """Return the number of seconds entries stay fresh.
+
+        :return: Number of seconds, or None if entries do not expire.
+        :rtype: int | float | None
+        """
+        return self._ttl
+
+    @property
+    def revalidate(self):
+        """Return True if every read is revalidated with the server.
+
+        :return: True if every read is revalidated.
+        :rtype: bool
+        """
+        return self._revalidate
+
+    def get(self, doc_id):
+        """Return the cache entry of a document.
+
+        :param doc_id: Document ID.
+        :type doc_id: str | unicode
+        :return: Document revision, serialized document and whether the entry
+            is fresh, or None if the document is not cached.
+        :rtype: (str | unicode, str | unicode | bytes, bool) | None
+        """
+        with self._lock:
+            entry = self._entries.get(doc_id)
+            if entry is None:
+                return None
+            self._entries.pop(doc_id)
+            self._entries[doc_id] = entry
+        rev, data, stored_at = entry
+        fresh = not self._revalidate and (
+            self._ttl is None or time.time() - stored_at < self._ttl
+        )
+        return rev, data, fresh
+
+    def put(self, doc_id, rev, data):
+        """Store (or refresh) the cache entry of a document.
+
+        :param doc_id: Document ID.
+        :type doc_id: str | unicode
+        :param rev: Document revision.
+        :type rev: str | unicode
+        :param data: Serialized document.
+        :type data: str | unicode | bytes
+        """
+        with self._lock:
+            self._entries.pop(doc_id, None)
+            self._entries[doc_id] = (rev, data, time.time())
+            while len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+                self._stats['evictions'] += 1
+
+    def invalidate(self, doc_id):
+        """Remove a document from the cache.
+
+        :param doc_id: Document ID.
+        :type doc_id: str | unicode
+        """
+        with self._lock:
+            self._entries.pop(doc_id, None)
+
+    def clear(self):
+        """Remove all documents from the cache."""
+        with self._lock:
+            self._entries.clear()
+
+    def record(self, event):
+        """Increment a cache statistics counter.
+
+        :param event: Counter name ("hits", "misses" or "revalidations").
+        :type event: str | unicode
+        """
+        with self._lock:
+            self._stats[event] += 1
+
+    def statistics(self):
+        """Return the cache statistics.
+
+        :return: Number of reads served locally ("hits"), reads which fetched
+            the document from the server ("misses"), reads confirmed by the
+            server to be unchanged ("revalidations"), documents evicted to
+            make room ("evictions"), and documents cached ("size").
+        :rtype: dict
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats['size'] = len(self._entries)
+        return stats
+
+
+class QueryResultCache(object):
+    """Client-side LRU cache of AQL query results.
+
+    Pass the cache to :func:`arango.client.ArangoClient.db` to have
+    :func:`arango.aql.AQL.execute` serve repeated read-only queries locally.
+    Results are keyed by database, username, query text, bind variables and
+    options (with dictionary keys in canonical order), and replayed through
+    cursors holding the entire result set. Result sets larger than
+    **max_rows** are not cached.
+
+    The cache is thread-safe. It is cleared whenever a write request is sent
+    over the connection of the database API wrapper using it, in any
+    execution context (including write queries, bulk loads and transaction
+    commits), so results are never staler than **ttl** seconds with respect
+    to writes made by other clients. Async writes may still be executed on
+    the server after the cache was cleared.
+
+    Cached results are shared between cursors without being copied, so
+    documents returned from cached queries must not be modified.
+
+    :param maxsize: Max number of query results kept. The least recently used
+        results are evicted first.
+    :type maxsize: int
+    :param ttl: Number of seconds results stay cached. If not set, results
+        stay cached until they are invalidated or evicted.
+    :type ttl: int | float
+    :param max_rows: Max number of rows of a cached result set. Queries
+        returning more rows are served by regular cursors instead, so their
+        results are never held in memory in full. If set to None, result sets
+        of any size are cached.
+    :type max_rows: int | None
+    """
+
+    def __init__(self, maxsize=128, ttl=None, max_rows=10000):
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._max_rows = max_rows
+        self._lock = Lock()
+        self._entries = OrderedDict()
+        self._generation = 0
+        self._stats = {
+            'hits': 0,
+            'misses': 0,
+            'evictions': 0,
+            'invalidations': 0,
+        }
+
+    def __repr__(self):
+        return '<QueryResultCache {}/{}>'.format(len(self), self._maxsize)
+
+    def __len__(self):
+        return len(self._entries)
+
+    @property
+    def maxsize(self):
+        """Return the max number of query results kept.
+
+        :return: Max number of query results.
+        :rtype: int
+        """
+        return self._maxsize
+
+    @property
+    def ttl(self):
+        """Return the number of seconds results stay cached.
+
+        :return: Number of seconds, or None if results do not expire.
+        :rtype: int | float | None
+        """
+        return self._ttl
+
+    @property
+    def max_rows(self):
+        """Return the max number of rows of a cached result set.
+
+        :return: Max number of rows, or None if not limited.
+        :rtype: int | None
+        """
+        return self._max_rows
+
+    @property
+    def generation(self):
+        """Return the number of times the cache was cleared.
+
+        Pass the value read before executing a query to
+        :func:`arango.cache.QueryResultCache.put`, so that results which were
+        in flight while the cache was cleared are discarded.
+
+        :return: Cache generation.
+        :rtype: int
+        """
+        return self._generation
+
+    def get(self, key):
+        """Return a cached query result.
+
+        :param key: Query key.
+        :type key: tuple
+        :return: Cursor initialization data holding the entire result set, or
+            None if the result is not cached (or expired).
+        :rtype: dict | None
+        """
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is not None:
+                data, stored_at = entry
+                if self._ttl is None or time.time() - stored_at < self._ttl:
+                    self._entries[key] = entry
+                    self._stats['hits'] += 1
+                    return data
+            self._stats['misses'] += 1
+            return None
+
+    def put(self, key, data, generation):
+        """Store a query result.
+
+        :param key: Query key.
+        :type key: tuple
+        :param data: Cursor initialization data holding the entire result set.
+        :type data: dict
+        :param generation: Cache generation read before the query was
+            executed. If the cache was cleared since, the result is discarded.
+        :type generation: int
+        """
+        with self._lock:
+            if generation != self._generation:
+                return
+            self._entries.pop(key, None)
+            self._entries[key] = (data, time.time())
+            while len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+                self._stats['evictions'] += 1
+
+    def clear(self):
+        """Remove all query results from the cache."""
+        with self._lock:
+            self._stats['invalidations'] += len(self._entries)
+            self._entries.clear()
+            self._generation += 1
+
+    def statistics(self):
+        """Return the cache statistics.
+
+        :return: Number of queries served locally ("hits"), queries executed
+            on the server ("misses"), results evicted to make room
+            ("evictions"), results removed when the cache was cleared
+            ("invalidations"), and results cached ("size").
+        :rtype: dict
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats['size'] = len(self._entries)
+        return stats
@@ -2,9 +2,14 @@ from __future__ import absolute_import, unicode_literals
 
 __all__ = ['ArangoClient']
 
+import json
+
+from arango import velocypack as vpack
 from arango.connection import Connection
 from arango.database import StandardDatabase
 from arango.exceptions import ServerConnectionError
+from arango.http import DefaultHTTPClient
+from arango.resolver import get_host_resolver
 from arango.version import __version__
 
 
@@ -17,23 +22,114 @@ class ArangoClient(object):
     :type host: str | unicode
     :param port: ArangoDB port (default: 8529).
     :type port: int
-    :param http_client: User-defined HTTP client.
+    :param http_client: User-defined HTTP client. If not set, an instance of
+        :class:`arango.http.DefaultHTTPClient` shared by all databases returned
+        by this client is created using the connection pool parameters below.
     :type http_client: arango.http.HTTPClient
+    :param pool_connections: Number of per-host connection pools to cache.
+        Ignored if **http_client** is set.
+    :type pool_connections: int
+    :param pool_maxsize: Max number of connections kept open per host. Set
+        this to the number of threads sharing the client. Ignored if
+        **http_client** is set.
+    :type pool_maxsize: int
+    :param pool_block: If set to True, requests wait for a free connection
+        when the pool is exhausted instead of opening extra connections.
+        Ignored if **http_client** is set.
+    :type pool_block: bool
+    :param keep_alive: If set to False, connections are not reused across
+        requests. Ignored if **http_client** is set.
+    :type keep_alive: bool
+    :param keep_raw_body: If set to False, the raw text of successful JSON
+        responses is discarded once decoded to save memory. Ignored if
+        **http_client** is set.
+    :type keep_raw_body: bool
+    :param compression: Content encoding used to compress request bodies of
+        at least **compression_threshold** bytes: "gzip" or "deflate". If not
+        set, request bodies are sent as is. Ignored if **http_client** is set.
+    :type compression: str | unicode
+    :param compression_threshold: Min size of a request body in bytes for it
+        to be compressed. Ignored if **http_client** is set.
+    :type compression_threshold: int
+    :param hosts: Base URLs of multiple ArangoDB hosts (e.g. cluster
+        coordinators such as "http://10.0.0.1:8529"). If set, parameters
+        **protocol**, **host** and **port** are ignored and each request is
+        sent to one of the hosts picked by **host_resolver**.
+    :type hosts: [str | unicode]
+    :param host_resolver: Strategy for picking the host of each request:
+        "roundrobin" (default), "random" or "least_outstanding" (fewest
+        requests in flight), or a custom instance of
+        :class:`arango.resolver.HostResolver`.
+    :type host_resolver: str | unicode | arango.resolver.HostResolver
+    :param host_recheck_interval: Number of seconds a host is kept out of
+        rotation after a connection error before it is re-probed.
+    :type host_recheck_interval: int | float
+    :param serializer: Callable which serializes request payloads into JSON
+        strings or bytes (default: :func:`json.dumps`), such as
+        ``orjson.dumps`` or ``ujson.dumps``.
+    :type serializer: callable
+    :param deserializer: Callable which deserializes JSON response bodies
+        (default: :func:`json.loads`), such as ``orjson.loads`` or
+        ``ujson.loads``. If **http_client** is set, it is only used for batch
+        responses and the HTTP client must apply it to the others itself.
+    :type deserializer: callable
+    :param velocypack: If set to True, document and cursor API payloads are
+        exchanged in VelocyPack instead of JSON using the pure Python codec in
+        :mod:`arango.velocypack`. An object with compatible ``dumps`` and
+        ``loads`` functions (e.g. an accelerated backend) may be given instead.
+        The HTTP client must return raw response bodies in bytes for VelocyPack
+        responses, as :class:`arango.http.DefaultHTTPClient` does.
+    :type velocypack: bool | module | object
     """
 
     def __init__(self,
                  protocol='http',
                  host='127.0.0.1',
                  port=8529,
-                 http_client=None):
+                 http_client=None,
+                 pool_connections=10,
+                 pool_maxsize=10,
+                 pool_block=False,
+                 keep_alive=True,
+                 keep_raw_body=True,
+                 compression=None,
+                 compression_threshold=1024,
+                 hosts=None,
+                 host_resolver='roundrobin',
+                 host_recheck_interval=30,
+                 serializer=json.dumps,
+                 deserializer=json.loads,
+                 velocypack=False):
         self._protocol = protocol.strip('/')
         self._host = host.strip('/')
         self._port = int(port)
-        self._url = '{}://{}:{}'.format(protocol, host, port)
-        self._http_client = http_client
+        if hosts:
+            self._hosts = [url.rstrip('/') for url in hosts]
+        else:
+            self._hosts = ['{}://{}:{}'.format(protocol, host, port)]
+        self._url = self._hosts[0]
+
+        self._host_resolver = get_host_resolver(
+            host_resolver, len(self._hosts), host_recheck_interval)
+
+        self._http_client = http_client or DefaultHTTPClient(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+            keep_alive=keep_alive,
+            keep_raw_body=keep_raw_body,
+            deserializer=deserializer,
+            compression=compression,
+            compression_threshold=compression_threshold
+        )
+        self._serializer = serializer
+        self._deserializer = deserializer
+        if velocypack is True:
+            velocypack = vpack
+        self._velocypack = velocypack or None
 
     def __repr__(self):
-        return '<ArangoClient {}>'.format(self._url)
+        return '<ArangoClient {}>'.format(','.join(self._hosts))
 
     @property
     def version(self):
@@ -73,14 +169,46 @@ class ArangoClient(object):
 
     @property
     def base_url(self):
-        """Return the ArangoDB base URL.
+        """Return the ArangoDB base URL (of the first host if there are many).
 
         :return: ArangoDB base URL.
         :rtype: str | unicode
         """
         return self._url
 
-    def db(self, name='_system', username='root', password='', verify=False):
+    @property
+    def hosts(self):
+        """Return the base URLs of all ArangoDB hosts.
+
+        :return: ArangoDB base URLs.
+        :rtype: [str | unicode]
+        """
+        return self._hosts
+
+    @property
+    def host_resolver(self):
+        """Return the host resolver.
+
+        :return: Host resolver.
+        :rtype: arango.resolver.HostResolver
+        """
+        return self._host_resolver
+
+    @property
+    def http_client(self):
+        """Return the HTTP client used to send API requests.
+
+        :return: HTTP client.
+        :rtype: arango.http.HTTPClient
+        """
+        return self._http_client
+
+    def db(self,
+           name='_system',
+           username='root',
+           password='',
+           verify=False,
+           result_cache=None):
         """Connect to a database and return the database API wrapper.
 
         :param name: Database name.
@@ -91,19 +219,26 @@ class ArangoClient(object):
         :type password: str | unicode
         :param verify: Verify the connection by sending a test request.
         :type verify: bool
+        :param result_cache: Client-side cache of AQL query results (see
+            :class:`arango.cache.QueryResultCache`).
+        :type result_cache: arango.cache.QueryResultCache
         :return: Standard database API wrapper.
         :rtype: arango.database.StandardDatabase
         :raise arango.exceptions.ServerConnectionError: If **verify** was set
             to True and the connection to ArangoDB fails.
         """
         connection = Connection(
-            url=self._url,
+            url=self._hosts,
             db=name,
             username=username,
             password=password,
-            http_client=self._http_client
+            http_client=self._http_client,
+            host_resolver=self._host_resolver,
+            serializer=self._serializer,
+            deserializer=self._deserializer,
+            velocypack=self._velocypack
         )
-        database = StandardDatabase(connection)
+        database = StandardDatabase(connection, result_cache)
 
         if verify:  # Check the server connection by making a read API call
             try:
@@ -0,0 +1,175 @@
+from __future__ import absolute_import, unicode_literals
+
+__all__ = ['WriteCoalescer']
+
+from copy import deepcopy
+from threading import Event, Lock
+
+
+class WriteCoalescer(object):
+    """Coalesces single-document writes from concurrent callers into
+    multi-document requests.
+
+    Attach the coalescer to collection API wrappers (see
+    :func:`arango.database.StandardDatabase.collection`) shared by many
+    threads. Calls to :func:`arango.collection.StandardCollection.insert`,
+    :func:`arango.collection.StandardCollection.update` and
+    :func:`arango.collection.StandardCollection.delete` with the same options
+    are then buffered per collection for up to **max_delay** seconds or
+    **max_size** documents, and sent as a single ``insert_many``,
+    ``update_many`` or ``delete_many`` request. Each call still blocks until
+    its own document is written, and returns its own result or raises its own
+    error, so callers need not change.
+
+    Coalescing trades latency for throughput: a caller which writes alone
+    waits up to **max_delay** seconds longer. It applies only in the default
+    API execution context.
+
+    :param max_delay: Max number of seconds a write is buffered.
+    :type max_delay: int | float
+    :param max_size: Max number of documents per request. A buffer is flushed
+        right away once it is full.
+    :type max_size: int
+    """
+
+    def __init__(self, max_delay=0.005, max_size=100):
+        self._max_delay = max_delay
+        self._max_size = max_size
+        self._lock = Lock()
+        self._buffers = {}
+        self._stats = {'writes': 0, 'requests': 0}
+
+    def __repr__(self):
+        return '<WriteCoalescer {}s/{}>'.format(
+            self._max_delay, self._max_size)
+
+    @property
+    def max_delay(self):
+        """Return the max number of seconds a write is buffered.
+
+        :return: Max delay in seconds.
+        :rtype: int | float
+        """
+        return self._max_delay
+
+    @property
+    def max_size(self):
+        """Return the max number of documents per request.
+
+        :return: Max number of documents.
+        :rtype: int
+        """
+        return self._max_size
+
+    def statistics(self):
+        """Return the coalescer statistics.
+
+        :return: Number of single-document writes submitted ("writes") and
+            multi-document requests sent ("requests").
+        :rtype: dict
+        """
+        with self._lock:
+            return dict(self._stats)
+
+    def submit(self, collection, operation, document, options):
+        """Buffer a single-document write and wait for its result.
+
+        The first caller to write into an empty buffer waits for the buffer to
+        fill up or for **max_delay** seconds to pass, then sends the request
+        on behalf of every caller in the buffer.
+
+        :param collection: Collection API wrapper.
+        :type collection: arango.collection.StandardCollection
+        :param operation: Write operation ("insert", "update" or "delete").
+        :type operation: str | unicode
+        :param document: Document (body) to write.
+        :type document: dict
+        :param options: Keyword arguments of the multi-document method (e.g.
+            "sync"). Only writes with the same options are coalesced.
+        :type options: dict
+        :return: Result of the write for the document.
+        :rtype: dict
+        :raise arango.exceptions.ArangoError: If the write fails.
+        """
+        key = (
+            id(collection._conn),
+            collection.name,
+            operation,
+            tuple(sorted(options.items()))
+        )
+        # Hold a copy, so that changes made to the document by other threads
+        # while the write is buffered are not sent.
+        pending = _PendingWrite(deepcopy(document))
+
+        with self._lock:
+            self._stats['writes'] += 1
+            buffer = self._buffers.get(key)
+            leader = buffer is None
+            if leader:
+                buffer = _WriteBuffer(collection, operation, options)
+                self._buffers[key] = buffer
+            buffer.writes.append(pending)
+            if len(buffer.writes) >= self._max_size:
+                del self._buffers[key]
+                buffer.full.set()
+
+        if leader:
+            buffer.full.wait(self._max_delay)
+            with self._lock:
+                if self._buffers.get(key) is buffer:
+                    del self._buffers[key]
+                self._stats['requests'] += 1
+            self._flush(buffer)
+
+        pending.done.wait()
+        if pending.error is not None:
+            raise pending.error
+        return pending.result
+
+    # noinspection PyMethodMayBeStatic
+    def _flush(self, buffer):
+        """Send the buffered writes and hand the results over to callers.
+
+        :param buffer: Write buffer.
+        :type buffer: arango.coalescer._WriteBuffer
+        """
+        method = getattr(buffer.collection, buffer.operation + '_many')
+        try:
+            results = method(
+                [pending.document for pending in buffer.writes],
+                **buffer.options
+            )
+        except Exception as err:
+            results = [err] * len(buffer.writes)
+
+        for pending, result in zip(buffer.writes, results):
+            if isinstance(result, Exception):
+                pending.error = result
+            else:
+                pending.result = result
+            pending.done.set()
+
+
+class _WriteBuffer(object):
+    """Single-document writes waiting to be sent in one request."""
+
+    __slots__ = ['collection', 'operation', 'options', 'writes', 'full']
+
+    def __init__(self, collection, operation, options):
+        self.collection = collection
+        self.operation = operation
+        self.options = options
+        self.writes = []
+        self.full = Event()
+
+
+class _PendingWrite(object):
+    """Single-document write waiting for its result."""
+
+    __slots__ = ['document', 'result', 'error', 'done']
+
+    def __init__(self, document):
+        self.document = document
+        self.result = None
+        self.error = None
+        self.done = Event()
@@ -2,9 +2,16 @@ from __future__ import absolute_import, unicode_literals
 
 __all__ = ['StandardCollection', 'VertexCollection', 'EdgeCollection']
 
+import csv
+import gzip
+import io
 from numbers import Number
+from threading import Event, Lock, Thread
 
 from json import dumps
+import six
+from six import string_types
+from six.moves import queue
 
 from arango.api import APIWrapper
 from arango.cursor import Cursor
@@ -40,6 +47,7 @@ from arango.request import Request
 from arango.response import Response
 from arango.utils import (
     get_doc_id,
+    map_concurrently,
     is_none_or_int,
     is_none_or_str,
 )
@@ -614,7 +622,7 @@ class Collection(APIWrapper):
         def response_handler(resp):
             if not resp.is_success:
                 raise DocumentIDsError(resp, request)
-            return Cursor(self._conn, resp.body)
+            return Cursor(self._conn, resp.body, host_index=resp.host_index)
 
         return self._execute(request, response_handler)
 
@@ -636,7 +644,7 @@ class Collection(APIWrapper):
         def response_handler(resp):
             if not resp.is_success:
                 raise DocumentKeysError(resp, request)
-            return Cursor(self._conn, resp.body)
+            return Cursor(self._conn, resp.body, host_index=resp.host_index)
 
         return self._execute(request, response_handler)
 
@@ -680,7 +688,7 @@ class Collection(APIWrapper):
                 return Cursor(self._conn, [])
             if not resp.is_success:
                 raise DocumentGetError(resp, request)
-            return Cursor(self._conn, resp.body)
+            return Cursor(self._conn, resp.body, host_index=resp.host_index)
 
         return self._execute(request, response_handler)
 
@@ -692,7 +700,8 @@ class Collection(APIWrapper):
                flush_wait=None,
                ttl=None,
                filter_fields=None,
-               filter_type='include'):  # pragma: no cover
+               filter_type='include',
+               prefetch=0):  # pragma: no cover
         """Export all documents in the collection using a server cursor.
 
         :param flush: If set to True, flush the write-ahead log prior to the
@@ -714,6 +723,10 @@ class Collection(APIWrapper):
         :type filter_fields: [str | unicode]
         :param filter_type: Allowed values are "include" or "exclude".
         :type filter_type: str | unicode
+        :param prefetch: Max number of batches the cursor fetches ahead in a
+            background thread while the current batch is consumed. Value 0
+            (default) disables prefetching.
+        :type prefetch: int
         :return: Document cursor.
         :rtype: arango.cursor.Cursor
         :raise arango.exceptions.DocumentGetError: If export fails.
@@ -742,10 +755,87 @@ class Collection(APIWrapper):
         def response_handler(resp):
             if not resp.is_success:
                 raise DocumentGetError(resp, request)
-            return Cursor(self._conn, resp.body, 'export')
+            return Cursor(
+                self._conn,
+                resp.body,
+                'export',
+                resp.host_index,
+                prefetch
+            )
 
         return self._execute(request, response_handler)
 
+    def export_to(self,
+                  path,
+                  file_format='jsonl',
+                  batch_size=None,
+                  fields=None,
+                  compress=False,
+                  prefetch=1,
+                  flush=False,
+                  ttl=None):  # pragma: no cover
+        """Export all documents in the collection into a local file.
+
+        Documents are fetched with :func:`arango.collection.Collection.export`
+        and each batch is written to disk as soon as it arrives, while the
+        next one is prefetched. Memory usage is bounded by the batch size.
+        This method works only in the default API execution context.
+
+        :param path: Path of the output file.
+        :type path: str | unicode
+        :param file_format: Output format: "jsonl" (one JSON document per
+            line), "csv" (one row per document; nested values are written as
+            JSON) or "columns" (one JSON object per batch, mapping field names
+            to lists of values, which columnar tools such as Parquet writers
+            can load directly).
+        :type file_format: str | unicode
+        :param batch_size: Max number of documents fetched in one round trip.
+        :type batch_size: int
+        :param fields: Document fields to export. For format "csv", these are
+            the columns; if not set, the fields of the first non-empty batch
+            are used and fields missing from it are left out.
+        :type fields: [str | unicode]
+        :param compress: Compress the output file with gzip.
+        :type compress: bool
+        :param prefetch: Max number of batches fetched ahead in a background
+            thread while the current one is written.
+        :type prefetch: int
+        :param flush: If set to True, flush the write-ahead log prior to the
+            export.
+        :type flush: bool
+        :param ttl: Time-to-live for the cursor on the server.
+        :type ttl: int
+        :return: Number of documents exported.
+        :rtype: int
+        :raise ValueError: If **file_format** is invalid.
+        :raise arango.exceptions.DocumentGetError: If export fails.
+        :raise arango.exceptions.CursorNextError: If batch retrieval fails.
+        """
+        if file_format not in ('jsonl', 'csv', 'columns'):
+            raise ValueError('invalid export format: {}'.format(file_format))
+
+        cursor = self.export(
+            batch_size=batch_size,
+            flush=flush,
+            ttl=ttl,
+            filter_fields=fields,
+            prefetch=prefetch
+        )
+        serializer = self._conn.serializer
+        opener = gzip.open if compress else io.open
+        count = 0
+
+        with cursor, opener(path, 'wb') as export_file:
+            columnar = 'list' if file_format == 'columns' else None
+            for batch in cursor.iter_batches(columnar):
+                lines, batch_count, fields = _export_lines(
+                    batch, file_format, fields, serializer, header=count == 0
+                )
+                if lines:
+                    export_file.write(b'\n'.join(lines) + b'\n')
+                count += batch_count
+        return count
+
     def find(self, filters, skip=None, limit=None):
         """Return all documents that match the given filters.
 
@@ -789,7 +879,7 @@ class Collection(APIWrapper):
         def response_handler(resp):
             if not resp.is_success:
                 raise DocumentGetError(resp, request)
-            return Cursor(self._conn, resp.body)
+            return Cursor(self._conn, resp.body, host_index=resp.host_index)
 
         return self._execute(request, response_handler)
 
@@ -853,7 +943,7 @@ class Collection(APIWrapper):
         def response_handler(resp):
             if not resp.is_success:
                 raise DocumentGetError(resp, request)
-            return Cursor(self._conn, resp.body)
+            return Cursor(self._conn, resp.body, host_index=resp.host_index)
 
         return self._execute(request, response_handler)
 
@@ -927,7 +1017,7 @@ class Collection(APIWrapper):
                 return Cursor(self._conn, [])
             if not resp.is_success:
                 raise DocumentGetError(resp, request)
-            return Cursor(self._conn, resp.body)
+            return Cursor(self._conn, resp.body, host_index=resp.host_index)
 
         return self._execute(request, response_handler)
 
@@ -990,7 +1080,7 @@ class Collection(APIWrapper):
         def response_handler(resp):
             if not resp.is_success:
                 raise DocumentGetError(resp, request)
-            return Cursor(self._conn, resp.body)
+            return Cursor(self._conn, resp.body, host_index=resp.host_index)
 
         return self._execute(request, response_handler)
 
@@ -1065,7 +1155,7 @@ class Collection(APIWrapper):
         def response_handler(resp):
             if not resp.is_success:
                 raise DocumentGetError(resp, request)
-            return Cursor(self._conn, resp.body)
+            return Cursor(self._conn, resp.body, host_index=resp.host_index)
 
         return self._execute(request, response_handler)
 
@@ -1118,18 +1208,38 @@ class Collection(APIWrapper):
                 return Cursor(self._conn, [])
             if not resp.is_success:
                 raise DocumentGetError(resp, request)
-            return Cursor(self._conn, resp.body)
+            return Cursor(self._conn, resp.body, host_index=resp.host_index)
 
         return self._execute(request, response_handler)
 
-    def get_many(self, documents):
+    def get_many(self,
+                 documents,
+                 chunk_size=None,
+                 workers=1,
+                 keep_order=False,
+                 as_dict=False):
         """Return multiple documents ignoring any missing ones.
 
         :param documents: List of document keys, IDs or bodies. Document bodies
             must contain the "_id" or "_key" fields.
         :type documents: [str | unicode | dict]
-        :return: Documents. Missing ones are not included.
-        :rtype: [dict]
+        :param chunk_size: Max number of documents looked up per request. If
+            set, the documents are fetched in chunks, which keeps request and
+            response bodies small. Applies only to the default API execution
+            context.
+        :type chunk_size: int
+        :param workers: Number of chunks fetched concurrently. Set this to at
+            most the connection pool size of the HTTP client.
+        :type workers: int
+        :param keep_order: If set to True, the returned list is aligned with
+            **documents**, with None in place of missing documents.
+        :type keep_order: bool
+        :param as_dict: If set to True, a dict mapping each requested document
+            key to the document (or None if missing) is returned instead.
+        :type as_dict: bool
+        :return: Documents. Missing ones are not included, unless
+            **keep_order** or **as_dict** is set to True.
+        :rtype: [dict | None] | dict
         :raise arango.exceptions.DocumentGetError: If retrieval fails.
         """
         handles = [
@@ -1137,29 +1247,55 @@ class Collection(APIWrapper):
             for doc in documents
         ]
 
-        command = 'db.{}.document({})'.format(
-            self.name,
-            dumps(handles)
-        ) if self._is_transaction else None
+        def collect(docs):
+            docs = [doc for doc in docs if '_id' in doc]
+            if not (keep_order or as_dict):
+                return docs
+            found = {doc['_key']: doc for doc in docs}
+            keys = [handle.split('/', 1)[-1] for handle in handles]
+            if as_dict:
+                return {key: found.get(key) for key in keys}
+            return [found.get(key) for key in keys]
+
+        def lookup(chunk, response_handler):
+            command = 'db.{}.document({})'.format(
+                self.name,
+                dumps(chunk)
+            ) if self._is_transaction else None
+
+            request = Request(
+                method='put',
+                endpoint='/_api/simple/lookup-by-keys',
+                data={'collection': self.name, 'keys': chunk},
+                command=command,
+                read=self.name
+            )
 
-        request = Request(
-            method='put',
-            endpoint='/_api/simple/lookup-by-keys',
-            data={'collection': self.name, 'keys': handles},
-            command=command,
-            read=self.name
-        )
+            def lookup_response_handler(resp):
+                if not resp.is_success:
+                    raise DocumentGetError(resp, request)
+                if self._is_transaction:
+                    docs = resp.body
+                else:
+                    docs = resp.body['documents']
+                return response_handler(docs)
 
-        def response_handler(resp):
-            if not resp.is_success:
-                raise DocumentGetError(resp, request)
-            if self._is_transaction:
-                docs = resp.body
-            else:
-                docs = resp.body['documents']
-            return [doc for doc in docs if '_id' in doc]
+            return self._execute(request, lookup_response_handler)
 
-        return self._execute(request, response_handler)
+        if (chunk_size is None or len(handles) <= chunk_size or
+                self.context != 'default'):
+            return lookup(handles, collect)
+
+        chunks = [
+            handles[index:index + chunk_size]
+            for index in range(0, len(handles), chunk_size)
+        ]
+        results = map_concurrently(
+            lambda chunk: lookup(chunk, list),
+            chunks,
+            workers
+        )
+        return collect(doc for docs in results for doc in docs)
 
     def random(self):
         """Return a random document from the collection.
@@ -1442,10 +1578,22 @@ class StandardCollection(Collection):
     :type executor: arango.executor.Executor
     :param name: Collection name.
     :type name: str | unicode
+    :param cache: Document cache used by
+        :func:`arango.collection.StandardCollection.get` in the default API
+        execution context.
+    :type cache: arango.cache.DocumentCache
+    :param coalescer: Write coalescer used by
+        :func:`arango.collection.StandardCollection.insert`,
+        :func:`arango.collection.StandardCollection.update` and
+        :func:`arango.collection.StandardCollection.delete` in the default API
+        execution context.
+    :type coalescer: arango.coalescer.WriteCoalescer
     """
 
-    def __init__(self, connection, executor, name):
+    def __init__(self, connection, executor, name, cache=None, coalescer=None):
         super(StandardCollection, self).__init__(connection, executor, name)
+        self._cache = cache
+        self._coalescer = coalescer
 
     def __repr__(self):
         return '<StandardCollection {}>'.format(self.name)
@@ -1453,6 +1601,142 @@ class StandardCollection(Collection):
     def __getitem__(self, key):
         return self.get(key)
 
+    @property
+    def cache(self):
+        """Return the document cache.
+
+        :return: Document cache, or None if caching is not enabled.
+        :rtype: arango.cache.DocumentCache | None
+        """
+        return self._cache
+
+    @property
+    def coalescer(self):
+        """Return the write coalescer.
+
+        :return: Write coalescer, or None if coalescing is not enabled.
+        :rtype: arango.coalescer.WriteCoalescer | None
+        """
+        return self._coalescer
+
+    def _coalesces(self):
+        """Check if single-document writes should go through the coalescer.
+
+        :return: True if writes should be coalesced.
+        :rtype: bool
+        """
+        return self._coalescer is not None and self.context == 'default'
+
+    def _execute(self, request, response_handler):
+        """Execute an API per execution context, invalidating cached
+        documents modified by the request.
+
+        :param request: HTTP request.
+        :type request: arango.request.Request
+        :param response_handler: HTTP response handler.
+        :type response_handler: callable
+        :return: API execution result.
+        :rtype: str | unicode | bool | int | list | dict
+        """
+        if self._cache is None or not (
+            request.write or request.endpoint == '/_api/import'
+        ):
+            return self._executor.execute(request, response_handler)
+
+        doc_ids = self._written_doc_ids(request)
+        if doc_ids is not None and len(doc_ids) == 0:
+            return self._executor.execute(request, response_handler)
+
+        def invalidate():
+            if doc_ids is None:
+                self._cache.clear()
+            else:
+                for doc_id in doc_ids:
+                    self._cache.invalidate(doc_id)
+
+        def invalidating_response_handler(resp):
+            # Invalidate again in case the document was read and cached
+            # while the write was in flight.
+            invalidate()
+            return response_handler(resp)
+
+        invalidate()
+        return self._executor.execute(request, invalidating_response_handler)
+
+    def _written_doc_ids(self, request):
+        """Return the IDs of the existing documents a write request modifies.
+
+        :param request: HTTP request.
+        :type request: arango.request.Request
+        :return: Document IDs, or None if they are not known (e.g. for
+            multi-document updates, imports or truncation).
+        :rtype: [str | unicode] | None
+        """
+        endpoint = '/_api/document/' + self.name
+        if request.endpoint.startswith(endpoint + '/'):
+            return [request.endpoint[len('/_api/document/'):]]
+        if request.endpoint != endpoint or request.method != 'post':
+            return None
+
+        # Inserts modify existing documents only if they overwrite them, and
+        # documents without keys are always new.
+        if not (request.params or {}).get('overwrite'):
+            return []
+        payload = request._payload
+        if isinstance(payload, dict):
+            payload = [payload]
+        if not isinstance(payload, list):
+            return None
+        try:
+            return [
+                self._extract_id(doc) for doc in payload
+                if isinstance(doc, dict) and ('_id' in doc or '_key' in doc)
+            ]
+        except DocumentParseError:
+            return None
+
+    def _get_cached(self, doc_id):
+        """Return a document using the document cache.
+
+        :param doc_id: Document ID.
+        :type doc_id: str | unicode
+        :return: Document, or None if not found.
+        :rtype: dict | None
+        :raise arango.exceptions.DocumentGetError: If retrieval fails.
+        """
+        entry = self._cache.get(doc_id)
+        # The cache keeps raw JSON bodies, so VelocyPack must not be used.
+        headers = {'accept': 'application/json'}
+        if entry is not None:
+            rev, data, fresh = entry
+            if fresh:
+                self._cache.record('hits')
+                return self._conn.deserializer(data)
+            headers['If-None-Match'] = rev
+
+        request = Request(
+            method='get',
+            endpoint='/_api/document/{}'.format(doc_id),
+            headers=headers,
+            read=self.name
+        )
+
+        def response_handler(resp):
+            if resp.status_code == 304:
+                self._cache.record('revalidations')
+                self._cache.put(doc_id, rev, data)
+                return self._conn.deserializer(data)
+            self._cache.record('misses')
+            if resp.error_code == 1202:
+                self._cache.invalidate(doc_id)
+                return None
+            if not resp.is_success:
+                raise DocumentGetError(resp, request)
+            self._cache.put(doc_id, resp.body['_rev'], resp.raw_body)
+            return resp.body
+
+        return self._executor.execute(request, response_handler)
+
     def get(self, document, rev=None, check_rev=True):
         """Return a document.
 
@@ -1472,6 +1756,10 @@ class StandardCollection(Collection):
         """
         handle, body, headers = self._prep_from_doc(document, rev, check_rev)
 
+        if (self._cache is not None and not headers and
+                self.context == 'default'):
+            return self._get_cached(handle)
+
         command = 'db.{}.exists({}) || undefined'.format(
             self.name,
             dumps(body)
@@ -1530,6 +1818,15 @@ class StandardCollection(Collection):
         """
         document = self._ensure_key_from_id(document)
 
+        if self._coalesces():
+            result = self._coalescer.submit(self, 'insert', document, {
+                'return_new': return_new,
+                'sync': sync,
+                'overwrite': overwrite,
+                'return_old': return_old
+            })
+            return True if silent else result
+
         params = {
             'returnNew': return_new,
             'silent': silent,
@@ -1691,6 +1988,18 @@ class StandardCollection(Collection):
         :raise arango.exceptions.DocumentUpdateError: If update fails.
         :raise arango.exceptions.DocumentRevisionError: If revisions mismatch.
         """
+        if self._coalesces():
+            result = self._coalescer.submit(
+                self, 'update', self._ensure_key_in_body(document), {
+                    'check_rev': check_rev,
+                    'merge': merge,
+                    'keep_none': keep_none,
+                    'return_new': return_new,
+                    'return_old': return_old,
+                    'sync': sync
+                })
+            return True if silent else result
+
         params = {
             'keepNull': keep_none,
             'mergeObjects': merge,
@@ -2142,6 +2451,22 @@ class StandardCollection(Collection):
         """
         handle, body, headers = self._prep_from_doc(document, rev, check_rev)
 
+        if self._coalesces():
+            body = {'_key': handle[len(self._id_prefix):]}
+            if 'If-Match' in headers:
+                body['_rev'] = headers['If-Match']
+            try:
+                result = self._coalescer.submit(self, 'delete', body, {
+                    'return_old': return_old,
+                    'check_rev': check_rev,
+                    'sync': sync
+                })
+            except DocumentDeleteError as err:
+                if err.error_code == 1202 and ignore_missing:
+                    return False
+                raise
+            return True if silent else result
+
         params = {
             'returnOld': return_old,
             'ignoreRevs': not check_rev,
@@ -2393,6 +2718,406 @@ class StandardCollection(Collection):
 
         return self._execute(request, response_handler)
 
+    def import_jsonl(self,
+                     source,
+                     halt_on_error=True,
+                     details=True,
+                     from_prefix=None,
+                     to_prefix=None,
+                     overwrite=None,
+                     on_duplicate=None,
+                     sync=None,
+                     chunk_size=65536):
+        """Insert documents streamed as newline-delimited JSON (JSON Lines).
+
+        Unlike :func:`arango.collection.StandardCollection.import_bulk`, the
+        documents are never collected into a list: the request body is
+        streamed to the server as it is read or generated, so importing a
+        dump of any size uses constant memory.
+
+        The request is not retried on other hosts if the connection fails,
+        as the source cannot be rewound. In batch execution context, the
+        source is read into memory when the request is queued. Streamed
+        imports are not supported in transactions or with asyncio.
+
+        :param source: Path of a JSON Lines file, a file object opened in
+            binary mode, or an iterable of documents (dicts) and/or serialized
+            lines (str or bytes).
+        :type source: str | unicode | file | collections.Iterable
+        :param halt_on_error: Halt the entire import on an error.
+        :type halt_on_error: bool
+        :param details: If set to True, the returned result will include an
+            additional list of detailed error messages.
+        :type details: bool
+        :param from_prefix: String prefix prepended to the value of "_from"
+            field in each edge document inserted. Applies only to edge
+            collections.
+        :type from_prefix: str | unicode
+        :param to_prefix: String prefix prepended to the value of "_to" field
+            in edge document inserted. Applies only to edge collections.
+        :type to_prefix: str | unicode
+        :param overwrite: If set to True, all existing documents are removed
+            prior to the import. Indexes are still preserved.
+        :type overwrite: bool
+        :param on_duplicate: Action to take on unique key constraint violations
+            (see :func:`arango.collection.StandardCollection.import_bulk`).
+        :type on_duplicate: str | unicode
+        :param sync: Block until operation is synchronized to disk.
+        :type sync: bool
+        :param chunk_size: Size in bytes of the pieces the request body is
+            sent in when **source** is an iterable.
+        :type chunk_size: int
+        :return: Result of the bulk import.
+        :rtype: dict
+        :raise arango.exceptions.DocumentInsertError: If import fails.
+        """
+        params = {
+            'type': 'documents',
+            'collection': self.name,
+            'complete': halt_on_error,
+            'details': details,
+        }
+        if from_prefix is not None:  # pragma: no cover
+            params['fromPrefix'] = from_prefix
+        if to_prefix is not None:  # pragma: no cover
+            params['toPrefix'] = to_prefix
+        if overwrite is not None:
+            params['overwrite'] = overwrite
+        if on_duplicate is not None:
+            params['onDuplicate'] = on_duplicate
+        if sync is not None:
+            params['waitForSync'] = sync
+
+        def send(data):
+            request = Request(
+                method='post',
+                endpoint='/_api/import',
+                data=data,
+                params=params
+            )
+
+            def response_handler(resp):
+                if not resp.is_success:
+                    raise DocumentInsertError(resp, request)
+                return resp.body
+
+            return self._execute(request, response_handler)
+
+        if isinstance(source, string_types):
+            with open(source, 'rb') as source_file:
+                return send(source_file)
+        if hasattr(source, 'read'):
+            return send(source)
+        return send(_stream_lines(
+            source, self._conn.serializer, chunk_size
+        ))
+
+    def bulk_load(self,
+                  documents,
+                  chunk_size=1000,
+                  max_bytes=None,
+                  workers=1,
+                  halt_on_error=True,
+                  details=True,
+                  on_duplicate=None,
+                  sync=None,
+                  progress=None):
+        """Insert documents from any iterable in chunks, optionally sending
+        several chunks concurrently.
+
+        Documents are consumed lazily (e.g. from a generator) and serialized
+        one at a time, so the full input is never held in memory: at most
+        about twice **workers** chunks are buffered at once. Each chunk is
+        imported with a separate bulk import request (see
+        :func:`arango.collection.StandardCollection.import_bulk`), and the
+        per-chunk results are merged.
+
+        Chunks are always sent right away over the connection (which must not
+        be an asyncio one), regardless of the API execution context. Chunks
+        imported before an error are not rolled back.
+
+        :param documents: New documents to insert. If they contain the "_key"
+            or "_id" fields, the values are used as the keys of the new
+            documents (auto-generated otherwise). Any "_rev" field is ignored.
+        :type documents: collections.Iterable[dict]
+        :param chunk_size: Max number of documents per chunk.
+        :type chunk_size: int
+        :param max_bytes: Max size of the serialized chunk in bytes. A chunk
+            always holds at least one document.
+        :type max_bytes: int
+        :param workers: Number of chunks sent concurrently. Set this to at most
+            the connection pool size of the HTTP client.
+        :type workers: int
+        :param halt_on_error: Halt the import of a chunk on an error, and stop
+            sending further chunks.
+        :type halt_on_error: bool
+        :param details: If set to True, the returned result will include an
+            additional list of detailed error messages.
+        :type details: bool
+        :param on_duplicate: Action to take on unique key constraint violations
+            (see :func:`arango.collection.StandardCollection.import_bulk`).
+        :type on_duplicate: str | unicode
+        :param sync: Block until operation is synchronized to disk.
+        :type sync: bool
+        :param progress: Callable invoked after each imported chunk with the
+            merged result so far. Calls are never concurrent. If it raises an
+            exception, no further chunks are sent and the exception is
+            re-raised.
+        :type progress: callable
+        :return: Merged result of the bulk imports, which also includes the
+            number of chunks sent ("chunks").
+        :rtype: dict
+        :raise arango.exceptions.DocumentInsertError: If import fails.
+        """
+        params = {
+            'type': 'array',
+            'collection': self.name,
+            'complete': halt_on_error,
+            'details': details,
+        }
+        if on_duplicate is not None:
+            params['onDuplicate'] = on_duplicate
+        if sync is not None:
+            params['waitForSync'] = sync
+
+        result = {
+            'created': 0,
+            'errors': 0,
+            'empty': 0,
+            'updated': 0,
+            'ignored': 0,
+            'chunks': 0,
+        }
+        if details:
+            result['details'] = []
+        failures = []
+        lock = Lock()
+        stop = Event()
+        chunks = queue.Queue(workers)
+
+        def import_chunks():
+            while True:
+                data = chunks.get()
+                if data is None:
+                    return
+                if stop.is_set():
+                    continue
+                request = Request(
+                    method='post',
+                    endpoint='/_api/import',
+                    data=data,
+                    params=params.copy()
+                )
+                try:
+                    resp = self._conn.send_request(request)
+                    if not resp.is_success:
+                        raise DocumentInsertError(resp, request)
+                    with lock:
+                        for key, value in resp.body.items():
+                            if key == 'details':
+                                result['details'].extend(value)
+                            elif key in result:
+                                result[key] += value
+                        result['chunks'] += 1
+                        if progress is not None:
+                            progress(result.copy())
+                except Exception as err:
+                    with lock:
+                        failures.append(err)
+                    stop.set()
+
+        def put(item):
+            # Give up once every worker is gone, so that a full queue never
+            # blocks the caller forever.
+            while any(thread.is_alive() for thread in threads):
+                try:
+                    chunks.put(item, timeout=0.1)
+                    return
+                except queue.Full:
+                    pass
+
+        if self._cache is not None:
+            self._cache.clear()
+
+        threads = [Thread(target=import_chunks) for _ in range(workers)]
+        for thread in threads:
+            thread.daemon = True
+            thread.start()
+        try:
+            documents = (self._ensure_key_from_id(doc) for doc in documents)
+            for data in _chunk_documents(
+                documents, self._conn.serializer, chunk_size, max_bytes
+            ):
+                if stop.is_set():
+                    break
+                put(data)
+        finally:
+            for _ in threads:
+                put(None)
+            for thread in threads:
+                thread.join()
+
+        if self._cache is not None:
+            self._cache.clear()
+        if failures:
+            raise failures[0]
+        return result
+
+
+def _export_lines(batch, file_format, fields, serializer, header=False):
+    """Format a batch of exported documents into lines of the output file.
+
+    :param batch: Batch of documents, or a mapping of field names to lists of
+        values for format "columns".
+    :type batch: [dict] | dict
+    :param file_format: Output format ("jsonl", "csv" or "columns").
+    :type file_format: str | unicode
+    :param fields: CSV columns. If None, the fields of the batch are used.
+    :type fields: [str | unicode] | None
+    :param serializer: JSON serializer (returns strings or bytes).
+    :type serializer: callable
+    :param header: Write the CSV header row first.
+    :type header: bool
+    :return: Lines (without line terminators), number of documents in the
+        batch, and the CSV columns (None until a non-empty batch is seen if
+        **fields** was None).
+    :rtype: ([bytes], int, [str | unicode] | None)
+    """
+    if file_format == 'columns':
+        count = len(next(iter(batch.values()), ()))
+        lines = [serializer(batch)] if count else []
+    elif file_format == 'jsonl':
+        count = len(batch)
+        lines = [serializer(doc) for doc in batch]
+    else:
+        count = len(batch)
+        if count == 0:
+            return [], 0, fields
+        if fields is None:
+            fields = []
+            for doc in batch:
+                fields.extend(f for f in doc if f not in fields)
+        lines = [
+            _csv_row([doc.get(field) for field in fields], serializer)
+            for doc in batch
+        ]
+        if header:
+            lines.insert(0, _csv_row(fields, serializer))
+    lines = [
+        line if isinstance(line, bytes) else line.encode('utf-8')
+        for line in lines
+    ]
+    return lines, count, fields
+
+
+def _csv_row(values, serializer):
+    """Serialize values into a CSV row.
+
+    :param values: Row values. Lists and dicts are serialized as JSON, None
+        is written as an empty cell.
+    :type values: list
+    :param serializer: JSON serializer (returns strings or bytes).
+    :type serializer: callable
+    :return: CSV row without line terminator.
+    :rtype: str | unicode
+    """
+    cells = []
+    for value in values:
+        if isinstance(value, (dict, list)):
+            value = serializer(value)
+            if isinstance(value, bytes):
+                value = value.decode('utf-8')
+        elif isinstance(value, bool):
+            value = 'true' if value else 'false'
+        elif value is None:
+            value = ''
+        cells.append(value)
+    row = io.StringIO() if six.PY3 else io.BytesIO()
+    csv.writer(row, lineterminator='\n').writerow(cells)
+    return row.getvalue()[:-1]
+
+
+def _stream_lines(items, serializer, chunk_size):
+    """Serialize documents and lines into JSON Lines, in pieces of bytes.
+
+    :param items: Documents (dicts) and/or serialized lines.
+    :type items: collections.Iterable
+    :param serializer: JSON serializer (returns strings or bytes).
+    :type serializer: callable
+    :param chunk_size: Min size of each piece in bytes (except the last).
+    :type chunk_size: int
+    :return: Generator of pieces.
+    :rtype: collections.Iterable[bytes]
+    """
+    buffer = []
+    size = 0
+    for item in items:
+        if isinstance(item, dict):
+            item = serializer(item)
+        if not isinstance(item, bytes):
+            item = item.encode('utf-8')
+        if not item.endswith(b'\n'):
+            item += b'\n'
+        buffer.append(item)
+        size += len(item)
+        if size >= chunk_size:
+            yield b''.join(buffer)
+            buffer = []
+            size = 0
+    if buffer:
+        yield b''.join(buffer)
+
+
+def _chunk_documents(documents, serializer, chunk_size, max_bytes):
+    """Serialize documents into JSON arrays of limited length and size.
+
+    :param documents: Documents.
+    :type documents: collections.Iterable[dict]
+    :param serializer: JSON serializer (returns strings or bytes).
+    :type serializer: callable
+    :param chunk_size: Max number of documents per array.
+    :type chunk_size: int
+    :param max_bytes: Max size of an array in bytes, or None for no limit.
+    :type max_bytes: int
+    :return: Generator of serialized JSON arrays, in the type returned by
+        the serializer.
+    :rtype: collections.Iterable[str | unicode | bytes]
+    """
+    parts = []
+    size = 2
+    for doc in documents:
+        part = serializer(doc)
+        if not max_bytes:
+            part_size = 0
+        elif isinstance(part, bytes):
+            part_size = len(part) + 1
+        else:
+            part_size = len(part.encode('utf-8')) + 1
+        if parts and (
+            len(parts) == chunk_size or
+            (max_bytes and size + part_size > max_bytes)
+        ):
+            yield _join_documents(parts)
+            parts = []
+            size = 2
+        parts.append(part)
+        size += part_size
+    if parts:
+        yield _join_documents(parts)
+
+
+def _join_documents(parts):
+    """Join serialized documents into a JSON array.
+
+    :param parts: Serialized documents (all strings or all bytes).
+    :type parts: [str | unicode | bytes]
+    :return: Serialized JSON array.
+    :rtype: str | unicode | bytes
+    """
+    if isinstance(parts[0], bytes):
+        return b'[' + b','.join(parts) + b']'
+    return '[' + ','.join(parts) + ']'
+
 
 class VertexCollection(Collection):
     """Vertex collection API wrapper.
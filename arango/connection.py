@@ -1,15 +1,131 @@
 from __future__ import absolute_import, unicode_literals
 
+import errno
+import json
+import socket
+from threading import Lock
+from weakref import WeakSet
+
+from requests.exceptions import ConnectionError as HTTPConnectionError
+from requests.exceptions import ConnectTimeout
+from six import string_types
+from urllib3.exceptions import ConnectTimeoutError, NewConnectionError
+
 from arango.http import DefaultHTTPClient
+from arango.request import Request
+from arango.resolver import RoundRobinHostResolver
+from arango.utils import is_aql_write
+from arango.velocypack import CONTENT_TYPE as VELOCYPACK_CONTENT_TYPE
+
+__all__ = ['Connection', 'TransactionConnection']
+
+# API endpoints which exchange payloads in VelocyPack if it is enabled.
+_VELOCYPACK_ENDPOINTS = ('/_api/document', '/_api/cursor')
+
+# HTTP methods which are safe to retry on another host after the request may
+# have reached the server.
+_IDEMPOTENT_METHODS = ('get', 'head', 'options')
+
+# API endpoints which are never sent write requests, except those flagged by
+# their write collections (e.g. remove by example).
+_READ_ONLY_ENDPOINTS = (
+    '/_api/cursor/',
+    '/_api/explain',
+    '/_api/export',
+    '/_api/job/',
+    '/_api/query',
+    '/_api/simple/',
+    '/_api/transaction/begin',
+)
+
+# Socket error codes which mean the connection was never established.
+_CONNECT_ERRNOS = (
+    errno.ECONNREFUSED,
+    errno.EHOSTUNREACH,
+    errno.ENETUNREACH,
+)
+
+
+def _is_connect_error(error):
+    """Check if a request failed before any of it was sent to the server.
+
+    Only such failures mean the host is down. Errors raised later (e.g. read
+    timeouts or connections reset while reading the response) may come after
+    the server applied the request.
+
+    :param error: Error raised by the HTTP client.
+    :type error: IOError
+    :return: True if the connection to the host could not be established.
+    :rtype: bool
+    """
+    if isinstance(error, ConnectTimeout):
+        return True
+    if isinstance(error, HTTPConnectionError):
+        reason = getattr(error.args[0], 'reason', None) if error.args else None
+        return isinstance(reason, (NewConnectionError, ConnectTimeoutError))
+    if isinstance(error, socket.gaierror):
+        return True
+    return getattr(error, 'errno', None) in _CONNECT_ERRNOS
 
-__all__ = ['Connection']
+
+def _can_fail_over(request, error):
+    """Check if a failed request may be retried on another host.
+
+    :param request: HTTP request.
+    :type request: arango.request.Request
+    :param error: Error raised by the HTTP client.
+    :type error: IOError
+    :return: True if the request may be retried.
+    :rtype: bool
+    """
+    if request.streamed:
+        return False
+    return _is_connect_error(error) or request.method in _IDEMPOTENT_METHODS
+
+
+def _is_write_request(request):
+    """Check if a request may modify data.
+
+    The check is conservative: requests which are not known to be read-only
+    (e.g. batch requests, or queries mentioning a data-modification keyword)
+    are considered writes.
+
+    :param request: HTTP request.
+    :type request: arango.request.Request
+    :return: True if the request may modify data.
+    :rtype: bool
+    """
+    if request.write:
+        return True
+    if request.method in _IDEMPOTENT_METHODS:
+        return False
+    if request.endpoint == '/_api/cursor':
+        payload = request._payload
+        if isinstance(payload, dict):
+            return is_aql_write(payload.get('query', ''))
+        if isinstance(payload, bytes):
+            payload = payload.decode('utf-8', 'replace')
+        return not isinstance(payload, string_types) or is_aql_write(payload)
+    return not request.endpoint.startswith(_READ_ONLY_ENDPOINTS)
 
 
 class Connection(object):
     """HTTP connection to specific ArangoDB database.
 
-    :param url: ArangoDB base URL.
-    :type url: str | unicode
+    Requests are spread across the hosts by the host resolver. If the
+    connection to a host cannot be established, the host is marked down and
+    the request is retried on the next host. Requests which fail after they
+    may have reached the server (e.g. read timeouts) are retried elsewhere
+    only if their HTTP method is idempotent, and do not mark the host down.
+    Requests pinned to a host (e.g. fetching the next batch of a cursor) are
+    never retried elsewhere.
+
+    Query result caches registered with the connection are cleared whenever
+    a write request is sent over it, in any API execution context.
+
+    :param url: ArangoDB base URL, or a list of base URLs (e.g. one per
+        cluster coordinator).
+    :type url: str | unicode | [str | unicode]
     :param db: Database name.
     :type db: str | unicode
     :param username: Username.
@@ -18,24 +134,69 @@ class Connection(object):
     :type password: str | unicode
     :param http_client: User-defined HTTP client.
     :type http_client: arango.http.HTTPClient
+    :param host_resolver: Host resolver. If not set, requests are sent to
+        the hosts in round-robin fashion.
+    :type host_resolver: arango.resolver.HostResolver
+    :param serializer: Callable which serializes request payloads into JSON
+        strings or bytes (default: :func:`json.dumps`).
+    :type serializer: callable
+    :param deserializer: Callable which deserializes JSON response bodies
+        (default: :func:`json.loads`). It is used for the responses which are
+        split out of batch responses; other responses are deserialized by the
+        HTTP client.
+    :type deserializer: callable
+    :param velocypack: VelocyPack codec, such as module
+        :mod:`arango.velocypack` or an accelerated backend with compatible
+        ``dumps`` and ``loads`` functions. If set, document and cursor API
+        payloads are exchanged in VelocyPack instead of JSON.
+    :type velocypack: module | object
     """
 
-    def __init__(self, url, db, username, password, http_client):
-        self._url_prefix = '{}/_db/{}'.format(url, db)
+    def __init__(self,
+                 url,
+                 db,
+                 username,
+                 password,
+                 http_client,
+                 host_resolver=None,
+                 serializer=json.dumps,
+                 deserializer=json.loads,
+                 velocypack=None):
+        urls = [url] if isinstance(url, string_types) else list(url)
+        self._url_prefixes = ['{}/_db/{}'.format(u, db) for u in urls]
+        self._url_prefix = self._url_prefixes[0]
         self._db_name = db
         self._username = username
         self._auth = (username, password)
         self._http_client = http_client or DefaultHTTPClient()
+        self._host_resolver = (
+            host_resolver or RoundRobinHostResolver(len(urls))
+        )
+        self._serializer = serializer
+        self._deserializer = deserializer
+        self._velocypack = velocypack
+        self._result_caches = WeakSet()
+        self._result_caches_lock = Lock()
 
     @property
     def url_prefix(self):
-        """Return the ArangoDB URL prefix (base URL + database name).
+        """Return the ArangoDB URL prefix (base URL + database name) of the
+        first host.
 
         :returns: ArangoDB URL prefix.
         :rtype: str | unicode
         """
         return self._url_prefix
 
+    @property
+    def url_prefixes(self):
+        """Return the ArangoDB URL prefixes of all hosts.
+
+        :returns: ArangoDB URL prefixes.
+        :rtype: [str | unicode]
+        """
+        return self._url_prefixes
+
     @property
     def username(self):
         """Return the username.
@@ -54,19 +215,233 @@ class Connection(object):
         """
         return self._db_name
 
-    def send_request(self, request):
+    @property
+    def host_resolver(self):
+        """Return the host resolver.
+
+        :returns: Host resolver.
+        :rtype: arango.resolver.HostResolver
+        """
+        return self._host_resolver
+
+    @property
+    def serializer(self):
+        """Return the request payload serializer.
+
+        :returns: Serializer.
+        :rtype: callable
+        """
+        return self._serializer
+
+    @property
+    def deserializer(self):
+        """Return the response body deserializer.
+
+        :returns: Deserializer.
+        :rtype: callable
+        """
+        return self._deserializer
+
+    def add_result_cache(self, cache):
+        """Register a query result cache to clear on every write request.
+
+        The connection holds the cache only as long as something else does.
+
+        :param cache: Query result cache.
+        :type cache: arango.cache.QueryResultCache
+        """
+        with self._result_caches_lock:
+            self._result_caches.add(cache)
+
+    def _clear_result_caches(self):
+        """Clear the registered query result caches."""
+        with self._result_caches_lock:
+            caches = list(self._result_caches)
+        for cache in caches:
+            cache.clear()
+
+    def _send(self, request, host_index):
+        """Send an HTTP request to the given host.
+
+        The host must have been acquired from the host resolver beforehand.
+        It is released once the request completes, and marked down if the
+        connection to it cannot be established.
+
+        :param request: HTTP request.
+        :type request: arango.request.Request
+        :param host_index: Host index.
+        :type host_index: int
+        :return: HTTP response.
+        :rtype: arango.response.Response
+        """
+        velocypack = self._uses_velocypack(request)
+        if velocypack:
+            headers = dict(request.headers)
+            headers['accept'] = VELOCYPACK_CONTENT_TYPE
+            if request._payload is None:
+                data = None
+            else:
+                headers['content-type'] = VELOCYPACK_CONTENT_TYPE
+                data = self._velocypack.dumps(request._payload)
+        else:
+            headers = request.headers
+            data = request.serialize(self._serializer)
+
+        try:
+            response = self._http_client.send_request(
+                method=request.method,
+                url=self._url_prefixes[host_index] + request.endpoint,
+                params=request.params,
+                data=data,
+                headers=headers,
+                auth=self._auth,
+            )
+        except IOError as err:
+            if _is_connect_error(err):
+                self._host_resolver.mark_down(host_index)
+            raise
+        finally:
+            self._host_resolver.release(host_index)
+        response.host_index = host_index
+        if velocypack and response._is_velocypack():
+            response._deserializer = self._velocypack.loads
+        return response
+
+    def _uses_velocypack(self, request):
+        """Check if a request should be sent in VelocyPack.
+
+        Only document and cursor API requests whose payloads are not already
+        serialized (or streamed), and which do not ask for a specific response
+        content type, are sent in VelocyPack.
+
+        :param request: HTTP request.
+        :type request: arango.request.Request
+        :return: True if the request should be sent in VelocyPack.
+        :rtype: bool
+        """
+        if self._velocypack is None or request.streamed:
+            return False
+        if not request.endpoint.startswith(_VELOCYPACK_ENDPOINTS):
+            return False
+        if isinstance(request._payload, (string_types, bytes)):
+            return False
+        return 'accept' not in request.headers
+
+    def _probe_hosts(self):
+        """Re-probe the down hosts which are due, and put the ones which
+        respond back into rotation."""
+        for host_index in self._host_resolver.hosts_to_probe():
+            self._host_resolver.acquire(host_index)
+            try:
+                response = self._send(self._probe_request(), host_index)
+            except IOError:
+                continue
+            if response.status_code < 500:
+                self._host_resolver.mark_up(host_index)
+
+    # noinspection PyMethodMayBeStatic
+    def _probe_request(self):
+        """Return the request used to check if a host is alive.
+
+        :return: HTTP request, same as the one sent by database ping.
+        :rtype: arango.request.Request
+        """
+        return Request(method='get', endpoint='/_api/collection')
+
+    def send_request(self, request, host_index=None):
         """Send an HTTP request to ArangoDB server.
 
         :param request: HTTP request.
         :type request: arango.request.Request
+        :param host_index: Index of the host to send the request to. If not
+            set, the host is picked by the host resolver.
+        :type host_index: int
         :return: HTTP response.
         :rtype: arango.response.Response
         """
-        return self._http_client.send_request(
-            method=request.method,
-            url=self._url_prefix + request.endpoint,
-            params=request.params,
-            data=request.data,
-            headers=request.headers,
-            auth=self._auth,
-        )
+        if not (self._result_caches and _is_write_request(request)):
+            return self._send_request(request, host_index)
+
+        self._clear_result_caches()
+        try:
+            return self._send_request(request, host_index)
+        finally:
+            # Clear again in case results were cached while the write was in
+            # flight.
+            self._clear_result_caches()
+
+    def _send_request(self, request, host_index):
+        """Send an HTTP request to the given host, or to the host picked by
+        the host resolver (failing over to other hosts if possible).
+
+        :param request: HTTP request.
+        :type request: arango.request.Request
+        :param host_index: Host index, or None.
+        :type host_index: int
+        :return: HTTP response.
+        :rtype: arango.response.Response
+        """
+        if host_index is not None:
+            self._host_resolver.acquire(host_index)
+            return self._send(request, host_index)
+
+        self._probe_hosts()
+        tried = set()
+        while True:
+            host_index = self._host_resolver.get_host_index(tried)
+            try:
+                return self._send(request, host_index)
+            except IOError as err:
+                tried.add(host_index)
+                if (not _can_fail_over(request, err) or
+                        len(tried) == self._host_resolver.host_count):
+                    raise
+
+
+class TransactionConnection(object):
+    """HTTP connection which sends every request within a stream transaction.
+
+    The transaction ID is attached to every request (including those sent by
+    cursors), and requests are sent to the host which began the transaction.
+    Other attributes are those of the wrapped connection.
+
+    :param connection: HTTP connection.
+    :type connection: arango.connection.Connection
+    :param transaction_id: Stream transaction ID.
+    :type transaction_id: str | unicode
+    :param host_index: Index of the host which began the transaction.
+    :type host_index: int
+    """
+
+    def __init__(self, connection, transaction_id, host_index=None):
+        self._conn = connection
+        self._transaction_id = transaction_id
+        self._host_index = host_index
+
+    def __getattr__(self, name):
+        return getattr(self._conn, name)
+
+    @property
+    def transaction_id(self):
+        """Return the stream transaction ID.
+
+        :return: Transaction ID.
+        :rtype: str | unicode
+        """
+        return self._transaction_id
+
+    def send_request(self, request, host_index=None):
+        """Send an HTTP request to ArangoDB server within the transaction.
+
+        :param request: HTTP request.
+        :type request: arango.request.Request
+        :param host_index: Index of the host to send the request to. If not
+            set, the request is sent to the host which began the transaction.
+        :type host_index: int
+        :return: HTTP response.
+        :rtype: arango.response.Response
+        """
+        request.headers['x-arango-trx-id'] = self._transaction_id
+        if host_index is None:
+            host_index = self._host_index
+        return self._conn.send_request(request, host_index)
@@ -2,7 +2,11 @@ from __future__ import absolute_import, unicode_literals
 
 __all__ = ['Cursor']
 
+from array import array
 from collections import deque
+from threading import Event, Thread
+
+from six.moves import queue
 
 from arango.exceptions import (
     CursorNextError,
@@ -30,6 +34,14 @@ class Cursor(object):
     :type init_data: dict | list
     :param cursor_type: Cursor type ("cursor" or "export").
     :type cursor_type: str | unicode
+    :param host_index: Index of the host which created the cursor. Follow-up
+        requests for the cursor are sent to the same host.
+    :type host_index: int
+    :param prefetch: Max number of batches fetched ahead by a background
+        thread while the current batch is being consumed. Value 0 (default)
+        disables prefetching, and batches are fetched only once the current
+        one is depleted.
+    :type prefetch: int
     """
 
     __slots__ = [
@@ -43,12 +55,27 @@ class Cursor(object):
         '_warnings',
         '_has_more',
         '_batch',
-        '_count'
+        '_count',
+        '_host_index',
+        '_prefetch',
+        '_prefetched',
+        '_prefetcher',
+        '_prefetch_stop'
     ]
 
-    def __init__(self, connection, init_data, cursor_type='cursor'):
+    def __init__(self,
+                 connection,
+                 init_data,
+                 cursor_type='cursor',
+                 host_index=None,
+                 prefetch=0):
         self._conn = connection
         self._type = cursor_type
+        self._host_index = host_index
+        self._prefetch = prefetch
+        self._prefetched = None
+        self._prefetcher = None
+        self._prefetch_stop = None
         self._batch = deque()
         self._id = None
         self._count = None
@@ -86,6 +113,33 @@ class Cursor(object):
     def __repr__(self):
         return '<Cursor {}>'.format(self._id) if self._id else '<Cursor>'
 
+    def __del__(self):
+        if getattr(self, '_prefetch_stop', None) is not None:
+            self._prefetch_stop.set()
+
+    def _start_prefetch(self):
+        """Start the background thread which fetches the next batches."""
+        self._prefetched = queue.Queue(self._prefetch)
+        self._prefetch_stop = Event()
+        self._prefetcher = Thread(
+            target=_prefetch_batches,
+            args=(
+                self._conn,
+                '/_api/{}/{}'.format(self._type, self._id),
+                self._host_index,
+                self._prefetched,
+                self._prefetch_stop
+            )
+        )
+        self._prefetcher.daemon = True
+        self._prefetcher.start()
+
+    def _stop_prefetch(self):
+        """Stop the background thread and wait for it to finish."""
+        self._prefetch_stop.set()
+        self._prefetcher.join()
+        self._prefetch = 0
+
     def _update(self, data):
         """Update the cursor using data from ArangoDB server.
 
@@ -239,9 +293,44 @@ class Cursor(object):
             if not self.has_more():
                 raise StopIteration
             self.fetch()
+        elif self._prefetch and self._prefetcher is None and self._has_more:
+            self._start_prefetch()
 
         return self.pop()
 
+    def iter_batches(self, columnar=None):
+        """Iterate over the remaining results batch by batch.
+
+        The current batch is yielded first, then each batch fetched from the
+        server, so results are handed over without popping them one by one.
+
+        :param columnar: Convert each batch of flat documents into a dict
+            mapping field names to columns of values (missing fields are set
+            to None). Allowed values are "list" (columns are returned as
+            lists), "array" (columns of floats or integers are returned as
+            :class:`array.array`, other columns as lists) and "numpy" (columns
+            are returned as NumPy arrays, which requires NumPy to be
+            installed). If not set, batches are returned as lists.
+        :type columnar: str | unicode
+        :return: Generator of batches.
+        :rtype: collections.Iterable[list | dict]
+        :raise ValueError: If **columnar** value is invalid.
+        :raise arango.exceptions.CursorNextError: If batch retrieval fails.
+        :raise arango.exceptions.CursorStateError: If cursor ID is not set.
+        """
+        if columnar not in (None, 'list', 'array', 'numpy'):
+            raise ValueError('invalid columnar value: {}'.format(columnar))
+
+        while True:
+            if self._batch:
+                batch = list(self._batch)
+                self._batch.clear()
+                yield batch if columnar is None else _to_columns(
+                    batch, columnar)
+            if not self._has_more:
+                return
+            self.fetch()
+
     def pop(self):
         """Pop the next item from current batch.
 
@@ -267,11 +356,22 @@ class Cursor(object):
         """
         if self._id is None:
             raise CursorStateError('cursor ID not set')
-        request = Request(
-            method='put',
-            endpoint='/_api/{}/{}'.format(self._type, self._id)
-        )
-        resp = self._conn.send_request(request)
+
+        if self._prefetch and self._has_more:
+            if self._prefetcher is None:
+                self._start_prefetch()
+            request, resp, error = self._prefetched.get()
+            if error is not None or not resp.is_success:
+                # The background thread exits on errors.
+                self._stop_prefetch()
+            if error is not None:
+                raise error
+        else:
+            request = Request(
+                method='put',
+                endpoint='/_api/{}/{}'.format(self._type, self._id)
+            )
+            resp = self._conn.send_request(request, self._host_index)
 
         if not resp.is_success:
             raise CursorNextError(resp, request)
@@ -292,13 +392,97 @@ class Cursor(object):
         """
         if self._id is None:
             return None
+        if self._prefetcher is not None and self._prefetch:
+            self._stop_prefetch()
         request = Request(
             method='delete',
             endpoint='/_api/{}/{}'.format(self._type, self._id)
         )
-        resp = self._conn.send_request(request)
+        resp = self._conn.send_request(request, self._host_index)
         if resp.is_success:
             return True
         if resp.status_code == 404 and ignore_missing:
             return False
         raise CursorCloseError(resp, request)
+
+
+def _to_columns(batch, columnar):
+    """Convert a batch of flat documents into columns.
+
+    :param batch: Documents.
+    :type batch: [dict]
+    :param columnar: Column type ("list", "array" or "numpy").
+    :type columnar: str | unicode
+    :return: Columns by field name.
+    :rtype: dict
+    """
+    fields = []
+    seen = set()
+    for doc in batch:
+        for field in doc:
+            if field not in seen:
+                seen.add(field)
+                fields.append(field)
+    columns = {
+        field: [doc.get(field) for doc in batch]
+        for field in fields
+    }
+
+    if columnar == 'list':
+        return columns
+
+    if columnar == 'numpy':
+        import numpy
+        return {
+            field: numpy.array(values)
+            for field, values in columns.items()
+        }
+
+    for field, values in columns.items():
+        types = set(map(type, values))
+        if types == {float} or types == {int, float}:
+            columns[field] = array('d', values)
+        elif types == {int}:
+            try:
+                columns[field] = array('q', values)
+            except (ValueError, OverflowError):
+                pass
+    return columns
+
+
+def _prefetch_batches(connection, endpoint, host_index, batches, stop):
+    """Fetch cursor batches into a bounded queue until the cursor is depleted,
+    a request fails, or the stop event is set.
+
+    The function does not hold a reference to the cursor, so an abandoned
+    cursor can still be garbage-collected (which sets the stop event).
+
+    :param connection: HTTP connection.
+    :type connection: arango.connection.Connection
+    :param endpoint: Cursor API endpoint.
+    :type endpoint: str | unicode
+    :param host_index: Index of the host which created the cursor.
+    :type host_index: int
+    :param batches: Queue receiving (request, response, error) tuples.
+    :type batches: queue.Queue
+    :param stop: Event set when prefetching must stop.
+    :type stop: threading.Event
+    """
+    while not stop.is_set():
+        request = Request(method='put', endpoint=endpoint)
+        try:
+            resp = connection.send_request(request, host_index)
+            item, done = (request, resp, None), not (
+                resp.is_success and resp.body['hasMore']
+            )
+        except Exception as err:
+            item, done = (request, None, err), True
+
+        while not stop.is_set():
+            try:
+                batches.put(item, timeout=0.1)
+                break
+            except queue.Full:
+                continue
+        if done:
+            return
@@ -6,7 +6,8 @@ __all__ = [
     'StandardDatabase',
     'AsyncDatabase',
     'BatchDatabase',
-    'TransactionDatabase'
+    'TransactionDatabase',
+    'StreamTransactionDatabase'
 ]
 
 from datetime import datetime
@@ -18,8 +19,10 @@ from arango.executor import (
     AsyncExecutor,
     BatchExecutor,
     TransactionExecutor,
+    StreamTransactionExecutor,
 )
 from arango.collection import StandardCollection
+from arango.connection import TransactionConnection
 from arango.exceptions import (
     AsyncJobClearError,
     AsyncJobListError,
@@ -58,6 +61,7 @@ from arango.exceptions import (
     TaskDeleteError,
     TaskGetError,
     TaskListError,
+    TransactionBeginError,
     TransactionExecuteError,
     UserCreateError,
     UserDeleteError,
@@ -786,15 +790,23 @@ class Database(APIWrapper):
     # Collection Management #
     #########################
 
-    def collection(self, name):
+    def collection(self, name, cache=None, coalescer=None):
         """Return the standard collection API wrapper.
 
         :param name: Collection name.
         :type name: str | unicode
+        :param cache: Document cache which serves repeated reads of the same
+            documents locally (see :class:`arango.cache.DocumentCache`).
+        :type cache: arango.cache.DocumentCache
+        :param coalescer: Write coalescer which batches single-document writes
+            from concurrent callers (see
+            :class:`arango.coalescer.WriteCoalescer`).
+        :type coalescer: arango.coalescer.WriteCoalescer
         :return: Standard collection API wrapper.
         :rtype: arango.collection.StandardCollection
         """
-        return StandardCollection(self._conn, self._executor, name)
+        return StandardCollection(
+            self._conn, self._executor, name, cache, coalescer)
 
     def has_collection(self, name):
         """Check if collection exists in the database.
@@ -2082,14 +2094,27 @@ class StandardDatabase(Database):
 
     :param connection: HTTP connection.
     :type connection: arango.connection.Connection
+    :param result_cache: Client-side cache of AQL query results (see
+        :class:`arango.cache.QueryResultCache`). It is cleared on every write
+        request sent over the connection, in any execution context.
+    :type result_cache: arango.cache.QueryResultCache
     """
 
-    def __init__(self, connection):
+    def __init__(self, connection, result_cache=None):
         super(StandardDatabase, self).__init__(
             connection=connection,
-            executor=DefaultExecutor(connection)
+            executor=DefaultExecutor(connection, result_cache)
         )
 
+    @property
+    def result_cache(self):
+        """Return the AQL query result cache.
+
+        :return: Query result cache, or None if caching is not enabled.
+        :rtype: arango.cache.QueryResultCache | None
+        """
+        return self._executor.result_cache
+
     def __repr__(self):
         return '<StandardDatabase {}>'.format(self.name)
 
@@ -2106,7 +2131,11 @@ class StandardDatabase(Database):
         """
         return AsyncDatabase(self._conn, return_result)
 
-    def begin_batch_execution(self, return_result=True):
+    def begin_batch_execution(self,
+                              return_result=True,
+                              max_parts=None,
+                              max_bytes=None,
+                              workers=1):
         """Begin batch execution.
 
         :param return_result: If set to True, API executions return instances
@@ -2114,10 +2143,22 @@ class StandardDatabase(Database):
             commit. If set to False, API executions return None and no results
             are tracked client-side.
         :type return_result: bool
+        :param max_parts: Max number of requests per batch API request. If
+            more requests are queued, they are split across several batch API
+            requests on commit.
+        :type max_parts: int
+        :param max_bytes: Max size of a batch API request body in bytes. If
+            the queued requests are larger, they are split across several
+            batch API requests on commit.
+        :type max_bytes: int
+        :param workers: Max number of batch API requests sent concurrently on
+            commit.
+        :type workers: int
         :return: Database API wrapper built specifically for batch execution.
         :rtype: arango.database.BatchDatabase
         """
-        return BatchDatabase(self._conn, return_result)
+        return BatchDatabase(
+            self._conn, return_result, max_parts, max_bytes, workers)
 
     def begin_transaction(self,
                           return_result=True,
@@ -2156,6 +2197,82 @@ class StandardDatabase(Database):
             sync=sync
         )
 
+    def begin_stream_transaction(self,
+                                 read=None,
+                                 write=None,
+                                 exclusive=None,
+                                 sync=None,
+                                 allow_implicit=None,
+                                 lock_timeout=None,
+                                 max_size=None):
+        """Begin a stream transaction.
+
+        Unlike transactions started with
+        :func:`arango.database.StandardDatabase.begin_transaction`, requests
+        are sent to the server right away and their results are available
+        immediately, so reads inside the transaction can feed later writes.
+        Changes become visible to others only on commit. Stream transactions
+        require ArangoDB 3.5+.
+
+        :param read: Names of collections read during transaction.
+        :type read: str | unicode | [str | unicode]
+        :param write: Names of collections written to during transaction.
+        :type write: str | unicode | [str | unicode]
+        :param exclusive: Names of collections written to exclusively during
+            transaction.
+        :type exclusive: str | unicode | [str | unicode]
+        :param sync: Block until the transaction is synchronized to disk.
+        :type sync: bool
+        :param allow_implicit: If set to True, undeclared read collections are
+            loaded lazily. If set to False, transaction fails on any undeclared
+            collections.
+        :type allow_implicit: bool
+        :param lock_timeout: Timeout for waiting on collection locks. If set to
+            0, ArangoDB server waits indefinitely. If not set, system default
+            value is used.
+        :type lock_timeout: int
+        :param max_size: Max transaction size limit in bytes. Applies only
+            to RocksDB storage engine.
+        :type max_size: int
+        :return: Database API wrapper bound to the stream transaction.
+        :rtype: arango.database.StreamTransactionDatabase
+        :raise arango.exceptions.TransactionBeginError: If begin fails.
+        """
+        collections = {}
+        if read is not None:
+            collections['read'] = read
+        if write is not None:
+            collections['write'] = write
+        if exclusive is not None:
+            collections['exclusive'] = exclusive
+
+        data = {'collections': collections}
+        if sync is not None:
+            data['waitForSync'] = sync
+        if allow_implicit is not None:
+            data['allowImplicit'] = allow_implicit
+        if lock_timeout is not None:
+            data['lockTimeout'] = lock_timeout
+        if max_size is not None:
+            data['maxTransactionSize'] = max_size
+
+        request = Request(
+            method='post',
+            endpoint='/_api/transaction/begin',
+            data=data
+        )
+
+        def response_handler(resp):
+            if not resp.is_success:
+                raise TransactionBeginError(resp, request)
+            return StreamTransactionDatabase(
+                connection=self._conn,
+                transaction_id=resp.body['result']['id'],
+                host_index=resp.host_index
+            )
+
+        return self._execute(request, response_handler)
+
 
 class AsyncDatabase(Database):
     """Database API wrapper tailored specifically for async execution.
@@ -2180,6 +2297,83 @@ class AsyncDatabase(Database):
     def __repr__(self):
         return '<AsyncDatabase {}>'.format(self.name)
 
+    def pending_jobs(self):
+        """Return the outstanding async jobs.
+
+        Jobs are tracked from execution until they are returned by
+        :func:`arango.database.AsyncDatabase.as_completed` or
+        :func:`arango.database.AsyncDatabase.wait`. They are tracked weakly:
+        jobs no longer referenced elsewhere are dropped.
+
+        :return: Outstanding async jobs or None if **return_result** parameter
+            was set to False during initialization.
+        :rtype: [arango.job.AsyncJob] | None
+        """
+        return self._executor.jobs
+
+    def as_completed(self,
+                     jobs=None,
+                     timeout=None,
+                     workers=4,
+                     min_interval=0.01,
+                     max_interval=1):
+        """Return async jobs as they finish, with their results retrieved.
+
+        Instead of polling each job, the server is asked which jobs finished
+        with a couple of requests per poll, and their results are retrieved
+        concurrently. The polling interval starts at **min_interval** seconds
+        and backs off exponentially up to **max_interval** seconds while no
+        job finishes.
+
+        :param jobs: Async jobs. If not set, the outstanding jobs are used.
+        :type jobs: [arango.job.AsyncJob]
+        :param timeout: Max number of seconds to wait. If not set, there is no
+            limit.
+        :type timeout: int | float
+        :param workers: Max number of results retrieved concurrently.
+        :type workers: int
+        :param min_interval: Min number of seconds between polls.
+        :type min_interval: int | float
+        :param max_interval: Max number of seconds between polls.
+        :type max_interval: int | float
+        :return: Generator of finished async jobs.
+        :rtype: collections.Iterable[arango.job.AsyncJob]
+        :raise arango.exceptions.AsyncJobTimeoutError: If jobs are still
+            pending after **timeout** seconds.
+        :raise arango.exceptions.AsyncJobListError: If polling fails.
+        """
+        return self._executor.as_completed(
+            jobs, timeout, workers, min_interval, max_interval)
+
+    def wait(self,
+             jobs=None,
+             timeout=None,
+             workers=4,
+             min_interval=0.01,
+             max_interval=1):
+        """Wait for async jobs to finish, and retrieve their results.
+
+        See :func:`arango.database.AsyncDatabase.as_completed` for details.
+
+        :param jobs: Async jobs. If not set, the outstanding jobs are used.
+        :type jobs: [arango.job.AsyncJob]
+        :param timeout: Max number of seconds to wait. If not set, there is no
+            limit.
+        :type timeout: int | float
+        :param workers: Max number of results retrieved concurrently.
+        :type workers: int
+        :param min_interval: Min number of seconds between polls.
+        :type min_interval: int | float
+        :param max_interval: Max number of seconds between polls.
+        :type max_interval: int | float
+        :return: Finished jobs and jobs still pending after **timeout**
+            seconds.
+        :rtype: ([arango.job.AsyncJob], [arango.job.AsyncJob])
+        :raise arango.exceptions.AsyncJobListError: If polling fails.
+        """
+        return self._executor.wait(
+            jobs, timeout, workers, min_interval, max_interval)
+
 
 class BatchDatabase(Database):
     """Database API wrapper tailored specifically for batch execution.
@@ -2193,12 +2387,24 @@ class BatchDatabase(Database):
         If set to False, API executions return None and no results are tracked
         client-side.
     :type return_result: bool
+    :param max_parts: Max number of requests per batch API request.
+    :type max_parts: int
+    :param max_bytes: Max size of a batch API request body in bytes.
+    :type max_bytes: int
+    :param workers: Max number of batch API requests sent concurrently.
+    :type workers: int
     """
 
-    def __init__(self, connection, return_result):
+    def __init__(self,
+                 connection,
+                 return_result,
+                 max_parts=None,
+                 max_bytes=None,
+                 workers=1):
         super(BatchDatabase, self).__init__(
             connection=connection,
-            executor=BatchExecutor(connection, return_result)
+            executor=BatchExecutor(
+                connection, return_result, max_parts, max_bytes, workers)
         )
 
     def __repr__(self):
@@ -2221,7 +2427,11 @@ class BatchDatabase(Database):
         return self._executor.jobs
 
     def commit(self):
-        """Execute the queued requests in a single batch API request.
+        """Execute the queued requests in batch API requests.
+
+        The queued requests are sent in a single batch API request, unless
+        **max_parts** or **max_bytes** parameters were set during
+        initialization.
 
         If **return_result** parameter was set to True during initialization,
         :class:`arango.job.BatchJob` instances are populated with results.
@@ -2232,7 +2442,10 @@ class BatchDatabase(Database):
         :raise arango.exceptions.BatchStateError: If batch state is invalid
             (e.g. batch was already committed or the response size did not
             match expected).
-        :raise arango.exceptions.BatchExecuteError: If commit fails.
+        :raise arango.exceptions.BatchExecuteError: If commit fails. If the
+            queue was split, batch API requests which succeeded are not rolled
+            back, and the jobs of the failed request and of those never sent
+            stay "pending".
         """
         return self._executor.commit()
 
@@ -2308,3 +2521,80 @@ class TransactionDatabase(Database):
         :raise arango.exceptions.TransactionExecuteError: If commit fails.
         """
         return self._executor.commit()
+
+
+class StreamTransactionDatabase(Database):
+    """Database API wrapper bound to a stream transaction.
+
+    See :func:`arango.database.StandardDatabase.begin_stream_transaction`.
+
+    :param connection: HTTP connection.
+    :type connection: arango.connection.Connection
+    :param transaction_id: Stream transaction ID.
+    :type transaction_id: str | unicode
+    :param host_index: Index of the host which began the transaction.
+    :type host_index: int
+    """
+
+    def __init__(self, connection, transaction_id, host_index=None):
+        connection = TransactionConnection(
+            connection, transaction_id, host_index)
+        super(StreamTransactionDatabase, self).__init__(
+            connection=connection,
+            executor=StreamTransactionExecutor(connection)
+        )
+
+    def __repr__(self):
+        return '<StreamTransactionDatabase {}>'.format(self.name)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exception, *_):
+        if not self._executor.running:
+            return
+        if exception is None:
+            self.commit()
+        else:
+            self.abort()
+
+    @property
+    def transaction_id(self):
+        """Return the stream transaction ID.
+
+        :return: Transaction ID.
+        :rtype: str | unicode
+        """
+        return self._executor.id
+
+    def transaction_status(self):
+        """Return the transaction status from server.
+
+        :return: Transaction status. Possible values are "running",
+            "committed" and "aborted".
+        :rtype: str | unicode
+        :raise arango.exceptions.TransactionStatusError: If retrieval fails.
+        """
+        return self._executor.status()
+
+    def commit(self):
+        """Commit the transaction.
+
+        :return: True if the transaction was committed successfully.
+        :rtype: bool
+        :raise arango.exceptions.TransactionStateError: If the transaction was
+            already committed or aborted.
+        :raise arango.exceptions.TransactionCommitError: If commit fails.
+        """
+        return self._executor.commit()
+
+    def abort(self):
+        """Abort the transaction.
+
+        :return: True if the transaction was aborted successfully.
+        :rtype: bool
+        :raise arango.exceptions.TransactionStateError: If the transaction was
+            already committed or aborted.
+        :raise arango.exceptions.TransactionAbortError: If abort fails.
+        """
+        return self._executor.abort()
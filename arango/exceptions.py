@@ -175,6 +175,10 @@ class AsyncJobClearError(ArangoServerError):
     """Failed to clear async job results."""
 
 
+class AsyncJobTimeoutError(ArangoClientError):
+    """Timed out waiting for async jobs to finish."""
+
+
 ##############################
 # Batch Execution Exceptions #
 ##############################
@@ -635,6 +639,22 @@ class TransactionExecuteError(ArangoServerError):
     """Failed to execute transaction API request"""
 
 
+class TransactionBeginError(ArangoServerError):
+    """Failed to begin stream transaction."""
+
+
+class TransactionStatusError(ArangoServerError):
+    """Failed to retrieve stream transaction status."""
+
+
+class TransactionCommitError(ArangoServerError):
+    """Failed to commit stream transaction."""
+
+
+class TransactionAbortError(ArangoServerError):
+    """Failed to abort stream transaction."""
+
+
 ###################
 # User Exceptions #
 ###################
@@ -6,27 +6,40 @@ __all__ = [
     'DefaultExecutor',
     'AsyncExecutor',
     'BatchExecutor',
-    'TransactionExecutor'
+    'TransactionExecutor',
+    'StreamTransactionExecutor'
 ]
 
+import time
 from collections import OrderedDict
+from threading import Lock
 from uuid import uuid4
+from weakref import WeakValueDictionary
 
 from arango.exceptions import (
     AsyncExecuteError,
+    AsyncJobTimeoutError,
     BatchStateError,
     BatchExecuteError,
+    TransactionAbortError,
+    TransactionCommitError,
     TransactionStateError,
+    TransactionStatusError,
     TransactionExecuteError,
 )
 from arango.job import (
     AsyncJob,
     BatchJob,
-    TransactionJob
+    TransactionJob,
+    harvest_async_jobs
 )
 from arango.request import Request
 from arango.response import Response
-from arango.utils import suppress_warning
+from arango.utils import (
+    map_concurrently,
+    parse_multipart,
+    suppress_warning
+)
 
 
 class Executor(object):  # pragma: no cover
@@ -61,11 +74,27 @@ class DefaultExecutor(Executor):
 
     :param connection: HTTP connection.
     :type connection: arango.connection.Connection
+    :param result_cache: Query result cache used by
+        :func:`arango.aql.AQL.execute`. It is registered with the connection,
+        which clears it on every write request sent.
+    :type result_cache: arango.cache.QueryResultCache
     """
     context = 'default'
 
-    def __init__(self, connection):
+    def __init__(self, connection, result_cache=None):
         super(DefaultExecutor, self).__init__(connection)
+        self._result_cache = result_cache
+        if result_cache is not None:
+            connection.add_result_cache(result_cache)
+
+    @property
+    def result_cache(self):
+        """Return the query result cache.
+
+        :return: Query result cache, or None if caching is not enabled.
+        :rtype: arango.cache.QueryResultCache | None
+        """
+        return self._result_cache
 
     def execute(self, request, response_handler):
         """Execute an API request and return the result.
@@ -77,8 +106,7 @@ class DefaultExecutor(Executor):
         :return: API execution result.
         :rtype: str | unicode | bool | int | list | dict
         """
-        response = self._conn.send_request(request)
-        return response_handler(response)
+        return response_handler(self._conn.send_request(request))
 
 
 class AsyncExecutor(Executor):
@@ -97,6 +125,26 @@ class AsyncExecutor(Executor):
     def __init__(self, connection, return_result):
         super(AsyncExecutor, self).__init__(connection)
         self._return_result = return_result
+        # Jobs are held weakly, so that jobs the caller no longer references
+        # (e.g. after retrieving their results) do not pile up.
+        self._jobs = WeakValueDictionary()
+        self._lock = Lock()
+
+    @property
+    def jobs(self):
+        """Return the outstanding async jobs.
+
+        :return: Async jobs not yet returned by
+            :func:`arango.executor.AsyncExecutor.as_completed` or
+            :func:`arango.executor.AsyncExecutor.wait` and still referenced
+            elsewhere, or None if **return_result** parameter was set to False
+            during initialization.
+        :rtype: [arango.job.AsyncJob] | None
+        """
+        if not self._return_result:
+            return None
+        with self._lock:
+            return list(self._jobs.values())
 
     def execute(self, request, response_handler):
         """Execute an API request asynchronously.
@@ -121,7 +169,108 @@ class AsyncExecutor(Executor):
             return None
 
         job_id = resp.headers['x-arango-async-id']
-        return AsyncJob(self._conn, job_id, response_handler)
+        job = AsyncJob(self._conn, job_id, response_handler, resp.host_index)
+        with self._lock:
+            self._jobs[job_id] = job
+        return job
+
+    def as_completed(self,
+                     jobs=None,
+                     timeout=None,
+                     workers=4,
+                     min_interval=0.01,
+                     max_interval=1):
+        """Return async jobs as they finish, with their results retrieved.
+
+        The server is polled with :func:`arango.job.harvest_async_jobs`. The
+        polling interval starts at **min_interval** seconds, doubles every
+        time no job finished, up to **max_interval** seconds, and is reset
+        when jobs finish.
+
+        :param jobs: Async jobs. If not set, the outstanding jobs are used.
+        :type jobs: [arango.job.AsyncJob]
+        :param timeout: Max number of seconds to wait. If not set, there is no
+            limit.
+        :type timeout: int | float
+        :param workers: Max number of results retrieved concurrently.
+        :type workers: int
+        :param min_interval: Min number of seconds between polls.
+        :type min_interval: int | float
+        :param max_interval: Max number of seconds between polls.
+        :type max_interval: int | float
+        :return: Generator of finished async jobs.
+        :rtype: collections.Iterable[arango.job.AsyncJob]
+        :raise arango.exceptions.AsyncJobTimeoutError: If jobs are still
+            pending after **timeout** seconds.
+        :raise arango.exceptions.AsyncJobListError: If polling fails.
+        """
+        pending = list(self.jobs or []) if jobs is None else list(jobs)
+        deadline = None if timeout is None else time.time() + timeout
+        interval = min_interval
+
+        while pending:
+            finished = harvest_async_jobs(pending, workers)
+            if finished:
+                finished_ids = set(id(job) for job in finished)
+                pending = [
+                    job for job in pending if id(job) not in finished_ids
+                ]
+                with self._lock:
+                    for job in finished:
+                        self._jobs.pop(job.id, None)
+                for job in finished:
+                    yield job
+                interval = min_interval
+                continue
+
+            now = time.time()
+            if deadline is not None and now >= deadline:
+                raise AsyncJobTimeoutError(
+                    '{} async jobs still pending'.format(len(pending)))
+            if deadline is None:
+                time.sleep(interval)
+            else:
+                time.sleep(min(interval, deadline - now))
+            interval = min(interval * 2, max_interval)
+
+    def wait(self,
+             jobs=None,
+             timeout=None,
+             workers=4,
+             min_interval=0.01,
+             max_interval=1):
+        """Wait for async jobs to finish, and retrieve their results.
+
+        See :func:`arango.executor.AsyncExecutor.as_completed` for details on
+        polling.
+
+        :param jobs: Async jobs. If not set, the outstanding jobs are used.
+        :type jobs: [arango.job.AsyncJob]
+        :param timeout: Max number of seconds to wait. If not set, there is no
+            limit.
+        :type timeout: int | float
+        :param workers: Max number of results retrieved concurrently.
+        :type workers: int
+        :param min_interval: Min number of seconds between polls.
+        :type min_interval: int | float
+        :param max_interval: Max number of seconds between polls.
+        :type max_interval: int | float
+        :return: Finished jobs and jobs still pending after **timeout**
+            seconds.
+        :rtype: ([arango.job.AsyncJob], [arango.job.AsyncJob])
+        :raise arango.exceptions.AsyncJobListError: If polling fails.
+        """
+        jobs = list(self.jobs or []) if jobs is None else list(jobs)
+        done = []
+        try:
+            for job in self.as_completed(
+                jobs, timeout, workers, min_interval, max_interval
+            ):
+                done.append(job)
+        except AsyncJobTimeoutError:
+            pass
+        done_ids = set(id(job) for job in done)
+        return done, [job for job in jobs if id(job) not in done_ids]
 
 
 class BatchExecutor(Executor):
@@ -134,12 +283,30 @@ class BatchExecutor(Executor):
         If set to False, API executions return None and no results are tracked
         client-side.
     :type return_result: bool
+    :param max_parts: Max number of requests per batch API request. If not
+        set, the number of requests is not limited.
+    :type max_parts: int
+    :param max_bytes: Max size of a batch API request body in bytes. If not
+        set, the size is not limited. A single request larger than the limit
+        is sent in a batch API request of its own.
+    :type max_bytes: int
+    :param workers: Max number of batch API requests sent concurrently when
+        the queue is split by **max_parts** or **max_bytes**.
+    :type workers: int
     """
     context = 'batch'
 
-    def __init__(self, connection, return_result):
+    def __init__(self,
+                 connection,
+                 return_result,
+                 max_parts=None,
+                 max_bytes=None,
+                 workers=1):
         super(BatchExecutor, self).__init__(connection)
         self._return_result = return_result
+        self._max_parts = max_parts
+        self._max_bytes = max_bytes
+        self._workers = workers
         self._queue = OrderedDict()
         self._committed = False
 
@@ -171,12 +338,37 @@ class BatchExecutor(Executor):
         if self._committed:
             raise BatchStateError('batch already committed')
 
+        if request.streamed:
+            # Batch parts are sent in full, so read streamed payloads now
+            # while their source (e.g. a file) is still open.
+            data = request.data
+            request = Request(
+                method=request.method,
+                endpoint=request.endpoint,
+                headers=request.headers,
+                params=request.params,
+                data=data.read() if hasattr(data, 'read')
+                else b''.join(data),
+                command=request.command,
+                read=request.read,
+                write=request.write
+            )
+        else:
+            # Serialize the payload now, so that later changes by the caller
+            # to the objects it holds do not leak into the committed request.
+            request.serialize(self._conn.serializer)
+
         job = BatchJob(response_handler)
         self._queue[job.id] = (request, job)
         return job if self._return_result else None
 
     def commit(self):
-        """Execute the queued requests in a single batch API request.
+        """Execute the queued requests in batch API requests.
+
+        The queued requests are sent in a single batch API request, unless
+        **max_parts** or **max_bytes** parameters were set during
+        initialization, in which case they are split across several batch API
+        requests sent concurrently.
 
         If **return_result** parameter was set to True during initialization,
         :class:`arango.job.BatchJob` instances are populated with results.
@@ -187,7 +379,12 @@ class BatchExecutor(Executor):
         :raise arango.exceptions.BatchStateError: If batch state is invalid
             (e.g. batch was already committed or size of response from server
             did not match the expected).
-        :raise arango.exceptions.BatchExecuteError: If commit fails.
+        :raise arango.exceptions.BatchExecuteError: If commit fails. If the
+            queue was split, batch API requests which succeeded are not rolled
+            back, and no further batch API requests are sent: the jobs of the
+            failed request and of those never sent stay "pending", and
+            :func:`arango.job.BatchJob.result` raises
+            :class:`arango.exceptions.BatchJobResultError` for them.
         """
         if self._committed:
             raise BatchStateError('batch already committed')
@@ -197,16 +394,68 @@ class BatchExecutor(Executor):
         if len(self._queue) == 0:
             return self.jobs
 
-        # Boundary used for multipart request
+        # Boundary used for multipart requests
         boundary = uuid4().hex
 
-        # Buffer for building the batch request payload
-        buffer = []
-        for req, job in self._queue.values():
-            buffer.append('--{}'.format(boundary))
-            buffer.append('Content-Type: application/x-arango-batchpart')
-            buffer.append('Content-Id: {}'.format(job.id))
-            buffer.append('\r\n{}'.format(req))
+        # Split the queue into chunks of multipart body parts
+        chunks = []
+        parts = []
+        size = 0
+        for job_id, (req, job) in self._queue.items():
+            part = self._build_part(boundary, job_id, req)
+            if not self._max_bytes:
+                part_size = 0
+            else:
+                part_size = len(part.encode('utf-8')) + 2
+            if parts and (
+                len(parts) == self._max_parts or
+                (self._max_bytes and size + part_size > self._max_bytes)
+            ):
+                chunks.append(parts)
+                parts = []
+                size = 0
+            parts.append((job_id, part))
+            size += part_size
+        chunks.append(parts)
+
+        map_concurrently(
+            lambda chunk: self._commit_chunk(boundary, chunk),
+            chunks,
+            self._workers
+        )
+        return self.jobs
+
+    def _build_part(self, boundary, job_id, request):
+        """Build the multipart body part of a queued request.
+
+        :param boundary: Multipart boundary.
+        :type boundary: str | unicode
+        :param job_id: Batch job ID, used as the Content-Id of the part.
+        :type job_id: str | unicode
+        :param request: Queued HTTP request.
+        :type request: arango.request.Request
+        :return: Multipart body part.
+        :rtype: str | unicode
+        """
+        return '\r\n'.join([
+            '--{}'.format(boundary),
+            'Content-Type: application/x-arango-batchpart',
+            'Content-Id: {}'.format(job_id),
+            '\r\n{}'.format(request)
+        ])
+
+    def _commit_chunk(self, boundary, parts):
+        """Send multipart body parts in a single batch API request.
+
+        :param boundary: Multipart boundary.
+        :type boundary: str | unicode
+        :param parts: Batch job IDs and multipart body parts.
+        :type parts: [(str | unicode, str | unicode)]
+        :raise arango.exceptions.BatchStateError: If size of response from
+            server did not match the expected.
+        :raise arango.exceptions.BatchExecuteError: If commit fails.
+        """
+        buffer = [part for _, part in parts]
         buffer.append('--{}--'.format(boundary))
 
         request = Request(
@@ -225,37 +474,34 @@ class BatchExecutor(Executor):
             raise BatchExecuteError(resp, request)
 
         if not self._return_result:
-            return None
+            return
 
-        raw_resps = resp.raw_body.split('--{}'.format(boundary))[1:-1]
-        if len(self._queue) != len(raw_resps):
+        try:
+            resp_parts = list(parse_multipart(resp.raw_body, boundary))
+        except ValueError as err:
+            raise BatchStateError('bad batch response: {}'.format(err))
+        if len(parts) != len(resp_parts):
             raise BatchStateError(
                 'expecting {} parts in batch response but got {}'
-                .format(len(self._queue), len(raw_resps))
+                .format(len(parts), len(resp_parts))
             )
-        for raw_resp in raw_resps:
-            # Parse and breakdown the batch response body
-            resp_parts = raw_resp.strip().split('\r\n')
-            raw_content_id = resp_parts[1]
-            raw_body = resp_parts[-1]
-            raw_status = resp_parts[3]
-            job_id = raw_content_id.split(' ')[1]
-            _, status_code, status_text = raw_status.split(' ', 2)
+        for part in resp_parts:
+            part_headers, status_code, status_text, headers, raw_body = part
 
             # Update the corresponding batch job
-            queued_req, queued_job = self._queue[job_id]
+            queued_req, queued_job = self._queue[part_headers['content-id']]
             queued_job._response = Response(
                 method=queued_req.method,
                 url=self._conn.url_prefix + queued_req.endpoint,
-                headers={},
-                status_code=int(status_code),
+                headers=headers,
+                status_code=status_code,
                 status_text=status_text,
-                raw_body=raw_body
+                raw_body=raw_body,
+                deserializer=self._conn.deserializer
             )
+            queued_job._response.host_index = resp.host_index
             queued_job._status = 'done'
 
-        return self.jobs
-
 
 class TransactionExecutor(Executor):
     """Executes transaction API requests.
@@ -417,3 +663,119 @@ class TransactionExecutor(Executor):
             )
             job._status = 'done'
         return self.jobs
+
+
+class StreamTransactionExecutor(Executor):
+    """Executes API requests within a stream transaction.
+
+    Requests are sent right away, and the results are returned as in the
+    default execution context.
+
+    :param connection: HTTP connection bound to the transaction.
+    :type connection: arango.connection.TransactionConnection
+    """
+    context = 'stream_transaction'
+
+    def __init__(self, connection):
+        super(StreamTransactionExecutor, self).__init__(connection)
+        self._status = 'running'
+
+    @property
+    def id(self):
+        """Return the stream transaction ID.
+
+        :return: Transaction ID.
+        :rtype: str | unicode
+        """
+        return self._conn.transaction_id
+
+    @property
+    def running(self):
+        """Check if the transaction was not committed or aborted yet.
+
+        :return: True if the transaction was not committed or aborted via
+            this executor.
+        :rtype: bool
+        """
+        return self._status == 'running'
+
+    def execute(self, request, response_handler):
+        """Execute an API request within the transaction.
+
+        :param request: HTTP request.
+        :type request: arango.request.Request
+        :param response_handler: HTTP response handler.
+        :type response_handler: callable
+        :return: API execution result.
+        :rtype: str | unicode | bool | int | list | dict
+        :raise arango.exceptions.TransactionStateError: If the transaction was
+            already committed or aborted.
+        """
+        if self._status != 'running':
+            raise TransactionStateError(
+                'transaction already {}'.format(self._status))
+        response = self._conn.send_request(request)
+        return response_handler(response)
+
+    def status(self):
+        """Return the transaction status from server.
+
+        :return: Transaction status. Possible values are "running",
+            "committed" and "aborted".
+        :rtype: str | unicode
+        :raise arango.exceptions.TransactionStatusError: If retrieval fails.
+        """
+        request = Request(
+            method='get',
+            endpoint='/_api/transaction/{}'.format(self.id)
+        )
+        resp = self._conn.send_request(request)
+        if not resp.is_success:
+            raise TransactionStatusError(resp, request)
+        return resp.body['result']['status']
+
+    def commit(self):
+        """Commit the transaction.
+
+        :return: True if the transaction was committed successfully.
+        :rtype: bool
+        :raise arango.exceptions.TransactionStateError: If the transaction was
+            already committed or aborted.
+        :raise arango.exceptions.TransactionCommitError: If commit fails.
+        """
+        if self._status != 'running':
+            raise TransactionStateError(
+                'transaction already {}'.format(self._status))
+
+        request = Request(
+            method='put',
+            endpoint='/_api/transaction/{}'.format(self.id)
+        )
+        resp = self._conn.send_request(request)
+        if not resp.is_success:
+            raise TransactionCommitError(resp, request)
+        self._status = 'committed'
+        return True
+
+    def abort(self):
+        """Abort the transaction.
+
+        :return: True if the transaction was aborted successfully.
+        :rtype: bool
+        :raise arango.exceptions.TransactionStateError: If the transaction was
+            already committed or aborted.
+        :raise arango.exceptions.TransactionAbortError: If abort fails.
+        """
+        if self._status != 'running':
+            raise TransactionStateError(
+                'transaction already {}'.format(self._status))
+
+        request = Request(
+            method='delete',
+            endpoint='/_api/transaction/{}'.format(self.id)
+        )
+        resp = self._conn.send_request(request)
+        if not resp.is_success:
+            raise TransactionAbortError(resp, request)
+        self._status = 'aborted'
+        return True
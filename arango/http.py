@@ -2,11 +2,19 @@ from __future__ import absolute_import, unicode_literals
 
 __all__ = ['HTTPClient', 'DefaultHTTPClient']
 
+import json
+import zlib
 from abc import ABCMeta, abstractmethod
+from threading import Lock
 
 import requests
+from requests.adapters import HTTPAdapter
+from six import text_type
+from six.moves import queue
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
 
 from arango.response import Response
+from arango.velocypack import CONTENT_TYPE as VELOCYPACK_CONTENT_TYPE
 
 
 class HTTPClient(object):  # pragma: no cover
@@ -44,11 +52,211 @@ class HTTPClient(object):  # pragma: no cover
         raise NotImplementedError
 
 
+class _MeteredQueue(queue.LifoQueue):
+    """Connection pool queue which counts the connections it had to reject.
+
+    :param maxsize: Max number of connections kept in the queue.
+    :type maxsize: int
+    """
+
+    def __init__(self, maxsize):
+        queue.LifoQueue.__init__(self, maxsize)
+        self.discarded = 0
+
+    def put(self, item, block=True, timeout=None):
+        try:
+            queue.LifoQueue.put(self, item, block, timeout)
+        except queue.Full:
+            self.discarded += 1
+            raise
+
+    def idle(self):
+        """Return the number of open connections waiting to be reused.
+
+        :return: Number of idle connections.
+        :rtype: int
+        """
+        with self.mutex:
+            return sum(1 for conn in self.queue if conn is not None)
+
+
+class _MeteredPoolMixin(object):
+    """Connection pool mixin which tracks the connections handed out."""
+
+    QueueCls = _MeteredQueue
+
+    def _get_conn(self, timeout=None):
+        conn = super(_MeteredPoolMixin, self)._get_conn(timeout)
+        with self._metrics_lock:
+            self.in_use += 1
+        return conn
+
+    def _put_conn(self, conn):
+        with self._metrics_lock:
+            self.in_use -= 1
+        super(_MeteredPoolMixin, self)._put_conn(conn)
+
+    def metrics(self):
+        """Return the pool metrics.
+
+        :return: Number of connections in use, idle and discarded.
+        :rtype: dict
+        """
+        pool = self.pool
+        return {
+            'in_use': self.in_use,
+            'idle': 0 if pool is None else pool.idle(),
+            'discarded': 0 if pool is None else pool.discarded,
+        }
+
+
+class _MeteredHTTPConnectionPool(_MeteredPoolMixin, HTTPConnectionPool):
+
+    def __init__(self, *args, **kwargs):
+        self._metrics_lock = Lock()
+        self.in_use = 0
+        HTTPConnectionPool.__init__(self, *args, **kwargs)
+
+
+class _MeteredHTTPSConnectionPool(_MeteredPoolMixin, HTTPSConnectionPool):
+
+    def __init__(self, *args, **kwargs):
+        self._metrics_lock = Lock()
+        self.in_use = 0
+        HTTPSConnectionPool.__init__(self, *args, **kwargs)
+
+
+class _MeteredHTTPAdapter(HTTPAdapter):
+    """Transport adapter whose connection pools report usage metrics."""
+
+    def init_poolmanager(self, *args, **kwargs):
+        super(_MeteredHTTPAdapter, self).init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            'http': _MeteredHTTPConnectionPool,
+            'https': _MeteredHTTPSConnectionPool,
+        }
+
+    def pools(self):
+        """Return the connection pools currently held by the adapter.
+
+        :return: Connection pools.
+        :rtype: [urllib3.connectionpool.HTTPConnectionPool]
+        """
+        pools = self.poolmanager.pools
+        return [pool for pool in (pools.get(key) for key in pools.keys())
+                if pool is not None]
+
+
 class DefaultHTTPClient(HTTPClient):
-    """Default HTTP client implementation."""
+    """Default HTTP client implementation.
 
-    def __init__(self):
+    :param pool_connections: Number of per-host connection pools to cache.
+    :type pool_connections: int
+    :param pool_maxsize: Max number of connections kept open per host. This
+        should be at least the number of threads sharing the client, or
+        connections are discarded and re-opened under load.
+    :type pool_maxsize: int
+    :param pool_block: If set to True, requests wait for a free connection
+        once **pool_maxsize** connections are in use instead of opening (and
+        later discarding) extra ones.
+    :type pool_block: bool
+    :param keep_alive: If set to False, connections are closed after every
+        request instead of being returned to the pool.
+    :type keep_alive: bool
+    :param keep_raw_body: If set to False, response bodies are decoded as JSON
+        straight from the received bytes, and the raw text of successful
+        responses is not kept around (see :class:`arango.response.Response`).
+        This roughly halves the memory held by large responses such as query
+        result batches.
+    :type keep_raw_body: bool
+    :param deserializer: Callable which deserializes JSON response bodies
+        (default: :func:`json.loads`).
+    :type deserializer: callable
+    :param compression: Content encoding used to compress request bodies:
+        "gzip" or "deflate". If not set, request bodies are sent as is.
+        Streamed request bodies are never compressed.
+    :type compression: str | unicode
+    :param compression_threshold: Min size of a request body in bytes for it
+        to be compressed.
+    :type compression_threshold: int
+    :param compression_level: Compression level from 1 (fastest) to 9
+        (smallest).
+    :type compression_level: int
+    :param accept_encoding: If set to True (default), compressed responses
+        are accepted and decompressed transparently. If set to False, the
+        server is asked not to compress responses.
+    :type accept_encoding: bool
+    """
+
+    def __init__(self,
+                 pool_connections=10,
+                 pool_maxsize=10,
+                 pool_block=False,
+                 keep_alive=True,
+                 keep_raw_body=True,
+                 deserializer=json.loads,
+                 compression=None,
+                 compression_threshold=1024,
+                 compression_level=6,
+                 accept_encoding=True):
+        if compression not in {None, 'gzip', 'deflate'}:
+            raise ValueError('unsupported compression: {}'.format(compression))
+
+        self._adapter = _MeteredHTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block
+        )
         self._session = requests.Session()
+        self._session.mount('http://', self._adapter)
+        self._session.mount('https://', self._adapter)
+        if not keep_alive:
+            self._session.headers['Connection'] = 'close'
+        if not accept_encoding:
+            self._session.headers['Accept-Encoding'] = 'identity'
+        self._keep_raw_body = keep_raw_body
+        self._deserializer = deserializer
+        self._compression = compression
+        self._compression_threshold = compression_threshold
+        self._compression_level = compression_level
+        self._transfer_lock = Lock()
+        self._transfer = {
+            'requests': 0,
+            'compressed': 0,
+            'sent': 0,
+            'sent_uncompressed': 0,
+            'received': 0,
+            'received_uncompressed': 0,
+        }
+
+    def pool_metrics(self):
+        """Return live connection pool metrics summed across all hosts.
+
+        :return: Number of connections in use ("in_use"), open connections
+            waiting to be reused ("idle"), connections closed because the pool
+            was full ("discarded"), and the number of host pools ("pools").
+        :rtype: dict
+        """
+        metrics = {'in_use': 0, 'idle': 0, 'discarded': 0, 'pools': 0}
+        for pool in self._adapter.pools():
+            for key, value in pool.metrics().items():
+                metrics[key] += value
+            metrics['pools'] += 1
+        return metrics
+
+    def transfer_metrics(self):
+        """Return the number of body bytes transferred across all requests.
+
+        :return: Number of requests sent ("requests") and requests with
+            compressed bodies ("compressed"), request body bytes sent over the
+            wire ("sent") and before compression ("sent_uncompressed"), and
+            response body bytes received over the wire ("received") and after
+            decompression ("received_uncompressed"). Streamed request bodies
+            are not counted.
+        :rtype: dict
+        """
+        with self._transfer_lock:
+            return dict(self._transfer)
 
     def send_request(self,
                      method,
@@ -74,6 +282,22 @@ class DefaultHTTPClient(HTTPClient):
         :returns: HTTP response.
         :rtype: arango.response.Response
         """
+        if isinstance(data, text_type):
+            data = data.encode('utf-8')
+
+        sent = sent_uncompressed = 0
+        compressed = False
+        if isinstance(data, bytes):
+            sent_uncompressed = len(data)
+            if (self._compression is not None and
+                    sent_uncompressed >= self._compression_threshold):
+                data = _compress(
+                    data, self._compression, self._compression_level)
+                headers = dict(headers or {})
+                headers['Content-Encoding'] = self._compression
+                compressed = True
+            sent = len(data)
+
         raw_resp = self._session.request(
             method=method,
             url=url,
@@ -82,11 +306,53 @@ class DefaultHTTPClient(HTTPClient):
             headers=headers,
             auth=auth,
         )
+        content_type = raw_resp.headers.get('content-type', '')
+        if self._keep_raw_body and \
+                not content_type.startswith(VELOCYPACK_CONTENT_TYPE):
+            raw_body = raw_resp.text
+        else:
+            raw_body = raw_resp.content
+
+        # Bytes pulled over the wire, before decompression.
+        received_uncompressed = len(raw_resp.content)
+        try:
+            received = raw_resp.raw.tell() or received_uncompressed
+        except (AttributeError, TypeError):
+            received = received_uncompressed
+
+        with self._transfer_lock:
+            transfer = self._transfer
+            transfer['requests'] += 1
+            transfer['compressed'] += compressed
+            transfer['sent'] += sent
+            transfer['sent_uncompressed'] += sent_uncompressed
+            transfer['received'] += received
+            transfer['received_uncompressed'] += received_uncompressed
         return Response(
             method=raw_resp.request.method,
             url=raw_resp.url,
             headers=raw_resp.headers,
             status_code=raw_resp.status_code,
             status_text=raw_resp.reason,
-            raw_body=raw_resp.text,
+            raw_body=raw_body,
+            keep_raw_body=self._keep_raw_body,
+            deserializer=self._deserializer
         )
+
+
+def _compress(data, encoding, level):
+    """Compress a request body.
+
+    :param data: Request body.
+    :type data: bytes
+    :param encoding: Content encoding ("gzip" or "deflate").
+    :type encoding: str | unicode
+    :param level: Compression level from 1 (fastest) to 9 (smallest).
+    :type level: int
+    :return: Compressed request body.
+    :rtype: bytes
+    """
+    # The gzip format is selected by adding 16 to the window size.
+    wbits = zlib.MAX_WBITS | 16 if encoding == 'gzip' else zlib.MAX_WBITS
+    compressor = zlib.compressobj(level, zlib.DEFLATED, wbits)
+    return compressor.compress(data) + compressor.flush()
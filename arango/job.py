@@ -1,9 +1,13 @@
 from __future__ import absolute_import, unicode_literals
 
+import time
+from collections import OrderedDict
+from threading import Event, Lock, Thread
 from uuid import uuid4
 
 from arango.exceptions import (
     AsyncJobCancelError,
+    AsyncJobListError,
     AsyncJobStatusError,
     AsyncJobResultError,
     AsyncJobClearError,
@@ -11,6 +15,7 @@ from arango.exceptions import (
     TransactionJobResultError,
 )
 from arango.request import Request
+from arango.utils import map_concurrently
 
 
 class Job(object):  # pragma: no cover
@@ -55,14 +60,31 @@ class AsyncJob(Job):
     :type job_id: str | unicode
     :param response_handler: HTTP response handler.
     :type response_handler: callable
+    :param host_index: Index of the host which accepted the job. Job results
+        are stored on that host, so follow-up requests are sent there.
+    :type host_index: int
     """
 
-    __slots__ = ['_conn', '_id', '_response_handler']
-
-    def __init__(self, connection, job_id, response_handler):
+    __slots__ = [
+        '_conn',
+        '_id',
+        '_response_handler',
+        '_host_index',
+        '_harvested',
+        '_response',
+        '_error',
+        '_future'
+    ]
+
+    def __init__(self, connection, job_id, response_handler, host_index=None):
         self._conn = connection
         self._id = job_id
         self._response_handler = response_handler
+        self._host_index = host_index
+        self._harvested = False
+        self._response = None
+        self._error = None
+        self._future = None
 
     def __repr__(self):
         return '<AsyncJob {}>'.format(self._id)
@@ -81,7 +103,9 @@ class AsyncJob(Job):
 
         Once a job result is retrieved via func:`arango.job.AsyncJob.result`
         method, it is deleted from server and subsequent status queries will
-        fail.
+        fail. Jobs whose results were retrieved in bulk (see
+        :func:`arango.job.harvest_async_jobs`) are "done" without contacting
+        the server.
 
         :return: Async job status. Possible values are "pending" (job is still
             in queue), "done" (job finished or raised an error), or "cancelled"
@@ -89,11 +113,14 @@ class AsyncJob(Job):
         :rtype: str | unicode
         :raise arango.exceptions.AsyncJobStatusError: If retrieval fails.
         """
+        if self._harvested:
+            return 'done'
+
         request = Request(
             method='get',
             endpoint='/_api/job/{}'.format(self._id)
         )
-        resp = self._conn.send_request(request)
+        resp = self._conn.send_request(request, self._host_index)
         if resp.status_code == 204:
             return 'pending'
         elif resp.is_success:
@@ -110,21 +137,35 @@ class AsyncJob(Job):
         If the job raised an exception, it is propagated up at this point.
 
         Once job result is retrieved, it is deleted from server and subsequent
-        queries for result will fail.
+        queries for result will fail. Results retrieved in bulk (see
+        :func:`arango.job.harvest_async_jobs`) are kept in the job instead.
 
         :return: Async job result.
         :rtype: str | unicode | bool | int | list | dict
         :raise arango.exceptions.ArangoError: If the job raised an exception.
         :raise arango.exceptions.AsyncJobResultError: If retrieval fails.
         """
+        if self._harvested:
+            if self._error is not None:
+                raise self._error
+            return self._response_handler(self._response)
+        return self._response_handler(self._fetch())
+
+    def _fetch(self):
+        """Retrieve the async job response from server.
+
+        :return: Response of the API execution.
+        :rtype: arango.response.Response
+        :raise arango.exceptions.AsyncJobResultError: If retrieval fails.
+        """
         request = Request(
             method='put',
             endpoint='/_api/job/{}'.format(self._id)
         )
-        resp = self._conn.send_request(request)
+        resp = self._conn.send_request(request, self._host_index)
         headers = resp.headers
         if 'X-Arango-Async-Id' in headers or 'x-arango-async-id' in headers:
-            return self._response_handler(resp)
+            return resp
         if resp.status_code == 204:
             error_message = 'job {} not done'.format(self._id)
             raise AsyncJobResultError(resp, request, error_message)
@@ -134,6 +175,27 @@ class AsyncJob(Job):
         else:
             raise AsyncJobResultError(resp, request)
 
+    def to_future(self):
+        """Return a future resolved with the async job result.
+
+        Futures of all async jobs are resolved by a shared background thread,
+        which polls the server with :func:`arango.job.harvest_async_jobs`.
+        They can be composed with :func:`concurrent.futures.wait`,
+        :func:`concurrent.futures.as_completed` and callbacks. Cancelling a
+        future does not cancel the job on the server. Polls which fail with
+        connection errors are retried with backoff, and a failure resolves
+        only the futures of the jobs sent to the same host.
+
+        On Python 2, the "futures" backport (a dependency of python-arango)
+        provides :mod:`concurrent.futures`.
+
+        :return: Future resolved with the job result, or with the exception
+            raised while retrieving it. The same future is returned on every
+            call.
+        :rtype: concurrent.futures.Future
+        """
+        return _poller.submit(self)
+
     def cancel(self, ignore_missing=False):
         """Cancel the async job.
 
@@ -150,7 +212,7 @@ class AsyncJob(Job):
             method='put',
             endpoint='/_api/job/{}/cancel'.format(self._id)
         )
-        resp = self._conn.send_request(request)
+        resp = self._conn.send_request(request, self._host_index)
         if resp.status_code == 200:
             return True
         elif resp.error_code == 404:
@@ -175,7 +237,7 @@ class AsyncJob(Job):
             method='delete',
             endpoint='/_api/job/{}'.format(self._id)
         )
-        resp = self._conn.send_request(request)
+        resp = self._conn.send_request(request, self._host_index)
         if resp.is_success:
             return True
         elif resp.error_code == 404:
@@ -187,6 +249,284 @@ class AsyncJob(Job):
             raise AsyncJobClearError(resp, request)
 
 
+def harvest_async_jobs(jobs, workers=4):
+    """Retrieve the results of finished async jobs in bulk.
+
+    Instead of querying the status of each job, the IDs of pending and
+    finished jobs are listed with two requests per host. The results of the
+    finished jobs are then retrieved concurrently and kept in the jobs, so
+    that their :func:`arango.job.AsyncJob.status` and
+    :func:`arango.job.AsyncJob.result` methods no longer contact the server.
+
+    Listing costs grow with the number of jobs stored on the server, not with
+    the number of jobs given. Hosts with at most **workers** of the given jobs
+    are therefore asked for the status of each job instead, concurrently.
+
+    Jobs which are neither pending nor finished on the server (e.g. jobs whose
+    results were already retrieved or cleared) are returned as well, without
+    results.
+
+    :param jobs: Async jobs.
+    :type jobs: [arango.job.AsyncJob]
+    :param workers: Max number of requests sent concurrently.
+    :type workers: int
+    :return: Jobs which are no longer pending.
+    :rtype: [arango.job.AsyncJob]
+    :raise arango.exceptions.AsyncJobListError: If listing jobs fails.
+    :raise arango.exceptions.AsyncJobStatusError: If a status query fails.
+    """
+    hosts = _group_by_host(job for job in jobs if not job._harvested)
+    finished = [job for job in jobs if job._harvested]
+    unfetched = []
+    for host_jobs in hosts.values():
+        if len(host_jobs) <= workers:
+            statuses = map_concurrently(_get_job_status, host_jobs, workers)
+            for job, status in zip(host_jobs, statuses):
+                if status == 'done':
+                    unfetched.append(job)
+                elif status is None:
+                    finished.append(job)
+            continue
+
+        conn, host_index = host_jobs[0]._conn, host_jobs[0]._host_index
+
+        # List pending jobs first, so jobs finishing in between are listed
+        # as done.
+        pending_ids = _list_async_jobs(conn, host_index, 'pending')
+        done_ids = _list_async_jobs(conn, host_index, 'done')
+        for job in host_jobs:
+            if job.id in done_ids:
+                unfetched.append(job)
+            elif job.id not in pending_ids:
+                finished.append(job)
+
+    def fetch(job):
+        try:
+            job._response = job._fetch()
+        except AsyncJobResultError as err:
+            job._error = err
+        except IOError:
+            # The job is left pending, so that it is harvested next time.
+            return None
+        job._harvested = True
+        return job
+
+    fetched = map_concurrently(fetch, unfetched, workers)
+    return finished + [job for job in fetched if job is not None]
+
+
+def _group_by_host(jobs):
+    """Group async jobs by the connection and host which accepted them.
+
+    :param jobs: Async jobs.
+    :type jobs: collections.Iterable[arango.job.AsyncJob]
+    :return: Jobs by connection ID and host index.
+    :rtype: collections.OrderedDict
+    """
+    groups = OrderedDict()
+    for job in jobs:
+        key = (id(job._conn), job._host_index)
+        groups.setdefault(key, []).append(job)
+    return groups
+
+
+def _get_job_status(job):
+    """Return the status of an async job on the server.
+
+    :param job: Async job.
+    :type job: arango.job.AsyncJob
+    :return: Job status ("pending" or "done"), or None if the job is not
+        found.
+    :rtype: str | unicode | None
+    :raise arango.exceptions.AsyncJobStatusError: If retrieval fails.
+    """
+    try:
+        return job.status()
+    except AsyncJobStatusError as err:
+        if err.error_code == 404:
+            return None
+        raise
+
+
+def _list_async_jobs(connection, host_index, status):
+    """Return IDs of async jobs with given status on a host.
+
+    :param connection: HTTP connection.
+    :type connection: arango.connection.Connection
+    :param host_index: Index of the host.
+    :type host_index: int
+    :param status: Job status ("pending" or "done").
+    :type status: str | unicode
+    :return: Job IDs.
+    :rtype: {str | unicode}
+    :raise arango.exceptions.AsyncJobListError: If retrieval fails.
+    """
+    request = Request(
+        method='get',
+        endpoint='/_api/job/{}'.format(status),
+        # The server returns at most 100 IDs unless told otherwise.
+        params={'count': 2 ** 31 - 1}
+    )
+    resp = connection.send_request(request, host_index)
+    if not resp.is_success:
+        raise AsyncJobListError(resp, request)
+    return set(resp.body)
+
+
+class _AsyncJobPoller(object):
+    """Resolves futures of async jobs in a background thread.
+
+    The thread is started when a future is requested, and stops once every
+    future is resolved. Jobs are polled separately per connection and host,
+    so that a failure only affects the futures of the jobs sent there. Polls
+    which fail with connection errors are retried with exponential backoff,
+    and the futures are resolved with the error once **max_retries** retries
+    fail. Other errors resolve the futures right away.
+
+    :param workers: Max number of results retrieved concurrently.
+    :type workers: int
+    :param min_interval: Min number of seconds between polls.
+    :type min_interval: int | float
+    :param max_interval: Max number of seconds between polls.
+    :type max_interval: int | float
+    :param max_retries: Max number of retries after connection errors.
+    :type max_retries: int
+    :param retry_delay: Number of seconds before the first retry. The delay
+        doubles with every retry.
+    :type retry_delay: int | float
+    """
+
+    def __init__(self,
+                 workers=4,
+                 min_interval=0.01,
+                 max_interval=1,
+                 max_retries=5,
+                 retry_delay=0.5):
+        self._workers = workers
+        self._min_interval = min_interval
+        self._max_interval = max_interval
+        self._max_retries = max_retries
+        self._retry_delay = retry_delay
+        self._lock = Lock()
+        self._wakeup = Event()
+        self._jobs = []
+        self._retries = {}
+        self._thread = None
+
+    def submit(self, job):
+        """Return the future of an async job, polling for it if new.
+
+        :param job: Async job.
+        :type job: arango.job.AsyncJob
+        :return: Future resolved with the job result.
+        :rtype: concurrent.futures.Future
+        """
+        from concurrent.futures import Future
+
+        with self._lock:
+            if job._future is None:
+                job._future = Future()
+                self._jobs.append(job)
+                self._wakeup.set()
+                if self._thread is None:
+                    self._thread = Thread(target=self._run)
+                    self._thread.daemon = True
+                    self._thread.start()
+            return job._future
+
+    def _run(self):
+        """Poll the server until every future is resolved."""
+        interval = self._min_interval
+        while True:
+            with self._lock:
+                self._jobs = [
+                    job for job in self._jobs if not job._future.cancelled()
+                ]
+                jobs = list(self._jobs)
+                if not jobs:
+                    self._thread = None
+                    return
+                self._wakeup.clear()
+
+            finished = self._poll(jobs)
+            if finished:
+                self._resolve(finished)
+                interval = self._min_interval
+            elif self._wakeup.wait(interval):
+                interval = self._min_interval
+            else:
+                interval = min(interval * 2, self._max_interval)
+
+    def _poll(self, jobs):
+        """Harvest the async jobs of each connection and host in turn.
+
+        :param jobs: Async jobs with unresolved futures.
+        :type jobs: [arango.job.AsyncJob]
+        :return: Finished async jobs.
+        :rtype: [arango.job.AsyncJob]
+        """
+        now = time.time()
+        groups = _group_by_host(jobs)
+        for key in list(self._retries):
+            if key not in groups:
+                del self._retries[key]
+
+        finished = []
+        for key, group in groups.items():
+            attempts, retry_at = self._retries.get(key, (0, now))
+            if retry_at > now:
+                continue
+            try:
+                finished.extend(harvest_async_jobs(group, self._workers))
+            except IOError as err:
+                if attempts < self._max_retries:
+                    delay = self._retry_delay * 2 ** attempts
+                    self._retries[key] = (attempts + 1, now + delay)
+                else:
+                    self._retries.pop(key, None)
+                    self._resolve(group, err)
+            except Exception as err:
+                # The jobs cannot be tracked any further (e.g. the database
+                # is gone).
+                self._retries.pop(key, None)
+                self._resolve(group, err)
+            else:
+                self._retries.pop(key, None)
+        return finished
+
+    def _resolve(self, jobs, error=None):
+        """Resolve the futures of async jobs.
+
+        :param jobs: Finished async jobs.
+        :type jobs: [arango.job.AsyncJob]
+        :param error: Exception to resolve the futures with instead of the
+            job results.
+        :type error: Exception
+        """
+        finished_ids = set(id(job) for job in jobs)
+        with self._lock:
+            self._jobs = [
+                job for job in self._jobs if id(job) not in finished_ids
+            ]
+
+        for job in jobs:
+            future = job._future
+            if not future.set_running_or_notify_cancel():
+                continue
+            if error is not None:
+                future.set_exception(error)
+                continue
+            try:
+                result = job.result()
+            except Exception as err:
+                future.set_exception(err)
+            else:
+                future.set_result(result)
+
+
+_poller = _AsyncJobPoller()
+
+
 class BatchJob(Job):
     """Job for tracking and retrieving result of batch execution.
 
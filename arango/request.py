@@ -3,6 +3,7 @@ from __future__ import absolute_import, unicode_literals
 __all__ = ['Request']
 
 import json
+from types import GeneratorType
 
 from six import moves, string_types
 
@@ -18,8 +19,12 @@ class Request(object):
     :type headers: dict
     :param params: URL parameters.
     :type params: dict
-    :param data: Request payload.
-    :type data: str | unicode | bool | int | list | dict
+    :param data: Request payload. File objects and generators are streamed
+        as is. Other values except strings and bytes are serialized into JSON
+        when the request is sent, or queued for batch execution (see
+        :func:`arango.request.Request.serialize`).
+    :type data: str | unicode | bytes | bool | int | list | dict | file |
+        types.GeneratorType
     :param command: ArangoSh command.
     :type command: str | unicode
     :param read: Names of collections read during transaction.
@@ -35,8 +40,13 @@ class Request(object):
     :vartype headers: dict
     :ivar params: URL (query) parameters.
     :vartype params: dict
-    :ivar data: Request payload.
-    :vartype data: str | unicode | bool | int | list | dict
+    :ivar data: Serialized request payload. If the request was not serialized
+        yet, the payload is serialized with the standard :mod:`json` module
+        (see :func:`arango.request.Request.data`).
+    :vartype data: str | unicode | bytes | file | types.GeneratorType | None
+    :ivar streamed: True if the payload is a file object or generator, which
+        is streamed to the server and can be sent only once.
+    :vartype streamed: bool
     :ivar command: ArangoSh command.
     :vartype command: str | unicode | None
     :ivar read: Names of collections read during transaction.
@@ -50,7 +60,9 @@ class Request(object):
         'endpoint',
         'headers',
         'params',
-        'data',
+        '_payload',
+        '_data',
+        'streamed',
         'command',
         'read',
         'write'
@@ -80,19 +92,49 @@ class Request(object):
                     params[key] = int(val)
         self.params = params
 
-        # Normalize the payload.
-        if data is None:
-            self.data = None
-        elif isinstance(data, string_types):
-            self.data = data
+        # Keep the payload as is until it is serialized.
+        self._payload = data
+        self.streamed = (
+            hasattr(data, 'read') or isinstance(data, GeneratorType)
+        )
+        if self.streamed or isinstance(data, (string_types, bytes)):
+            self._data = data
         else:
-            self.data = json.dumps(data)
+            self._data = None
 
         # Set the transaction metadata.
         self.command = command
         self.read = read
         self.write = write
 
+    @property
+    def data(self):
+        """Return the serialized request payload.
+
+        If the request was not serialized yet, the payload is serialized with
+        :func:`json.dumps`, but the result is not kept, so the request is still
+        serialized by the connection serializer when sent.
+
+        :return: Serialized payload, or None if the request has no payload.
+        :rtype: str | unicode | bytes | file | types.GeneratorType | None
+        """
+        if self._data is None and self._payload is not None:
+            return json.dumps(self._payload)
+        return self._data
+
+    def serialize(self, serializer):
+        """Serialize the request payload (once) and return it.
+
+        :param serializer: Callable which serializes a JSON-compatible object
+            into a string or bytes (e.g. :func:`json.dumps`).
+        :type serializer: callable
+        :return: Serialized payload, or None if the request has no payload.
+        :rtype: str | unicode | bytes | None
+        """
+        if self._data is None and self._payload is not None:
+            self._data = serializer(self._payload)
+        return self._data
+
     def __str__(self):
         """Return the request details in string form."""
         path = self.endpoint
@@ -102,6 +144,11 @@ class Request(object):
         if self.headers is not None:
             for key, value in sorted(self.headers.items()):
                 request_strings.append('{}: {}'.format(key, value))
-        if self.data is not None:
-            request_strings.append('\r\n{}'.format(self.data))
+        data = self.data
+        if self.streamed:
+            data = '<streamed>'
+        elif isinstance(data, bytes):
+            data = data.decode('utf-8')
+        if data is not None:
+            request_strings.append('\r\n{}'.format(data))
         return '\r\n'.join(request_strings)
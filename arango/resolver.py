@@ -0,0 +1,236 @@
+from __future__ import absolute_import, unicode_literals
+
+__all__ = [
+    'HostResolver',
+    'RoundRobinHostResolver',
+    'RandomHostResolver',
+    'LeastOutstandingHostResolver',
+]
+
+import random
+import time
+from threading import Lock
+
+
+class HostResolver(object):
+    """Base class for host resolvers.
+
+    Host resolvers pick the ArangoDB host (e.g. cluster coordinator) which
+    receives the next API request, and keep track of host health. Hosts are
+    marked down on connection errors and skipped until **recheck_interval**
+    seconds pass, after which they are re-probed before taking traffic again.
+
+    Resolvers are thread-safe and may be shared by many connections.
+
+    :param host_count: Number of hosts.
+    :type host_count: int
+    :param recheck_interval: Number of seconds a host is kept out of rotation
+        after a connection error before it is re-probed.
+    :type recheck_interval: int | float
+    """
+
+    def __init__(self, host_count, recheck_interval=30):
+        self._host_count = host_count
+        self._recheck_interval = recheck_interval
+        self._lock = Lock()
+        self._down_since = {}
+        self._outstanding = [0] * host_count
+
+    @property
+    def host_count(self):
+        """Return the number of hosts.
+
+        :return: Number of hosts.
+        :rtype: int
+        """
+        return self._host_count
+
+    def _choose(self, candidates):  # pragma: no cover
+        """Return the index of the host chosen for the next request.
+
+        This method must be overridden by subclasses. It is called with the
+        resolver lock held.
+
+        :param candidates: Indexes of the hosts to choose from (not empty).
+        :type candidates: [int]
+        :return: Host index.
+        :rtype: int
+        """
+        raise NotImplementedError
+
+    def get_host_index(self, exclude=()):
+        """Return the index of the host which receives the next request.
+
+        Healthy hosts are preferred. If all remaining hosts are marked down,
+        one of them is returned anyway as a last resort. The request is
+        recorded as outstanding on the host until
+        :func:`arango.resolver.HostResolver.release` is called.
+
+        :param exclude: Indexes of the hosts to skip (e.g. already tried).
+        :type exclude: set
+        :return: Host index.
+        :rtype: int
+        """
+        with self._lock:
+            remaining = [index for index in range(self._host_count)
+                         if index not in exclude]
+            healthy = [index for index in remaining
+                       if index not in self._down_since]
+            index = self._choose(healthy or remaining)
+            self._outstanding[index] += 1
+            return index
+
+    def acquire(self, index):
+        """Record a request sent to a specific host (e.g. cursor requests
+        which must go to the host that created the cursor).
+
+        :param index: Host index.
+        :type index: int
+        """
+        with self._lock:
+            self._outstanding[index] += 1
+
+    def release(self, index):
+        """Record a request to the host being completed.
+
+        :param index: Host index.
+        :type index: int
+        """
+        with self._lock:
+            self._outstanding[index] -= 1
+
+    def mark_down(self, index):
+        """Take the host out of rotation.
+
+        :param index: Host index.
+        :type index: int
+        """
+        with self._lock:
+            self._down_since[index] = time.time()
+
+    def mark_up(self, index):
+        """Put the host back into rotation.
+
+        :param index: Host index.
+        :type index: int
+        """
+        with self._lock:
+            self._down_since.pop(index, None)
+
+    def is_up(self, index):
+        """Check if the host is in rotation.
+
+        :param index: Host index.
+        :type index: int
+        :return: True if host is in rotation, False if marked down.
+        :rtype: bool
+        """
+        return index not in self._down_since
+
+    def hosts_to_probe(self):
+        """Return the indexes of down hosts which are due to be re-probed.
+
+        The hosts are claimed by the caller: they are not returned again until
+        another **recheck_interval** seconds pass.
+
+        :return: Host indexes.
+        :rtype: [int]
+        """
+        if not self._down_since:
+            return []
+        with self._lock:
+            now = time.time()
+            due = [index for index, since in self._down_since.items()
+                   if now - since >= self._recheck_interval]
+            for index in due:
+                self._down_since[index] = now
+            return due
+
+    def outstanding(self):
+        """Return the number of requests in flight per host.
+
+        :return: Number of outstanding requests by host index.
+        :rtype: [int]
+        """
+        with self._lock:
+            return list(self._outstanding)
+
+
+class RoundRobinHostResolver(HostResolver):
+    """Host resolver which cycles through the healthy hosts in order.
+
+    :param host_count: Number of hosts.
+    :type host_count: int
+    :param recheck_interval: Number of seconds a host is kept out of rotation
+        after a connection error before it is re-probed.
+    :type recheck_interval: int | float
+    """
+
+    def __init__(self, host_count, recheck_interval=30):
+        super(RoundRobinHostResolver, self).__init__(
+            host_count, recheck_interval)
+        self._next = 0
+
+    def _choose(self, candidates):
+        for index in candidates:
+            if index >= self._next:
+                break
+        else:
+            index = candidates[0]
+        self._next = (index + 1) % self._host_count
+        return index
+
+
+class RandomHostResolver(HostResolver):
+    """Host resolver which picks a healthy host at random.
+
+    :param host_count: Number of hosts.
+    :type host_count: int
+    :param recheck_interval: Number of seconds a host is kept out of rotation
+        after a connection error before it is re-probed.
+    :type recheck_interval: int | float
+    """
+
+    def _choose(self, candidates):
+        return random.choice(candidates)
+
+
+class LeastOutstandingHostResolver(HostResolver):
+    """Host resolver which picks the healthy host with the fewest requests
+    in flight.
+
+    :param host_count: Number of hosts.
+    :type host_count: int
+    :param recheck_interval: Number of seconds a host is kept out of rotation
+        after a connection error before it is re-probed.
+    :type recheck_interval: int | float
+    """
+
+    def _choose(self, candidates):
+        return min(candidates, key=self._outstanding.__getitem__)
+
+
+def get_host_resolver(resolver, host_count, recheck_interval):
+    """Return the host resolver for the given strategy.
+
+    :param resolver: Strategy name ("roundrobin", "random" or
+        "least_outstanding") or a host resolver, which is returned as is.
+    :type resolver: str | unicode | arango.resolver.HostResolver
+    :param host_count: Number of hosts.
+    :type host_count: int
+    :param recheck_interval: Number of seconds a host is kept out of rotation
+        after a connection error before it is re-probed.
+    :type recheck_interval: int | float
+    :return: Host resolver.
+    :rtype: arango.resolver.HostResolver
+    :raise ValueError: If the strategy name is unknown.
+    """
+    if isinstance(resolver, HostResolver):
+        return resolver
+    if resolver == 'roundrobin':
+        return RoundRobinHostResolver(host_count, recheck_interval)
+    if resolver == 'random':
+        return RandomHostResolver(host_count, recheck_interval)
+    if resolver == 'least_outstanding':
+        return LeastOutstandingHostResolver(host_count, recheck_interval)
+    raise ValueError('invalid host resolver: {}'.format(resolver))
@@ -4,6 +4,10 @@ __all__ = ['Response']
 
 import json
 
+from six import string_types
+
+from arango.velocypack import CONTENT_TYPE as VELOCYPACK_CONTENT_TYPE
+
 
 class Response(object):
     """HTTP response.
@@ -18,8 +22,16 @@ class Response(object):
     :type status_code: int
     :param status_text: Response status text.
     :type status_text: str | unicode
-    :param raw_body: Raw response body.
-    :type raw_body: str | unicode
+    :param raw_body: Raw response body. If given in bytes, it is decoded as
+        UTF-8 JSON, unless the content type is VelocyPack.
+    :type raw_body: str | unicode | bytes
+    :param keep_raw_body: If set to False, the raw body of successful JSON
+        responses is discarded once decoded, so only the decoded body stays in
+        memory. The raw body of failed or non-JSON responses is always kept.
+    :type keep_raw_body: bool
+    :param deserializer: Callable which deserializes the raw body (default:
+        :func:`json.loads`).
+    :type deserializer: callable
 
     :ivar method: HTTP method in lowercase (e.g. "post").
     :vartype method: str | unicode
@@ -31,16 +43,28 @@ class Response(object):
     :vartype status_code: int
     :ivar status_text: Response status text.
     :vartype status_text: str | unicode
-    :ivar body: JSON-deserialized response body.
+    :ivar body: JSON-deserialized response body. The raw body is deserialized
+        on first access of this attribute, **error_code** or
+        **error_message**.
     :vartype body: str | unicode | bool | int | list | dict
-    :ivar raw_body: Raw response body.
-    :vartype raw_body: str | unicode
+    :ivar raw_body: Raw response body (in bytes if the content type is
+        VelocyPack). If it was discarded (see parameter **keep_raw_body**), it
+        is re-serialized from the body with :func:`json.dumps` on access. This
+        is lossy: formatting and key order may differ from what the server
+        sent, and bodies which a custom deserializer turned into non-JSON
+        types (e.g. :class:`decimal.Decimal`) may fail to serialize.
+    :vartype raw_body: str | unicode | bytes
     :ivar error_code: Error code from ArangoDB server.
     :vartype error_code: int
     :ivar error_message: Error message from ArangoDB server.
     :vartype error_message: str | unicode
-    :ivar is_success: True if response status code was 2XX.
+    :ivar is_success: True if response status code was 2XX and the body does
+        not hold an error. Decided without deserializing the body, unless the
+        raw body mentions an error number.
     :vartype is_success: bool
+    :ivar host_index: Index of the host which sent the response, set by the
+        connection.
+    :vartype host_index: int | None
     """
 
     __slots__ = (
@@ -49,11 +73,15 @@ class Response(object):
         'headers',
         'status_code',
         'status_text',
-        'body',
-        'raw_body',
-        'error_code',
-        'error_message',
-        'is_success',
+        'host_index',
+        '_raw_body',
+        '_raw_body_dropped',
+        '_keep_raw_body',
+        '_deserializer',
+        '_parsed',
+        '_body',
+        '_error_code',
+        '_error_message',
     )
 
     def __init__(self,
@@ -62,27 +90,124 @@ class Response(object):
                  headers,
                  status_code,
                  status_text,
-                 raw_body):
+                 raw_body,
+                 keep_raw_body=True,
+                 deserializer=json.loads):
         self.method = method.lower()
         self.url = url
         self.headers = headers
         self.status_code = status_code
         self.status_text = status_text
-        self.raw_body = raw_body
+        self.host_index = None
+        self._raw_body = raw_body
+        self._raw_body_dropped = False
+        self._keep_raw_body = keep_raw_body
+        self._deserializer = deserializer
+        self._parsed = False
+        self._body = None
+        self._error_code = None
+        self._error_message = None
 
-        # De-serialize the response body.
+    def _parse(self):
+        """Deserialize the raw body and extract the error code and message.
+
+        Raw bodies in bytes are passed to the deserializer as is, so that no
+        decoded copy is held in memory alongside them. They are decoded only
+        if the deserializer rejects bytes or the body is not JSON.
+        """
+        keep_raw_body = self._keep_raw_body
         try:
-            self.body = json.loads(raw_body)
+            try:
+                self._body = self._deserializer(self._raw_body)
+            except TypeError:
+                if not self._decode_raw_body():
+                    raise
+                self._body = self._deserializer(self._raw_body)
         except (ValueError, TypeError):
-            self.body = raw_body
-
-        # Extract error code and message.
-        if isinstance(self.body, dict):
-            self.error_code = self.body.get('errorNum')
-            self.error_message = self.body.get('errorMessage')
-        else:
-            self.error_code = None
-            self.error_message = None
-
-        http_ok = 200 <= status_code < 300
-        self.is_success = http_ok and self.error_code is None
+            self._decode_raw_body()
+            self._body = self._raw_body
+            keep_raw_body = True
+
+        if isinstance(self._body, dict):
+            self._error_code = self._body.get('errorNum')
+            self._error_message = self._body.get('errorMessage')
+        self._parsed = True
+
+        if not keep_raw_body and self.is_success:
+            self._raw_body = None
+            self._raw_body_dropped = True
+
+    def _decode_raw_body(self):
+        """Decode the raw body from UTF-8 bytes, unless it is VelocyPack.
+
+        :return: True if the raw body was decoded.
+        :rtype: bool
+        """
+        if isinstance(self._raw_body, bytes) and not self._is_velocypack():
+            self._raw_body = self._raw_body.decode('utf-8')
+            return True
+        return False
+
+    def _is_velocypack(self):
+        """Check if the raw body is VelocyPack.
+
+        :return: True if the response content type is VelocyPack.
+        :rtype: bool
+        """
+        if not self.headers:
+            return False
+        content_type = self.headers.get('content-type')
+        return (
+            content_type is not None and
+            content_type.startswith(VELOCYPACK_CONTENT_TYPE)
+        )
+
+    @property
+    def body(self):
+        if not self._parsed:
+            self._parse()
+        return self._body
+
+    @property
+    def error_code(self):
+        if not self._parsed:
+            self._parse()
+        return self._error_code
+
+    @property
+    def error_message(self):
+        if not self._parsed:
+            self._parse()
+        return self._error_message
+
+    @property
+    def is_success(self):
+        if not 200 <= self.status_code < 300:
+            return False
+        if not self._parsed:
+            # ArangoDB reports errors with error numbers, so a body which
+            # does not mention one needs no deserializing to tell.
+            raw_body = self._raw_body
+            if isinstance(raw_body, bytes):
+                if self._is_velocypack():
+                    # VelocyPack strings are not quoted.
+                    if b'errorNum' not in raw_body:
+                        return True
+                elif b'"errorNum"' not in raw_body:
+                    return True
+            elif isinstance(raw_body, string_types):
+                if '"errorNum"' not in raw_body:
+                    return True
+        return self.error_code is None
+
+    @property
+    def raw_body(self):
+        if self._raw_body_dropped:
+            return json.dumps(self.body)
+        self._decode_raw_body()
+        return self._raw_body
+
+    @raw_body.setter
+    def raw_body(self, value):
+        self._raw_body = value
+        self._raw_body_dropped = False
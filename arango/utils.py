@@ -1,12 +1,22 @@
 from __future__ import absolute_import, unicode_literals
 
 import logging
+import re
 from contextlib import contextmanager
+from threading import Thread
+
+from six.moves import queue
 
 from six import string_types
 
 from arango.exceptions import DocumentParseError
 
+# AQL keywords of data-modification operations.
+_AQL_WRITE_PATTERN = re.compile(
+    r'\b(INSERT|UPDATE|REPLACE|REMOVE|UPSERT)\b',
+    re.IGNORECASE
+)
+
 
 @contextmanager
 def suppress_warning(logger_name):
@@ -53,6 +63,20 @@ def get_doc_id(doc):
         raise DocumentParseError('field "_id" required')
 
 
+def is_aql_write(query):
+    """Check if an AQL query may modify data.
+
+    The check is conservative: queries mentioning a data-modification
+    keyword anywhere (e.g. in a string) are considered writes.
+
+    :param query: Query text.
+    :type query: str | unicode
+    :return: True if the query may modify data.
+    :rtype: bool
+    """
+    return _AQL_WRITE_PATTERN.search(query) is not None
+
+
 def is_none_or_int(obj):
     """Check if obj is None or an integer.
 
@@ -73,3 +97,144 @@ def is_none_or_str(obj):
     :rtype: bool
     """
     return obj is None or isinstance(obj, string_types)
+
+
+def map_concurrently(func, items, workers):
+    """Apply a function to each item using a pool of threads.
+
+    :param func: Function to apply.
+    :type func: callable
+    :param items: Items to apply the function to.
+    :type items: list
+    :param workers: Max number of threads. If 1 or less, the function is
+        applied in the calling thread.
+    :type workers: int
+    :return: Results in the order of the items.
+    :rtype: list
+    :raise Exception: The first exception raised by the function (in the
+        order of the items). Remaining items are skipped once it is raised.
+    """
+    if workers <= 1 or len(items) <= 1:
+        return [func(item) for item in items]
+
+    results = [None] * len(items)
+    errors = []
+    indexes = queue.Queue()
+    for index in range(len(items)):
+        indexes.put(index)
+
+    def work():
+        while not errors:
+            try:
+                index = indexes.get_nowait()
+            except queue.Empty:
+                return
+            try:
+                results[index] = func(items[index])
+            except Exception as err:
+                errors.append((index, err))
+
+    threads = [Thread(target=work) for _ in range(min(workers, len(items)))]
+    for thread in threads:
+        thread.daemon = True
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    if errors:
+        raise min(errors, key=lambda error: error[0])[1]
+    return results
+
+
+def parse_multipart(body, boundary):
+    """Parse a multipart batch API response body.
+
+    Each part of a batch API response wraps a full HTTP response. The body is
+    scanned once, part by part, and only the headers and body of each wrapped
+    response are sliced out of it. Part bodies may contain any characters
+    (including CRLF) except the multipart delimiter.
+
+    :param body: Multipart response body.
+    :type body: str | unicode | bytes
+    :param boundary: Multipart boundary.
+    :type boundary: str | unicode
+    :return: Generator of part headers, status code, status text, headers and
+        body of each wrapped response. Header names are in lowercase. Bodies
+        are of the same type as **body**. Nothing is generated if the body
+        contains no boundary.
+    :rtype: collections.Iterable[(dict, int, str | unicode, dict,
+        str | unicode | bytes)]
+    :raise ValueError: If the body is malformed.
+    """
+    if isinstance(body, bytes):
+        boundary = boundary.encode('utf-8')
+        crlf, blank_line, dashes = b'\r\n', b'\r\n\r\n', b'--'
+    else:
+        crlf, blank_line, dashes = '\r\n', '\r\n\r\n', '--'
+    delimiter = crlf + dashes + boundary
+
+    # The first delimiter need not be preceded by a line break.
+    pos = body.find(dashes + boundary)
+    if pos == -1:
+        return
+    pos += len(dashes + boundary)
+
+    while not body.startswith(dashes, pos):
+        # Part headers, e.g. "Content-Id"
+        part_start = body.find(crlf, pos) + len(crlf)
+        part_end = body.find(blank_line, part_start - len(crlf))
+        if part_start < len(crlf) or part_end == -1:
+            raise ValueError('malformed multipart part')
+        part_headers = _parse_headers(body[part_start:part_end], crlf)
+
+        # Wrapped response status line and headers
+        status_start = part_end + len(blank_line)
+        head_end = body.find(blank_line, status_start)
+        if head_end == -1:
+            raise ValueError('malformed multipart part')
+        status_end = body.find(crlf, status_start, head_end)
+        if status_end == -1:
+            status_end = head_end
+        status_line = body[status_start:status_end]
+        if isinstance(status_line, bytes):
+            status_line = status_line.decode('utf-8')
+        status = status_line.split(' ', 2)
+        status_code = int(status[1])
+        status_text = status[2] if len(status) > 2 else ''
+        headers = _parse_headers(body[status_end:head_end], crlf)
+
+        # Wrapped response body, which ends at the next delimiter
+        body_start = head_end + len(blank_line)
+        body_end = body.find(delimiter, body_start)
+        if body_end == -1:
+            raise ValueError('multipart close delimiter not found')
+
+        yield (
+            part_headers,
+            status_code,
+            status_text,
+            headers,
+            body[body_start:body_end]
+        )
+        pos = body_end + len(delimiter)
+
+
+def _parse_headers(raw_headers, crlf):
+    """Parse HTTP header lines.
+
+    :param raw_headers: Header lines.
+    :type raw_headers: str | unicode | bytes
+    :param crlf: Line break, of the same type as **raw_headers**.
+    :type crlf: str | unicode | bytes
+    :return: Headers with lowercase names.
+    :rtype: dict
+    """
+    if isinstance(raw_headers, bytes):
+        raw_headers = raw_headers.decode('utf-8')
+        crlf = crlf.decode('utf-8')
+    headers = {}
+    for line in raw_headers.split(crlf):
+        name, sep, value = line.partition(':')
+        if sep:
+            headers[name.strip().lower()] = value.strip()
+    return headers
@@ -0,0 +1,473 @@
+"""Pure Python VelocyPack encoder and decoder.
+
+VelocyPack is the binary serialization format ArangoDB uses internally (see
+https://github.com/arangodb/velocypack). Pass this module (or any object with
+compatible ``dumps`` and ``loads`` functions, such as an accelerated backend)
+as the **velocypack** parameter of :class:`arango.client.ArangoClient` to
+exchange document and cursor API payloads in VelocyPack instead of JSON.
+
+Values are encoded with the JSON-compatible subset of the format, using
+compact arrays and objects. All value types except BCD numbers can be
+decoded, including indexed arrays and objects, and object keys translated
+to integers by the server (e.g. "_key").
+"""
+from __future__ import absolute_import, unicode_literals
+
+__all__ = ['CONTENT_TYPE', 'dumps', 'loads', 'loads_prefix']
+
+import struct
+
+from six import PY2, integer_types, text_type
+
+CONTENT_TYPE = 'application/x-velocypack'
+
+# Object keys the server translates to small integers.
+_TRANSLATED_KEYS = {1: '_key', 2: '_rev', 3: '_id', 4: '_from', 5: '_to'}
+
+# Width of the byte length (and item count) fields of indexed arrays and
+# objects by head byte.
+_WIDTHS = {
+    0x02: 1, 0x03: 2, 0x04: 4, 0x05: 8,
+    0x06: 1, 0x07: 2, 0x08: 4, 0x09: 8,
+    0x0b: 1, 0x0c: 2, 0x0d: 4, 0x0e: 8,
+    0x0f: 1, 0x10: 2, 0x11: 4, 0x12: 8,
+}
+
+_UINT_FORMATS = {1: '<B', 2: '<H', 4: '<I', 8: '<Q'}
+
+_pack_double = struct.Struct('<d').pack
+_unpack_double = struct.Struct('<d').unpack_from
+_pack_uint64 = struct.Struct('<Q').pack
+
+
+def dumps(obj):
+    """Serialize a JSON-compatible object into VelocyPack.
+
+    :param obj: Object to serialize (None, bool, int, float, string, list,
+        tuple or dict with string keys). Bytes are serialized as binary
+        values on Python 3.
+    :type obj: object
+    :return: Serialized object.
+    :rtype: bytes
+    :raise TypeError: If the object (or a nested value) is not serializable.
+    :raise ValueError: If an integer does not fit into 64 bits.
+    """
+    buffer = bytearray()
+    _encode(obj, buffer)
+    return bytes(buffer)
+
+
+def loads(data):
+    """Deserialize a VelocyPack value.
+
+    :param data: Serialized value.
+    :type data: bytes | bytearray
+    :return: Deserialized value.
+    :rtype: str | unicode | bool | int | float | list | dict | bytes | None
+    :raise ValueError: If the data is malformed or holds unsupported types.
+    """
+    return loads_prefix(data)[0]
+
+
+def loads_prefix(data):
+    """Deserialize the VelocyPack value at the start of data which may be
+    followed by other bytes (e.g. a VelocyStream message body).
+
+    :param data: Serialized value followed by other bytes.
+    :type data: bytes | bytearray
+    :return: Deserialized value and its byte size.
+    :rtype: (object, int)
+    :raise ValueError: If the data is malformed or holds unsupported types.
+    """
+    if not isinstance(data, bytearray):
+        data = bytearray(data)
+    if not data:
+        raise ValueError('empty VelocyPack value')
+    try:
+        size = _size(data, 0)
+        if size > len(data):
+            raise IndexError
+        return _decode(data, 0), size
+    except (IndexError, struct.error):
+        raise ValueError('truncated VelocyPack value')
+
+
+def _varint(value):
+    """Encode an unsigned integer as a variable-length integer.
+
+    :param value: Unsigned integer.
+    :type value: int
+    :return: Encoded integer, 7 bits per byte with the lowest bits first.
+    :rtype: bytearray
+    """
+    encoded = bytearray()
+    while value >= 0x80:
+        encoded.append((value & 0x7f) | 0x80)
+        value >>= 7
+    encoded.append(value)
+    return encoded
+
+
+def _encode_compound(head, payload, count, buffer):
+    """Append a compact array or object to the buffer.
+
+    :param head: Head byte (0x13 for arrays, 0x14 for objects).
+    :type head: int
+    :param payload: Encoded items (or key and value pairs).
+    :type payload: bytearray
+    :param count: Number of items (or pairs).
+    :type count: int
+    :param buffer: Output buffer.
+    :type buffer: bytearray
+    """
+    count_bytes = _varint(count)
+    count_bytes.reverse()
+    base = 1 + len(payload) + len(count_bytes)
+
+    # The byte length includes its own variable-length encoding.
+    length = base + 1
+    while base + len(_varint(length)) != length:
+        length = base + len(_varint(length))
+
+    buffer.append(head)
+    buffer += _varint(length)
+    buffer += payload
+    buffer += count_bytes
+
+
+def _encode_string(value, buffer):
+    """Append a string to the buffer.
+
+    :param value: String.
+    :type value: str | unicode
+    :param buffer: Output buffer.
+    :type buffer: bytearray
+    """
+    encoded = value.encode('utf-8')
+    length = len(encoded)
+    if length <= 126:
+        buffer.append(0x40 + length)
+    else:
+        buffer.append(0xbf)
+        buffer += _pack_uint64(length)
+    buffer += encoded
+
+
+def _encode(obj, buffer):
+    """Append a value to the buffer.
+
+    :param obj: Value to encode.
+    :type obj: object
+    :param buffer: Output buffer.
+    :type buffer: bytearray
+    """
+    if obj is None:
+        buffer.append(0x18)
+    elif obj is True:
+        buffer.append(0x1a)
+    elif obj is False:
+        buffer.append(0x19)
+    elif isinstance(obj, text_type):
+        _encode_string(obj, buffer)
+    elif isinstance(obj, bytes):
+        if PY2:
+            _encode_string(obj.decode('utf-8'), buffer)
+        else:
+            length = len(obj)
+            size = _uint_size(length)
+            buffer.append(0xbf + size)
+            buffer += _pack_uint(length, size)
+            buffer += obj
+    elif isinstance(obj, integer_types):
+        if 0 <= obj <= 9:
+            buffer.append(0x30 + obj)
+        elif -6 <= obj < 0:
+            buffer.append(0x40 + obj)
+        elif obj > 0:
+            if obj >= 1 << 64:
+                raise ValueError('integer too large: {}'.format(obj))
+            size = _uint_size(obj)
+            buffer.append(0x27 + size)
+            buffer += _pack_uint(obj, size)
+        else:
+            if obj < -(1 << 63):
+                raise ValueError('integer too small: {}'.format(obj))
+            size = 1
+            while obj < -(1 << (8 * size - 1)):
+                size += 1
+            buffer.append(0x1f + size)
+            buffer += _pack_uint(obj + (1 << (8 * size)), size)
+    elif isinstance(obj, float):
+        buffer.append(0x1b)
+        buffer += _pack_double(obj)
+    elif isinstance(obj, dict):
+        if not obj:
+            buffer.append(0x0a)
+            return
+        payload = bytearray()
+        for key, value in obj.items():
+            if not isinstance(key, (text_type, bytes)):
+                raise TypeError('object keys must be strings, not {!r}'
+                                .format(key))
+            if isinstance(key, bytes):
+                key = key.decode('utf-8')
+            _encode_string(key, payload)
+            _encode(value, payload)
+        _encode_compound(0x14, payload, len(obj), buffer)
+    elif isinstance(obj, (list, tuple)):
+        if not obj:
+            buffer.append(0x01)
+            return
+        payload = bytearray()
+        for value in obj:
+            _encode(value, payload)
+        _encode_compound(0x13, payload, len(obj), buffer)
+    else:
+        raise TypeError('{!r} is not VelocyPack serializable'.format(obj))
+
+
+def _uint_size(value):
+    """Return the number of bytes needed by an unsigned integer.
+
+    :param value: Unsigned integer.
+    :type value: int
+    :return: Number of bytes (1 to 8).
+    :rtype: int
+    """
+    size = 1
+    while value >> (8 * size):
+        size += 1
+    return size
+
+
+def _pack_uint(value, size):
+    """Encode an unsigned integer in little-endian order.
+
+    :param value: Unsigned integer.
+    :type value: int
+    :param size: Number of bytes.
+    :type size: int
+    :return: Encoded integer.
+    :rtype: bytearray
+    """
+    return bytearray((value >> (8 * index)) & 0xff for index in range(size))
+
+
+def _read_uint(data, pos, size):
+    """Decode an unsigned little-endian integer.
+
+    :param data: Serialized data.
+    :type data: bytearray
+    :param pos: Position of the integer.
+    :type pos: int
+    :param size: Number of bytes.
+    :type size: int
+    :return: Decoded integer.
+    :rtype: int
+    """
+    fmt = _UINT_FORMATS.get(size)
+    if fmt is not None:
+        return struct.unpack_from(fmt, data, pos)[0]
+    value = 0
+    for index in range(size - 1, -1, -1):
+        value = (value << 8) | data[pos + index]
+    return value
+
+
+def _read_varint(data, pos, step):
+    """Decode a variable-length integer.
+
+    :param data: Serialized data.
+    :type data: bytearray
+    :param pos: Position of the first byte.
+    :type pos: int
+    :param step: Direction of the bytes: 1 for forward, -1 for reversed.
+    :type step: int
+    :return: Decoded integer and its number of bytes.
+    :rtype: (int, int)
+    """
+    value = 0
+    shift = 0
+    count = 0
+    while True:
+        byte = data[pos]
+        value |= (byte & 0x7f) << shift
+        count += 1
+        if byte < 0x80:
+            return value, count
+        shift += 7
+        pos += step
+
+
+def _size(data, pos):
+    """Return the byte size of a value.
+
+    :param data: Serialized data.
+    :type data: bytearray
+    :param pos: Position of the value.
+    :type pos: int
+    :return: Byte size of the value.
+    :rtype: int
+    """
+    head = data[pos]
+    if 0x40 <= head <= 0xbe:
+        return head - 0x3f
+    if 0x30 <= head <= 0x3f or head in (0x01, 0x0a) or 0x17 <= head <= 0x1a:
+        return 1
+    if head in (0x1b, 0x1c):
+        return 9
+    if 0x20 <= head <= 0x27:
+        return head - 0x1e
+    if 0x28 <= head <= 0x2f:
+        return head - 0x26
+    if head in _WIDTHS:
+        return _read_uint(data, pos + 1, _WIDTHS[head])
+    if head in (0x13, 0x14):
+        return _read_varint(data, pos + 1, 1)[0]
+    if head == 0xbf:
+        return 9 + _read_uint(data, pos + 1, 8)
+    if 0xc0 <= head <= 0xc7:
+        size = head - 0xbf
+        return 1 + size + _read_uint(data, pos + 1, size)
+    if head in (0x1e, 0x1f):
+        return 1
+    if head == 0xee:
+        return 2 + _size(data, pos + 2)
+    if head == 0xef:
+        return 9 + _size(data, pos + 9)
+    raise ValueError('unsupported VelocyPack type 0x{:02x}'.format(head))
+
+
+def _decode_key(data, pos):
+    """Decode an object key.
+
+    :param data: Serialized data.
+    :type data: bytearray
+    :param pos: Position of the key.
+    :type pos: int
+    :return: Decoded key.
+    :rtype: str | unicode
+    """
+    head = data[pos]
+    if 0x40 <= head <= 0xbe:
+        return data[pos + 1:pos + head - 0x3f].decode('utf-8')
+    key = _decode(data, pos)
+    if isinstance(key, integer_types):
+        try:
+            return _TRANSLATED_KEYS[key]
+        except KeyError:
+            raise ValueError('unknown translated key {}'.format(key))
+    return key
+
+
+def _decode(data, pos):
+    """Decode a value.
+
+    :param data: Serialized data.
+    :type data: bytearray
+    :param pos: Position of the value.
+    :type pos: int
+    :return: Decoded value.
+    :rtype: str | unicode | bool | int | float | list | dict | bytes | None
+    """
+    head = data[pos]
+
+    if 0x40 <= head <= 0xbe:
+        return data[pos + 1:pos + head - 0x3f].decode('utf-8')
+    if 0x30 <= head <= 0x39:
+        return head - 0x30
+    if 0x3a <= head <= 0x3f:
+        return head - 0x40
+    if head == 0x18:
+        return None
+    if head == 0x1a:
+        return True
+    if head == 0x19:
+        return False
+    if head == 0x1b:
+        return _unpack_double(data, pos + 1)[0]
+    if 0x28 <= head <= 0x2f:
+        return _read_uint(data, pos + 1, head - 0x27)
+    if 0x20 <= head <= 0x27:
+        size = head - 0x1f
+        value = _read_uint(data, pos + 1, size)
+        if value >= 1 << (8 * size - 1):
+            value -= 1 << (8 * size)
+        return value
+    if head == 0xbf:
+        length = _read_uint(data, pos + 1, 8)
+        return data[pos + 9:pos + 9 + length].decode('utf-8')
+    if head == 0x01:
+        return []
+    if head == 0x0a:
+        return {}
+
+    if head == 0x13 or head == 0x14:
+        length, length_size = _read_varint(data, pos + 1, 1)
+        end = pos + length
+        count, count_size = _read_varint(data, end - 1, -1)
+        item = pos + 1 + length_size
+        if head == 0x13:
+            result = []
+            for _ in range(count):
+                result.append(_decode(data, item))
+                item += _size(data, item)
+            return result
+        result = {}
+        for _ in range(count):
+            key = _decode_key(data, item)
+            item += _size(data, item)
+            result[key] = _decode(data, item)
+            item += _size(data, item)
+        return result
+
+    if 0x02 <= head <= 0x05:
+        # Array of equally sized items without an index table. Zero bytes
+        # may pad the header.
+        width = _WIDTHS[head]
+        end = pos + _read_uint(data, pos + 1, width)
+        item = pos + 1 + width
+        while item < end and data[item] == 0x00:
+            item += 1
+        result = []
+        while item < end:
+            result.append(_decode(data, item))
+            item += _size(data, item)
+        return result
+
+    if 0x06 <= head <= 0x09 or 0x0b <= head <= 0x12:
+        width = _WIDTHS[head]
+        end = pos + _read_uint(data, pos + 1, width)
+        if head in (0x09, 0x0e, 0x12):
+            # With 8-byte widths, the item count follows the index table.
+            count = _read_uint(data, end - 8, 8)
+            table = end - 8 - count * 8
+        else:
+            count = _read_uint(data, pos + 1 + width, width)
+            table = end - count * width
+        offsets = [
+            _read_uint(data, table + index * width, width)
+            for index in range(count)
+        ]
+        if head <= 0x09:
+            return [_decode(data, pos + offset) for offset in offsets]
+        result = {}
+        for offset in offsets:
+            key = pos + offset
+            result[_decode_key(data, key)] = _decode(
+                data, key + _size(data, key))
+        return result
+
+    if 0xc0 <= head <= 0xc7:
+        size = head - 0xbf
+        length = _read_uint(data, pos + 1, size)
+        start = pos + 1 + size
+        return bytes(data[start:start + length])
+    if head == 0x1c:
+        # UTC date in milliseconds since the epoch.
+        return struct.unpack_from('<q', data, pos + 1)[0]
+    if head == 0xee:
+        return _decode(data, pos + 2)
+    if head == 0xef:
+        return _decode(data, pos + 9)
+    raise ValueError('unsupported VelocyPack type 0x{:02x}'.format(head))
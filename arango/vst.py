@@ -0,0 +1,483 @@
+from __future__ import absolute_import, unicode_literals
+
+__all__ = ['VelocyStreamClient']
+
+import json
+import socket
+import ssl
+import struct
+from itertools import count
+from threading import Event, Lock, Thread
+
+from six import text_type
+from six.moves.http_client import responses
+from six.moves.urllib.parse import unquote, urlsplit
+
+from arango import velocypack
+from arango.http import HTTPClient
+from arango.response import Response
+
+# Handshake which selects VelocyStream 1.1 on a fresh connection.
+_VST_HANDSHAKE = b'VST/1.1\r\n\r\n'
+
+# Chunk header: chunk length, chunk index and flags, message ID and message
+# length (all little endian).
+_CHUNK_HEADER = struct.Struct('<IIQQ')
+
+# VelocyStream request types by HTTP method.
+_REQUEST_TYPES = {
+    'delete': 0,
+    'get': 1,
+    'post': 2,
+    'put': 3,
+    'head': 4,
+    'patch': 5,
+    'options': 6,
+}
+
+
+class VelocyStreamClient(HTTPClient):
+    """HTTP client which speaks the VelocyStream (VST) protocol.
+
+    Requests are sent as VelocyStream messages tagged with message IDs, so any
+    number of requests from concurrent threads are multiplexed over a few TCP
+    connections per host, and responses are matched to requests in whatever
+    order the server sends them. Host URLs keep the "http" (plain TCP) or
+    "https" (TLS) scheme.
+
+    Request and response bodies are JSON unless the caller asks for
+    VelocyPack (see parameter **velocypack** of
+    :class:`arango.client.ArangoClient`). Batch requests are not supported by
+    the VelocyStream protocol.
+
+    :param max_connections: Max number of TCP connections per host and
+        credentials. A new connection is opened only when all open ones have
+        requests in flight.
+    :type max_connections: int
+    :param chunk_size: Max size in bytes of the chunks which request messages
+        are split into.
+    :type chunk_size: int
+    :param timeout: Number of seconds to wait for connecting and for each
+        response. If not set, requests wait indefinitely.
+    :type timeout: int | float
+    :param ssl_context: SSL context for "https" hosts. If not set, the default
+        context is used.
+    :type ssl_context: ssl.SSLContext
+    :param keep_raw_body: If set to False, the raw text of successful
+        responses is not kept around (see :class:`arango.response.Response`).
+    :type keep_raw_body: bool
+    :param deserializer: Callable which deserializes JSON response bodies
+        (default: :func:`json.loads`).
+    :type deserializer: callable
+    """
+
+    def __init__(self,
+                 max_connections=2,
+                 chunk_size=30000,
+                 timeout=None,
+                 ssl_context=None,
+                 keep_raw_body=True,
+                 deserializer=json.loads):
+        self._max_connections = max_connections
+        self._chunk_size = chunk_size
+        self._timeout = timeout
+        self._ssl_context = ssl_context
+        self._keep_raw_body = keep_raw_body
+        self._deserializer = deserializer
+        self._message_ids = count(1)
+        self._lock = Lock()
+        self._pools = {}
+
+    def pool_metrics(self):
+        """Return live connection metrics summed across all hosts.
+
+        :return: Number of open TCP connections ("connections"), requests
+            waiting for their responses ("in_flight"), and the number of host
+            and credential pools ("pools").
+        :rtype: dict
+        """
+        with self._lock:
+            pools = list(self._pools.values())
+        connections = [conn for pool in pools for conn in pool if conn.alive]
+        return {
+            'connections': len(connections),
+            'in_flight': sum(conn.in_flight for conn in connections),
+            'pools': len(pools),
+        }
+
+    def close(self):
+        """Close all open connections.
+
+        Requests in flight fail with :class:`socket.error`.
+        """
+        with self._lock:
+            pools, self._pools = self._pools, {}
+        for pool in pools.values():
+            for conn in pool:
+                conn.close()
+
+    def send_request(self,
+                     method,
+                     url,
+                     params=None,
+                     data=None,
+                     headers=None,
+                     auth=None):
+        """Send a request over VelocyStream.
+
+        :param method: HTTP method in lowercase (e.g. "post").
+        :type method: str | unicode
+        :param url: Request URL.
+        :type url: str | unicode
+        :param headers: Request headers.
+        :type headers: dict
+        :param params: URL (query) parameters.
+        :type params: dict
+        :param data: Request payload.
+        :type data: str | unicode | bytes | file | types.GeneratorType
+        :param auth: Username and password.
+        :type auth: tuple
+        :returns: HTTP response.
+        :rtype: arango.response.Response
+        :raise socket.error: If the connection fails or the response does not
+            arrive in time.
+        """
+        split = urlsplit(url)
+        database, path = '_system', split.path or '/'
+        if path.startswith('/_db/'):
+            database, _, path = path[5:].partition('/')
+            database, path = unquote(database), '/' + path
+
+        meta = {}
+        for key, value in (headers or {}).items():
+            meta[key.lower()] = text_type(value)
+        meta.setdefault('accept', 'application/json')
+        body = _to_bytes(data)
+        if body:
+            # The server reads bodies without a content type as VelocyPack.
+            meta.setdefault('content-type', 'application/json')
+
+        parameters = {}
+        for key, value in (params or {}).items():
+            if value is not None:
+                parameters[key] = text_type(value)
+
+        header = velocypack.dumps([
+            1,
+            1,
+            database,
+            _REQUEST_TYPES[method.lower()],
+            path,
+            parameters,
+            meta,
+        ])
+        message = header + body
+
+        host = (split.scheme, split.hostname, split.port, auth)
+        response_header, body = self._connection(host).send(
+            message, next(self._message_ids), self._timeout)
+
+        status_code = response_header[2]
+        resp_headers = {}
+        if len(response_header) > 3:
+            resp_headers.update(response_header[3])
+        deserializer = self._deserializer
+        if not body:
+            raw_body = ''
+        elif resp_headers.setdefault(
+                'content-type', velocypack.CONTENT_TYPE
+        ).startswith(velocypack.CONTENT_TYPE):
+            raw_body = body
+            deserializer = velocypack.loads
+        elif self._keep_raw_body:
+            raw_body = body.decode('utf-8')
+        else:
+            raw_body = body
+
+        return Response(
+            method=method,
+            url=url,
+            headers=resp_headers,
+            status_code=status_code,
+            status_text=responses.get(status_code, ''),
+            raw_body=raw_body,
+            keep_raw_body=self._keep_raw_body,
+            deserializer=deserializer
+        )
+
+    def _connection(self, host):
+        """Return a connection to send the next request over.
+
+        An idle connection is preferred. Otherwise a new one is opened, unless
+        **max_connections** are open already, in which case the one with the
+        fewest requests in flight is picked.
+
+        :param host: Scheme, hostname, port and credentials.
+        :type host: tuple
+        :return: Open connection.
+        :rtype: arango.vst._Connection
+        """
+        with self._lock:
+            pool = [
+                conn for conn in self._pools.get(host, []) if conn.alive
+            ]
+            self._pools[host] = pool
+            conn = min(pool, key=lambda c: c.in_flight) if pool else None
+            if conn is not None and (
+                    conn.in_flight == 0 or
+                    len(pool) >= self._max_connections):
+                return conn
+            conn = _Connection(host, self._chunk_size)
+            pool.append(conn)
+
+        try:
+            conn.open(self._timeout, self._ssl_context)
+        except Exception:
+            conn.close()
+            raise
+        return conn
+
+
+class _Connection(object):
+    """TCP connection which multiplexes VelocyStream messages.
+
+    :param host: Scheme, hostname, port and credentials.
+    :type host: tuple
+    :param chunk_size: Max size in bytes of outgoing chunks.
+    :type chunk_size: int
+    """
+
+    def __init__(self, host, chunk_size):
+        self._host = host
+        self._chunk_size = chunk_size
+        self._socket = None
+        self._send_lock = Lock()
+        self._lock = Lock()
+        self._pending = {}
+        self._opened = Event()
+        self._error = socket.error('connection closed')
+        self.alive = True
+
+    @property
+    def in_flight(self):
+        """Return the number of requests waiting for their responses.
+
+        :return: Number of requests in flight.
+        :rtype: int
+        """
+        return len(self._pending)
+
+    def open(self, timeout, ssl_context):
+        """Connect, select VelocyStream 1.1 and authenticate.
+
+        Requests sent over the connection meanwhile wait until it is open.
+
+        :param timeout: Connect timeout in seconds.
+        :type timeout: int | float
+        :param ssl_context: SSL context for "https" hosts.
+        :type ssl_context: ssl.SSLContext
+        :raise socket.error: If the connection or authentication fails.
+        """
+        scheme, hostname, port, auth = self._host
+        sock = socket.create_connection((hostname, port or 8529), timeout)
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        if scheme == 'https':
+            context = ssl_context or ssl.create_default_context()
+            sock = context.wrap_socket(sock, server_hostname=hostname)
+        sock.settimeout(None)
+        sock.sendall(_VST_HANDSHAKE)
+        self._socket = sock
+
+        reader = Thread(target=self._read_loop)
+        reader.daemon = True
+        reader.start()
+
+        if auth is not None:
+            message = velocypack.dumps([1, 1000, 'plain', auth[0], auth[1]])
+            header, _ = self._exchange(message, 0, timeout)
+            if header[2] != 200:
+                raise socket.error(
+                    'VelocyStream authentication failed ({})'.format(
+                        header[2]))
+        self._opened.set()
+
+    def send(self, message, message_id, timeout):
+        """Send a message and wait for the response message.
+
+        :param message: Serialized message.
+        :type message: bytes
+        :param message_id: Message ID unique to the connection.
+        :type message_id: int
+        :param timeout: Number of seconds to wait for the response.
+        :type timeout: int | float
+        :return: Response message header and body.
+        :rtype: (list, bytes)
+        :raise socket.error: If the connection fails or the response does not
+            arrive in time.
+        """
+        if not self._opened.wait(timeout):
+            raise socket.timeout('VelocyStream connection timed out')
+        return self._exchange(message, message_id, timeout)
+
+    def _exchange(self, message, message_id, timeout):
+        """Split a message into chunks, send them and wait for the response.
+
+        :param message: Serialized message.
+        :type message: bytes
+        :param message_id: Message ID unique to the connection.
+        :type message_id: int
+        :param timeout: Number of seconds to wait for the response.
+        :type timeout: int | float
+        :return: Response message header and body.
+        :rtype: (list, bytes)
+        :raise socket.error: If the connection fails or the response does not
+            arrive in time.
+        """
+        pending = _PendingMessage()
+        with self._lock:
+            if not self.alive:
+                raise self._error
+            self._pending[message_id] = pending
+            sock = self._socket
+
+        size = self._chunk_size
+        total = max(1, -(-len(message) // size))
+        chunks = []
+        for index in range(total):
+            payload = message[index * size:(index + 1) * size]
+            chunk_x = (total << 1) | 1 if index == 0 else index << 1
+            chunks.append(_CHUNK_HEADER.pack(
+                _CHUNK_HEADER.size + len(payload),
+                chunk_x,
+                message_id,
+                len(message)
+            ))
+            chunks.append(payload)
+        try:
+            with self._send_lock:
+                sock.sendall(b''.join(chunks))
+        except socket.error as err:
+            self._fail(err)
+
+        if not pending.done.wait(timeout):
+            with self._lock:
+                self._pending.pop(message_id, None)
+            raise socket.timeout('VelocyStream response timed out')
+        if pending.error is not None:
+            raise pending.error
+        header, header_size = velocypack.loads_prefix(pending.message)
+        return header, pending.message[header_size:]
+
+    def close(self):
+        """Close the connection and fail the requests in flight."""
+        self._fail(socket.error('connection closed'))
+
+    def _fail(self, error):
+        """Mark the connection dead and fail the requests in flight.
+
+        :param error: Error raised to callers waiting for responses.
+        :type error: socket.error
+        """
+        with self._lock:
+            if not self.alive:
+                return
+            self.alive = False
+            self._error = error
+            pending, self._pending = self._pending, {}
+        self._opened.set()
+        sock, self._socket = self._socket, None
+        if sock is not None:
+            try:
+                sock.shutdown(socket.SHUT_RDWR)
+            except socket.error:
+                pass
+            sock.close()
+        for message in pending.values():
+            message.error = error
+            message.done.set()
+
+    def _read_loop(self):
+        """Read chunks and hand complete messages over to waiting callers."""
+        sock = self._socket
+        header_size = _CHUNK_HEADER.size
+        try:
+            while True:
+                length, chunk_x, message_id, _ = _CHUNK_HEADER.unpack(
+                    _recv_exactly(sock, header_size))
+                payload = _recv_exactly(sock, length - header_size)
+                with self._lock:
+                    pending = self._pending.get(message_id)
+                if pending is None:
+                    continue  # The caller timed out.
+
+                if chunk_x & 1:
+                    pending.total = chunk_x >> 1
+                    pending.chunks[0] = payload
+                else:
+                    pending.chunks[chunk_x >> 1] = payload
+                if len(pending.chunks) != pending.total:
+                    continue
+
+                with self._lock:
+                    self._pending.pop(message_id, None)
+                chunks = pending.chunks
+                pending.message = b''.join(
+                    chunks[index] for index in range(len(chunks)))
+                pending.done.set()
+        except socket.error as err:
+            self._fail(err)
+
+
+class _PendingMessage(object):
+    """Request message waiting for its response."""
+
+    __slots__ = ['chunks', 'total', 'message', 'error', 'done']
+
+    def __init__(self):
+        self.chunks = {}
+        self.total = None
+        self.message = None
+        self.error = None
+        self.done = Event()
+
+
+def _recv_exactly(sock, size):
+    """Read an exact number of bytes from a socket.
+
+    :param sock: Socket.
+    :type sock: socket.socket
+    :param size: Number of bytes to read.
+    :type size: int
+    :return: Bytes read.
+    :rtype: bytes
+    :raise socket.error: If the connection is closed first.
+    """
+    data = bytearray()
+    while len(data) < size:
+        part = sock.recv(size - len(data))
+        if not part:
+            raise socket.error('connection closed by server')
+        data += part
+    return bytes(data)
+
+
+def _to_bytes(data):
+    """Convert a request payload into bytes.
+
+    :param data: Request payload.
+    :type data: str | unicode | bytes | file | types.GeneratorType | None
+    :return: Payload in bytes.
+    :rtype: bytes
+    """
+    if data is None:
+        return b''
+    if hasattr(data, 'read'):
+        data = data.read()
+    elif not isinstance(data, (text_type, bytes)):
+        data = b''.join(
+            part.encode('utf-8') if isinstance(part, text_type) else part
+            for part in data
+        )
+    if isinstance(data, text_type):
+        return data.encode('utf-8')
+    return data
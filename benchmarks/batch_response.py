@@ -0,0 +1,127 @@
+"""Compare batch API response parsing strategies.
+
+The previous parser split the whole response body on the boundary and every
+part on line breaks, copying the payload several times and taking the last
+line of a part as its body. :func:`arango.utils.parse_multipart` scans the
+body once and slices out only headers and bodies. Both are timed on a batch
+response with many parts, with and without building the per-part
+:class:`arango.response.Response` objects, and the peak memory allocated
+while parsing is reported (Python 3 only).
+
+Usage::
+
+    PYTHONPATH=. python benchmarks/batch_response.py [--parts 10000]
+"""
+from __future__ import absolute_import, print_function, unicode_literals
+
+import argparse
+import json
+import timeit
+
+try:
+    import tracemalloc
+except ImportError:  # Python 2
+    tracemalloc = None
+
+from arango.response import Response
+from arango.utils import parse_multipart
+
+BOUNDARY = 'a1b2c3d4e5f6'
+
+
+def generate_body(parts):
+    """Return a batch API response body shaped like the server's."""
+    buffer = []
+    for index in range(parts):
+        doc = json.dumps({
+            '_id': 'students/{}'.format(index),
+            '_key': str(index),
+            '_rev': '_YB3OOPS--{}'.format(index),
+        })
+        buffer.extend([
+            '--{}'.format(BOUNDARY),
+            'Content-Type: application/x-arango-batchpart',
+            'Content-Id: {}'.format(index),
+            '',
+            'HTTP/1.1 202 Accepted',
+            'Content-Type: application/json; charset=utf-8',
+            'Content-Length: {}'.format(len(doc)),
+            '',
+            doc,
+        ])
+    buffer.append('--{}--'.format(BOUNDARY))
+    return '\r\n'.join(buffer)
+
+
+def split_parts(body):
+    """Parse the body the way BatchExecutor.commit used to."""
+    for raw_resp in body.split('--{}'.format(BOUNDARY))[1:-1]:
+        resp_parts = raw_resp.strip().split('\r\n')
+        job_id = resp_parts[1].split(' ')[1]
+        _, status_code, status_text = resp_parts[3].split(' ', 2)
+        yield job_id, int(status_code), status_text, {}, resp_parts[-1]
+
+
+def scan_parts(body):
+    """Parse the body with arango.utils.parse_multipart."""
+    for part_headers, status_code, status_text, headers, raw_body in (
+        parse_multipart(body, BOUNDARY)
+    ):
+        job_id = part_headers['content-id']
+        yield job_id, status_code, status_text, headers, raw_body
+
+
+def build_responses(parts):
+    """Build the per-part responses, as BatchExecutor.commit does."""
+    return [
+        Response('post', '/_api/document', headers, code, text, raw_body)
+        for _, code, text, headers, raw_body in parts
+    ]
+
+
+def peak_memory(func):
+    """Return the peak memory in MB allocated while calling the function."""
+    if tracemalloc is None:
+        return float('nan')
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1] / 2.0 ** 20
+    finally:
+        tracemalloc.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--parts', type=int, default=10000,
+                        help='number of parts in the batch response')
+    parser.add_argument('--rounds', type=int, default=10,
+                        help='number of timed rounds per measurement')
+    args = parser.parse_args()
+
+    body = generate_body(args.parts)
+    assert len(list(split_parts(body))) == args.parts
+    assert len(list(scan_parts(body))) == args.parts
+
+    print('{} parts ({:.1f} MB), best of 3 x {} rounds (ms per response)'
+          .format(args.parts, len(body) / 2.0 ** 20, args.rounds))
+    print('{:<16}{:>12}{:>20}{:>16}'.format(
+        'parser', 'parse', 'parse + Response', 'peak MB'))
+    parsers = [('split', split_parts), ('parse_multipart', scan_parts)]
+    for name, parse in parsers:
+        parse_time = min(timeit.repeat(
+            lambda: list(parse(body)), number=args.rounds, repeat=3))
+        total_time = min(timeit.repeat(
+            lambda: build_responses(parse(body)),
+            number=args.rounds, repeat=3))
+        peak = peak_memory(lambda: list(parse(body)))
+        print('{:<16}{:>12.2f}{:>20.2f}{:>16.1f}'.format(
+            name,
+            parse_time / args.rounds * 1000,
+            total_time / args.rounds * 1000,
+            peak
+        ))
+
+
+if __name__ == '__main__':
+    main()
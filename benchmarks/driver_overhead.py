@@ -0,0 +1,228 @@
+"""Measure python-arango's own overhead against a fake ArangoDB server.
+
+Each scenario is repeated for a fixed time against canned responses (see
+benchmarks/fake_server.py), and its throughput in operations per second is
+reported with the peak memory allocated by one operation (Python 3 only).
+Results can be saved as JSON and compared against a baseline saved with the
+same options, in which case the script exits with status 1 if any scenario
+got slower or allocates more than the tolerance allows.
+
+Scenarios:
+
+* document_insert, document_get, document_update, document_delete: one
+  single-document API call per operation.
+* insert_many: one call with --docs documents per operation.
+* batch_commit: --docs inserts queued in a batch and committed.
+* transaction_commit: --docs inserts queued in a transaction and committed.
+* cursor_drain: one AQL query whose --rows rows are drained in batches of
+  --batch-size.
+
+Usage::
+
+    PYTHONPATH=. python benchmarks/driver_overhead.py [--transport http]
+        [--rows 1000000] [--only cursor_drain] [--save results.json]
+        [--compare baseline.json] [--tolerance 0.2]
+"""
+from __future__ import absolute_import, print_function, unicode_literals
+
+import argparse
+import json
+import sys
+import time
+from collections import OrderedDict
+
+try:
+    import tracemalloc
+except ImportError:  # Python 2
+    tracemalloc = None
+
+from arango import ArangoClient
+from benchmarks.fake_server import (
+    CannedResponses,
+    FakeArangoServer,
+    FakeHTTPClient,
+)
+
+
+def generate_documents(count):
+    """Return flat documents (the fake server counts documents by braces)."""
+    return [
+        {
+            '_key': str(index),
+            'name': 'student{}'.format(index),
+            'age': 18 + index % 50,
+            'score': index * 0.5,
+            'active': index % 2 == 0,
+        }
+        for index in range(count)
+    ]
+
+
+def build_scenarios(db, args):
+    """Return the scenarios as (name, items per operation, operation)."""
+    col = db.collection('students')
+    document = generate_documents(1)[0]
+    documents = generate_documents(args.docs)
+
+    def batch_commit():
+        batch_db = db.begin_batch_execution(return_result=True)
+        batch_col = batch_db.collection('students')
+        for doc in documents:
+            batch_col.insert(doc)
+        batch_db.commit()
+
+    def transaction_commit():
+        txn_db = db.begin_transaction(write='students')
+        txn_col = txn_db.collection('students')
+        for doc in documents:
+            txn_col.insert(doc)
+        txn_db.commit()
+
+    def cursor_drain():
+        cursor = db.aql.execute(
+            'FOR i IN 1..@rows RETURN {_key: TO_STRING(i), value: i}',
+            bind_vars={'rows': args.rows},
+            batch_size=args.batch_size,
+            count=True
+        )
+        drained = 0
+        for _ in cursor:
+            drained += 1
+        assert drained == args.rows
+
+    return [
+        ('document_insert', 1, lambda: col.insert(document)),
+        ('document_get', 1, lambda: col.get('1')),
+        ('document_update', 1, lambda: col.update(document)),
+        ('document_delete', 1, lambda: col.delete('1')),
+        ('insert_many', args.docs, lambda: col.insert_many(documents)),
+        ('batch_commit', args.docs, batch_commit),
+        ('transaction_commit', args.docs, transaction_commit),
+        ('cursor_drain', args.rows, cursor_drain),
+    ]
+
+
+def measure(operation, duration):
+    """Repeat an operation for a duration and return its throughput.
+
+    :return: Number of operations per second.
+    :rtype: float
+    """
+    operation()  # Warm up
+    runs = 0
+    start = time.time()
+    elapsed = 0
+    while runs == 0 or elapsed < duration:
+        operation()
+        runs += 1
+        elapsed = time.time() - start
+    return runs / elapsed
+
+
+def peak_memory(operation):
+    """Return the peak memory in KiB allocated while running an operation."""
+    if tracemalloc is None:
+        return float('nan')
+    tracemalloc.start()
+    try:
+        operation()
+        return tracemalloc.get_traced_memory()[1] / 1024.0
+    finally:
+        tracemalloc.stop()
+
+
+def compare(results, baseline, tolerance):
+    """Print regressions against a baseline and return whether any exist."""
+    regressed = False
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+        base = baseline[name]
+        # Items per second do not depend on the number of items per operation.
+        if result['items_per_sec'] < base['items_per_sec'] * (1 - tolerance):
+            print('REGRESSION {}: {:.0f} items/s (baseline {:.0f})'.format(
+                name, result['items_per_sec'], base['items_per_sec']))
+            regressed = True
+        # NaN peaks (Python 2) never compare greater.
+        if result['peak_kib'] > base['peak_kib'] * (1 + tolerance):
+            print('REGRESSION {}: {:.1f} KiB peak (baseline {:.1f})'.format(
+                name, result['peak_kib'], base['peak_kib']))
+            regressed = True
+    return regressed
+
+
+def run(db, args):
+    """Run the selected scenarios and print a results table."""
+    results = OrderedDict()
+    print('{:<20}{:>14}{:>16}{:>14}'.format(
+        'scenario', 'ops/s', 'items/s', 'peak KiB'))
+    for name, items, operation in build_scenarios(db, args):
+        if args.only and name not in args.only:
+            continue
+        ops_per_sec = measure(operation, args.duration)
+        peak_kib = peak_memory(operation)
+        results[name] = {
+            'ops_per_sec': ops_per_sec,
+            'items_per_sec': ops_per_sec * items,
+            'peak_kib': peak_kib,
+        }
+        print('{:<20}{:>14.1f}{:>16.0f}{:>14.1f}'.format(
+            name, ops_per_sec, ops_per_sec * items, peak_kib))
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--transport', choices=['inprocess', 'http'],
+                        default='inprocess',
+                        help='call the fake server in-process (driver '
+                             'overhead only) or over local HTTP')
+    parser.add_argument('--duration', type=float, default=1.0,
+                        help='number of seconds each scenario is repeated')
+    parser.add_argument('--docs', type=int, default=100,
+                        help='number of documents per multi-document write')
+    parser.add_argument('--rows', type=int, default=1000000,
+                        help='number of rows per cursor drain')
+    parser.add_argument('--batch-size', type=int, default=1000,
+                        help='number of rows per cursor batch')
+    parser.add_argument('--only', nargs='+', metavar='SCENARIO',
+                        help='run only the given scenarios')
+    parser.add_argument('--save', metavar='FILE',
+                        help='save the results as JSON')
+    parser.add_argument('--compare', metavar='FILE',
+                        help='compare against results saved earlier')
+    parser.add_argument('--tolerance', type=float, default=0.2,
+                        help='allowed relative slowdown or memory growth')
+    args = parser.parse_args()
+
+    responses = CannedResponses()
+    print('transport: {}, {}s per scenario'.format(
+        args.transport, args.duration))
+    if args.transport == 'http':
+        with FakeArangoServer(responses) as server:
+            client = ArangoClient(hosts=[server.url])
+            results = run(client.db('bench', 'root', 'passwd'), args)
+    else:
+        client = ArangoClient(http_client=FakeHTTPClient(responses))
+        results = run(client.db('bench', 'root', 'passwd'), args)
+
+    options = {
+        'transport': args.transport,
+        'docs': args.docs,
+        'batch_size': args.batch_size,
+    }
+    if args.save:
+        with open(args.save, 'w') as fp:
+            json.dump({'options': options, 'results': results}, fp, indent=2)
+    if args.compare:
+        with open(args.compare) as fp:
+            baseline = json.load(fp)
+        if baseline['options'] != options:
+            print('WARNING: baseline options differ: {}'.format(
+                baseline['options']))
+        if compare(results, baseline['results'], args.tolerance):
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,307 @@
+"""Fake ArangoDB server which replays canned API responses.
+
+:class:`CannedResponses` answers the document, cursor, batch and transaction
+API requests the benchmarks send with precomputed bodies, so that almost all
+measured time is spent in python-arango itself. It can be reached in two
+ways:
+
+* :class:`FakeHTTPClient` calls it in-process, bypassing sockets and the
+  requests library, to isolate the driver overhead (request construction,
+  serialization, response parsing, executor dispatch, cursor iteration).
+* :class:`FakeArangoServer` serves it over HTTP on a local port from a
+  background thread, to include the default HTTP client in measurements.
+
+Only the request fields python-arango relies on are interpreted: the server
+does not store documents.
+"""
+from __future__ import absolute_import, print_function, unicode_literals
+
+import json
+import re
+import threading
+from itertools import count
+
+from six.moves import BaseHTTPServer, socketserver
+from six.moves.urllib.parse import urlsplit
+
+from arango.http import HTTPClient
+from arango.response import Response
+
+JSON_HEADERS = {'content-type': 'application/json; charset=utf-8'}
+
+_BOUNDARY_PATTERN = re.compile(r'boundary=([^\s;]+)')
+_CONTENT_ID_PATTERN = re.compile(r'Content-Id: (\S+)')
+_TRANSACTION_JOB_PATTERN = re.compile(r'result\["([^"]+)"\]')
+
+
+class CannedResponses(object):
+    """Router which answers API requests with canned response bodies.
+
+    :param document: Document returned by document reads. Its "_key",
+        "_id" and "_rev" fields are the same for every key.
+    :type document: dict
+    """
+
+    def __init__(self, document=None):
+        self._document = json.dumps(document or {
+            '_id': 'students/1',
+            '_key': '1',
+            '_rev': '_canned--',
+            'name': 'Jane Doe',
+            'email': 'jane@example.com',
+            'age': 21,
+            'score': 77.5,
+            'active': True,
+            'tags': ['math', 'chess'],
+        })
+        self._meta = json.dumps({
+            '_id': 'students/1',
+            '_key': '1',
+            '_rev': '_canned--',
+        })
+        self._update_meta = json.dumps({
+            '_id': 'students/1',
+            '_key': '1',
+            '_rev': '_canned--',
+            '_oldRev': '_canned--',
+        })
+        self._meta_lists = {}
+        self._cursor_rows = {}
+        self._cursors = {}
+        self._cursor_ids = count(1)
+        self._lock = threading.Lock()
+        self.requests = 0
+
+    def handle(self, method, path, headers, body):
+        """Answer an API request.
+
+        :param method: HTTP method in lowercase (e.g. "post").
+        :type method: str | unicode
+        :param path: Request path after the database prefix.
+        :type path: str | unicode
+        :param headers: Request headers.
+        :type headers: dict
+        :param body: Request body.
+        :type body: str | unicode
+        :return: Status code, response headers and response body.
+        :rtype: (int, dict, str | unicode)
+        """
+        self.requests += 1
+        if path.startswith('/_api/document/'):
+            return self._document_api(method, path, body)
+        if path.startswith('/_api/cursor'):
+            return self._cursor_api(method, path, body)
+        if path == '/_api/batch':
+            return self._batch_api(headers, body)
+        if path == '/_api/transaction':
+            jobs = _TRANSACTION_JOB_PATTERN.findall(body)
+            return 200, JSON_HEADERS, '{{"result": {{{}}}}}'.format(', '.join(
+                '"{}": {}'.format(job_id, self._meta) for job_id in jobs
+            ))
+        if path == '/_api/version':
+            return 200, JSON_HEADERS, json.dumps({
+                'server': 'arango',
+                'version': '3.4.0',
+            })
+        return 404, JSON_HEADERS, json.dumps({
+            'error': True,
+            'code': 404,
+            'errorNum': 404,
+            'errorMessage': 'unknown path {}'.format(path),
+        })
+
+    def _document_api(self, method, path, body):
+        if method == 'post':
+            if body.lstrip().startswith('['):
+                return 202, JSON_HEADERS, self._meta_list(body.count('{'))
+            return 202, JSON_HEADERS, self._meta
+        if method == 'get':
+            return 200, JSON_HEADERS, self._document
+        if method in ('patch', 'put'):
+            return 202, JSON_HEADERS, self._update_meta
+        if method == 'delete':
+            return 202, JSON_HEADERS, self._meta
+        return 200, JSON_HEADERS, ''
+
+    def _meta_list(self, length):
+        """Return the response body of a multi-document write.
+
+        :param length: Number of documents (an estimate is good enough).
+        :type length: int
+        """
+        body = self._meta_lists.get(length)
+        if body is None:
+            body = '[{}]'.format(', '.join([self._meta] * length))
+            self._meta_lists[length] = body
+        return body
+
+    def _cursor_api(self, method, path, body):
+        if method == 'post':
+            data = json.loads(body)
+            rows = data.get('bindVars', {}).get('rows', 1000)
+            batch_size = data.get('batchSize') or 1000
+            cursor_id = str(next(self._cursor_ids))
+            with self._lock:
+                self._cursors[cursor_id] = [rows, batch_size]
+            return 201, JSON_HEADERS, self._cursor_batch(cursor_id, rows)
+
+        cursor_id = path.rsplit('/', 1)[-1]
+        if method == 'delete':
+            with self._lock:
+                self._cursors.pop(cursor_id, None)
+            return 202, JSON_HEADERS, '{"id": "%s", "error": false}' % (
+                cursor_id)
+        return 200, JSON_HEADERS, self._cursor_batch(cursor_id)
+
+    def _cursor_batch(self, cursor_id, count=None):
+        """Return the next batch of a cursor and advance it.
+
+        :param cursor_id: Cursor ID.
+        :type cursor_id: str | unicode
+        :param count: Total number of rows, for the first batch.
+        :type count: int
+        """
+        with self._lock:
+            state = self._cursors.get(cursor_id)
+            if state is None:
+                return '{"result": [], "hasMore": false}'
+            remaining, batch_size = state
+            size = min(remaining, batch_size)
+            state[0] -= size
+            has_more = state[0] > 0
+            if not has_more:
+                del self._cursors[cursor_id]
+
+        rows = self._cursor_rows.get(size)
+        if rows is None:
+            rows = json.dumps([
+                {'_key': str(index), 'value': index, 'text': 'row'}
+                for index in range(size)
+            ])
+            self._cursor_rows[size] = rows
+        return ''.join([
+            '{"result": ', rows,
+            ', "hasMore": ', 'true' if has_more else 'false',
+            ', "id": "', cursor_id, '"',
+            '' if count is None else ', "count": {}'.format(count),
+            ', "cached": false, "extra": {}, "error": false}',
+        ])
+
+    def _batch_api(self, headers, body):
+        # The multipart boundary header may be overridden by the default
+        # JSON content type, so fall back to the first line of the body.
+        match = _BOUNDARY_PATTERN.search(headers.get('Content-Type') or '')
+        if match is None:
+            boundary = body[2:body.index('\r\n')]
+        else:
+            boundary = match.group(1)
+        buffer = []
+        for job_id in _CONTENT_ID_PATTERN.findall(body):
+            buffer.extend([
+                '--' + boundary,
+                'Content-Type: application/x-arango-batchpart',
+                'Content-Id: ' + job_id,
+                '',
+                'HTTP/1.1 202 Accepted',
+                'Content-Type: application/json; charset=utf-8',
+                'Content-Length: {}'.format(len(self._meta)),
+                '',
+                self._meta,
+            ])
+        buffer.append('--{}--'.format(boundary))
+        return 200, {
+            'content-type': 'multipart/form-data; boundary=' + boundary
+        }, '\r\n'.join(buffer)
+
+
+def _split_path(url):
+    """Return the API path of a URL, without the database prefix."""
+    path = urlsplit(url).path
+    if path.startswith('/_db/'):
+        path = path[path.index('/', 5):]
+    return path
+
+
+class FakeHTTPClient(HTTPClient):
+    """HTTP client which calls canned responses in-process.
+
+    :param responses: Canned responses.
+    :type responses: benchmarks.fake_server.CannedResponses
+    """
+
+    def __init__(self, responses):
+        self.responses = responses
+
+    def send_request(self,
+                     method,
+                     url,
+                     params=None,
+                     data=None,
+                     headers=None,
+                     auth=None):
+        if isinstance(data, bytes):
+            data = data.decode('utf-8')
+        status_code, resp_headers, body = self.responses.handle(
+            method, _split_path(url), headers or {}, data or '')
+        return Response(
+            method=method,
+            url=url,
+            headers=resp_headers,
+            status_code=status_code,
+            status_text='OK' if status_code < 400 else 'Error',
+            raw_body=body
+        )
+
+
+class FakeArangoServer(socketserver.ThreadingMixIn, BaseHTTPServer.HTTPServer):
+    """HTTP server which serves canned responses from a background thread.
+
+    :param responses: Canned responses.
+    :type responses: benchmarks.fake_server.CannedResponses
+    """
+
+    daemon_threads = True
+
+    def __init__(self, responses):
+        BaseHTTPServer.HTTPServer.__init__(
+            self, ('127.0.0.1', 0), _RequestHandler)
+        self.responses = responses
+        self._thread = threading.Thread(target=self.serve_forever)
+        self._thread.daemon = True
+
+    @property
+    def url(self):
+        """Return the base URL of the server."""
+        return 'http://127.0.0.1:{}'.format(self.server_address[1])
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.shutdown()
+        self.server_close()
+
+
+class _RequestHandler(BaseHTTPServer.BaseHTTPRequestHandler):
+
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+
+    def _handle(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        body = self.rfile.read(length).decode('utf-8') if length else ''
+        status_code, headers, resp_body = self.server.responses.handle(
+            self.command.lower(), _split_path(self.path), self.headers, body)
+        resp_body = resp_body.encode('utf-8')
+        self.send_response(status_code)
+        for key, value in headers.items():
+            self.send_header(key, value)
+        self.send_header('Content-Length', str(len(resp_body)))
+        self.end_headers()
+        self.wfile.write(resp_body)
+
+    do_GET = do_POST = do_PUT = do_PATCH = do_DELETE = do_HEAD = _handle
+
+    def log_message(self, *args):
+        pass
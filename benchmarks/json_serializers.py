@@ -0,0 +1,94 @@
+"""Compare JSON libraries usable as ArangoClient serializer/deserializer.
+
+Each library is timed on the payloads python-arango spends most of its JSON
+time on: the request body of ``insert_many`` and the response body of a
+cursor batch. Libraries which are not installed are skipped.
+
+Usage::
+
+    python benchmarks/json_serializers.py [--docs 1000] [--rounds 50]
+"""
+from __future__ import absolute_import, print_function, unicode_literals
+
+import argparse
+import importlib
+import json
+import random
+import string
+import timeit
+
+
+def generate_documents(count, seed=0):
+    """Return documents shaped like typical application records."""
+    rng = random.Random(seed)
+
+    def text(length):
+        return ''.join(rng.choice(string.ascii_letters) for _ in range(length))
+
+    return [
+        {
+            '_key': str(index),
+            'name': text(12),
+            'email': '{}@example.com'.format(text(8)),
+            'age': rng.randint(18, 90),
+            'score': rng.random() * 100,
+            'active': rng.random() > 0.5,
+            'tags': [text(5) for _ in range(rng.randint(0, 5))],
+            'address': {
+                'street': text(20),
+                'city': text(10),
+                'zip': text(5),
+            },
+        }
+        for index in range(count)
+    ]
+
+
+def available_libraries():
+    """Return (name, dumps, loads) for each installed JSON library."""
+    libraries = [('json', json.dumps, json.loads)]
+    for name in ('orjson', 'ujson', 'rapidjson'):
+        try:
+            module = importlib.import_module(name)
+        except ImportError:
+            continue
+        libraries.append((name, module.dumps, module.loads))
+    return libraries
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--docs', type=int, default=1000,
+                        help='number of documents per payload')
+    parser.add_argument('--rounds', type=int, default=50,
+                        help='number of timed rounds per measurement')
+    args = parser.parse_args()
+
+    documents = generate_documents(args.docs)
+    cursor_body = json.dumps({
+        'result': documents,
+        'hasMore': True,
+        'id': '12345',
+        'count': args.docs * 10,
+        'error': False,
+        'code': 201,
+    })
+
+    print('{} documents per payload, best of 3 x {} rounds (ms per payload)'
+          .format(args.docs, args.rounds))
+    print('{:<12}{:>16}{:>16}'.format(
+        'library', 'insert_many', 'cursor batch'))
+    for name, dumps, loads in available_libraries():
+        dump_time = min(timeit.repeat(
+            lambda: dumps(documents), number=args.rounds, repeat=3))
+        load_time = min(timeit.repeat(
+            lambda: loads(cursor_body), number=args.rounds, repeat=3))
+        print('{:<12}{:>16.3f}{:>16.3f}'.format(
+            name,
+            dump_time / args.rounds * 1000,
+            load_time / args.rounds * 1000,
+        ))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,70 @@
+"""Compare JSON and VelocyPack payload sizes and encoding times.
+
+Each codec is timed on the request body of ``insert_many`` and the response
+body of a cursor batch. A VelocyPack backend other than the pure Python one
+in arango.velocypack can be compared by passing its module name.
+
+Usage::
+
+    PYTHONPATH=. python benchmarks/velocypack.py [--docs 1000] [--rounds 20]
+        [--backend MODULE]
+"""
+from __future__ import absolute_import, print_function, unicode_literals
+
+import argparse
+import importlib
+import json
+import timeit
+
+from arango import velocypack
+from benchmarks.json_serializers import generate_documents
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--docs', type=int, default=1000,
+                        help='number of documents per payload')
+    parser.add_argument('--rounds', type=int, default=20,
+                        help='number of timed rounds per measurement')
+    parser.add_argument('--backend', action='append', default=[],
+                        help='module of another VelocyPack codec to compare')
+    args = parser.parse_args()
+
+    documents = generate_documents(args.docs)
+    cursor_result = {
+        'result': documents,
+        'hasMore': True,
+        'id': '12345',
+        'count': args.docs * 10,
+        'error': False,
+        'code': 201,
+    }
+
+    codecs = [
+        ('json', json.dumps, json.loads),
+        ('velocypack', velocypack.dumps, velocypack.loads),
+    ]
+    for name in args.backend:
+        module = importlib.import_module(name)
+        codecs.append((name, module.dumps, module.loads))
+
+    print('{} documents per payload, best of 3 x {} rounds'
+          .format(args.docs, args.rounds))
+    print('{:<12}{:>12}{:>18}{:>18}'.format(
+        'codec', 'bytes', 'encode (ms)', 'decode (ms)'))
+    for name, dumps, loads in codecs:
+        body = dumps(cursor_result)
+        dump_time = min(timeit.repeat(
+            lambda: dumps(documents), number=args.rounds, repeat=3))
+        load_time = min(timeit.repeat(
+            lambda: loads(body), number=args.rounds, repeat=3))
+        print('{:<12}{:>12}{:>18.3f}{:>18.3f}'.format(
+            name,
+            len(body),
+            dump_time / args.rounds * 1000,
+            load_time / args.rounds * 1000,
+        ))
+
+
+if __name__ == '__main__':
+    main()
@@ -18,6 +18,8 @@
 # documentation root, use os.path.abspath to make it absolute, like shown here.
 #
 
+import sys
+
 _version = {}
 with open("../arango/version.py") as fp:
     exec(fp.read(), _version)
@@ -77,6 +79,11 @@ language = None
 # This patterns also effect to html_static_path and html_extra_path
 exclude_patterns = ['_build', 'Thumbs.db', '.DS_Store']
 
+# Module arango.aio uses Python 3.5+ syntax and cannot be imported (hence
+# documented) by older Python versions.
+if sys.version_info < (3, 5):
+    suppress_warnings = ['autodoc.import_object']
+
 # The name of the Pygments (syntax highlighting) style to use.
 pygments_style = 'sphinx'
 
@@ -17,7 +17,8 @@ setup(
     url='https://github.com/joowani/python-arango',
     packages=find_packages(exclude=['tests']),
     include_package_data=True,
-    install_requires=['requests', 'six'],
+    install_requires=['requests', 'six', 'futures; python_version < "3"'],
+    extras_require={'async': ['aiohttp']},
     tests_require=['pytest', 'mock', 'flake8'],
     license='MIT',
     classifiers=[
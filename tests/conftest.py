@@ -1,5 +1,7 @@
 from __future__ import absolute_import, unicode_literals, division
 
+import sys
+
 import pytest
 
 from arango import ArangoClient
@@ -19,6 +21,9 @@ from tests.executors import (
 
 global_data = dict()
 
+# The asyncio client requires Python 3.5+ syntax.
+collect_ignore = ['test_aio.py'] if sys.version_info < (3, 5) else []
+
 
 def pytest_addoption(parser):
     parser.addoption('--host', action='store', default='127.0.0.1')
@@ -157,7 +162,10 @@ def pytest_generate_tests(metafunc):
             bad_txn_db._executor = TestTransactionExecutor(bad_conn)
             bad_dbs.append(bad_txn_db)
 
-        if tst not in {'async', 'batch', 'transaction', 'client', 'exception'}:
+        if tst not in {
+            'aio', 'async', 'batch', 'cache', 'coalescer', 'transaction',
+            'client', 'exception'
+        }:
             # Add test async databases
             tst_async_db = StandardDatabase(tst_conn)
             tst_async_db._executor = TestAsyncExecutor(tst_conn)
@@ -1,11 +1,9 @@
-import time
-
 from arango.executor import (
     AsyncExecutor,
     BatchExecutor,
     TransactionExecutor
 )
-from arango.job import BatchJob, TransactionJob
+from arango.job import TransactionJob
 
 
 class TestAsyncExecutor(AsyncExecutor):
@@ -18,8 +16,7 @@ class TestAsyncExecutor(AsyncExecutor):
 
     def execute(self, request, response_handler):
         job = AsyncExecutor.execute(self, request, response_handler)
-        while job.status() != 'done':
-            time.sleep(.01)
+        self.wait([job])
         return job.result()
 
 
@@ -35,8 +32,7 @@ class TestBatchExecutor(BatchExecutor):
         self._committed = False
         self._queue.clear()
 
-        job = BatchJob(response_handler)
-        self._queue[job.id] = (request, job)
+        job = BatchExecutor.execute(self, request, response_handler)
         self.commit()
         return job.result()
 
@@ -148,3 +148,18 @@ def assert_raises(*exception):
             TransactionExecuteError
         )
     )
+
+
+def skip_if_db_version_below(db, version):
+    """Skip the current test if the ArangoDB server is older than version.
+
+    :param db: Standard database API wrapper.
+    :type db: arango.database.StandardDatabase
+    :param version: Min server version as a (major, minor) tuple.
+    :type version: (int, int)
+    """
+    server_version = tuple(
+        int(part) for part in db.version().split('-')[0].split('.')[:2]
+    )
+    if server_version < version:
+        pytest.skip('requires ArangoDB {}.{}+'.format(*version))
@@ -0,0 +1,112 @@
+from __future__ import absolute_import, unicode_literals
+
+import asyncio
+
+import pytest
+
+from arango.aio import (
+    AsyncArangoClient,
+    AsyncCursor,
+    AsyncStandardDatabase
+)
+from arango.exceptions import (
+    DocumentGetError,
+    ServerConnectionError
+)
+from arango.version import __version__
+from tests.helpers import clean_doc, generate_string
+
+pytest.importorskip('aiohttp')
+
+
+def run(coroutine):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.close()
+
+
+def test_aio_client_attributes():
+    client = AsyncArangoClient(protocol='http', host='127.0.0.1', port=8529)
+    assert client.version == __version__
+    assert client.protocol == 'http'
+    assert client.host == '127.0.0.1'
+    assert client.port == 8529
+    assert client.base_url == 'http://127.0.0.1:8529'
+    assert repr(client) == '<AsyncArangoClient http://127.0.0.1:8529>'
+
+
+def test_aio_database_management(db, username, password):
+    async def main():
+        async with AsyncArangoClient() as client:
+            aio_db = await client.db(db.name, username, password, verify=True)
+            assert isinstance(aio_db, AsyncStandardDatabase)
+            assert repr(aio_db) == '<AsyncStandardDatabase {}>'.format(db.name)
+            assert aio_db.context == 'asyncio'
+            assert aio_db.name == db.name
+            assert aio_db.username == username
+            assert await aio_db.ping() == 200
+
+            with pytest.raises(ServerConnectionError):
+                await client.db(db.name, username, generate_string(), True)
+
+    run(main())
+
+
+def test_aio_document_management(db, col, username, password, docs):
+    async def main():
+        async with AsyncArangoClient() as client:
+            aio_db = await client.db(db.name, username, password)
+            aio_col = aio_db.collection(col.name)
+            assert aio_col.context == 'asyncio'
+
+            await aio_col.insert_many(docs)
+            results = await asyncio.gather(
+                *[aio_col.get(doc['_key']) for doc in docs]
+            )
+            assert clean_doc(results) == docs
+            assert await aio_col.get('missing') is None
+
+            await aio_col.delete(docs[0]['_key'])
+            assert await aio_col.count() == len(docs) - 1
+
+            bad_col = aio_db.collection(generate_string())
+            with pytest.raises(DocumentGetError):
+                await bad_col.get('1')
+
+    run(main())
+
+
+def test_aio_cursor(db, col, username, password, docs):
+    col.import_bulk(docs)
+
+    async def main():
+        async with AsyncArangoClient() as client:
+            aio_db = await client.db(db.name, username, password)
+            cursor = await aio_db.aql.execute(
+                'FOR d IN {} SORT d._key RETURN d'.format(col.name),
+                count=True,
+                batch_size=2
+            )
+            assert isinstance(cursor, AsyncCursor)
+            assert 'AsyncCursor' in repr(cursor)
+            assert cursor.count() == len(docs)
+            assert cursor.has_more() is True
+
+            assert clean_doc(await cursor.next()) == docs[0]
+            assert clean_doc([doc async for doc in cursor]) == docs[1:]
+            assert cursor.has_more() is False
+
+            cursor = await aio_db.aql.execute(
+                'FOR d IN {} RETURN d'.format(col.name),
+                batch_size=1
+            )
+            async with cursor:
+                assert (await cursor.next())['_key'] in col
+            assert await cursor.close(ignore_missing=True) is False
+
+            with pytest.raises(TypeError):
+                iter(cursor)
+
+    run(main())
@@ -1,5 +1,12 @@
 from __future__ import absolute_import, unicode_literals
 
+import json
+
+import pytest
+
+from arango.aql import PreparedQuery
+from arango.connection import Connection
+from arango.executor import DefaultExecutor
 from arango.exceptions import (
     AQLCacheClearError,
     AQLCacheConfigureError,
@@ -235,6 +242,92 @@ def test_aql_query_management(db, bad_db, col, docs):
     assert err.value.error_code in {11, 1228}
 
 
+def test_aql_prepared_query(db, bad_db, col, docs):
+    col.import_bulk(docs)
+    query = 'FOR d IN @@col FILTER d.val >= @val SORT d._key RETURN d'
+
+    # Test prepare invalid query
+    with assert_raises(AQLQueryValidateError) as err:
+        db.aql.prepare('INVALID QUERY')
+    assert err.value.error_code == 1501
+
+    # Test prepare with bind variables
+    with pytest.raises(TypeError):
+        db.aql.prepare(query, bind_vars={'val': 1})
+
+    prepared = db.aql.prepare(
+        query,
+        batch_size=1,
+        read_collections=[col.name]
+    )
+    assert isinstance(prepared, PreparedQuery)
+    assert prepared.context == db.context
+    assert prepared.query == query
+    assert repr(prepared) == '<PreparedQuery {}>'.format(query)
+    assert set(prepared.bind_params) == {'@col', 'val'}
+
+    # Test run prepared query
+    for val in (1, 3):
+        cursor = prepared.run({'@col': col.name, 'val': val})
+        expected = [doc for doc in docs if doc['val'] >= val]
+        assert extract('_key', cursor) == extract('_key', expected)
+
+    # Test run prepared query many times
+    cursors = prepared.run_many(
+        [{'@col': col.name, 'val': val} for val in range(1, 7)],
+        max_parts=2
+    )
+    assert len(cursors) == 6
+    for val, cursor in zip(range(1, 7), cursors):
+        expected = [doc for doc in docs if doc['val'] >= val]
+        assert extract('_key', cursor) == extract('_key', expected)
+    assert prepared.run_many([]) == []
+
+    # Test run prepared query with missing bind variables
+    with assert_raises(AQLQueryExecuteError) as err:
+        prepared.run({'val': 1})
+    assert err.value.error_code == 1551
+
+    # Test explain prepared query
+    plan = prepared.explain({'@col': col.name, 'val': 1})
+    assert 'nodes' in plan
+    assert prepared.explain({'@col': col.name, 'val': 1}) is plan
+    assert prepared.explain({'val': 1, '@col': col.name}) is plan
+    assert isinstance(
+        prepared.explain({'@col': col.name, 'val': 1}, all_plans=True),
+        list
+    )
+
+    # Test prepare with bad database
+    with assert_raises(AQLQueryValidateError) as err:
+        bad_db.aql.prepare(query)
+    assert err.value.error_code in {11, 1228}
+
+
+def test_aql_prepared_query_serializers():
+    data = {'query': 'RETURN @val', 'batchSize': 1}
+    serializers = [
+        json.dumps,
+        lambda obj: json.dumps(obj, separators=(',', ':')).encode('utf-8'),
+        lambda obj: json.dumps(obj, indent=2) + '\n',
+        # Output which bind variables cannot be spliced into
+        lambda obj: json.dumps(obj) + '\n\x00',
+    ]
+    for serializer in serializers:
+        conn = Connection('http://127.0.0.1:8529', '_system', 'root', '',
+                          None, serializer=serializer)
+        prepared = PreparedQuery(conn, DefaultExecutor(conn), data, ['val'])
+
+        # Test payloads are valid with and without bind variables
+        for bind_vars in ({'val': 1}, None):
+            payload = prepared._build_request(bind_vars).serialize(serializer)
+            if isinstance(payload, bytes):
+                payload = payload.decode('utf-8')
+            payload = json.loads(payload.rstrip('\x00'))
+            assert payload.get('bindVars') in (bind_vars, {})
+            assert payload['query'] == data['query']
+
+
 def test_aql_function_management(db, bad_db):
     fn_group = 'functions::temperature'
     fn_name_1 = 'functions::temperature::celsius_to_fahrenheit'
@@ -1,10 +1,13 @@
 from __future__ import absolute_import, unicode_literals
 
 import time
+from concurrent.futures import wait
 
 import pytest
 from six import string_types
+from six.moves.queue import Queue
 
+from arango.connection import Connection
 from arango.database import AsyncDatabase
 from arango.exceptions import (
     AsyncExecuteError,
@@ -13,9 +16,13 @@ from arango.exceptions import (
     AsyncJobStatusError,
     AsyncJobListError,
     AsyncJobCancelError,
-    AQLQueryExecuteError
+    AsyncJobTimeoutError,
+    AQLQueryExecuteError,
+    DocumentInsertError
 )
-from arango.job import AsyncJob
+from arango.http import HTTPClient
+from arango.job import AsyncJob, _AsyncJobPoller
+from arango.response import Response
 from tests.helpers import extract
 
 
@@ -259,3 +266,115 @@ def test_async_list_jobs(db, col, docs):
     job_ids = db.async_jobs(status='done', count=1)
     assert len(job_ids) == 1
     assert job_ids[0] in [job1.id, job2.id, job3.id, job4.id]
+
+
+def test_async_wait_for_jobs(db, col, docs):
+    async_db = db.begin_async_execution(return_result=True)
+    async_col = async_db.collection(col.name)
+
+    # Test wait for all outstanding jobs
+    jobs = [async_col.insert(doc) for doc in docs]
+    assert async_db.pending_jobs() == jobs
+    done, pending = async_db.wait()
+    assert pending == []
+    assert sorted(done, key=lambda job: job.id) == sorted(
+        jobs, key=lambda job: job.id)
+    assert async_db.pending_jobs() == []
+    assert extract('_key', col.all()) == extract('_key', docs)
+
+    # Test results are kept in the jobs after harvesting
+    for job, doc in zip(jobs, docs):
+        assert job.status() == 'done'
+        assert job.result()['_key'] == doc['_key']
+        assert job.result()['_key'] == doc['_key']
+
+    # Test wait and as_completed with timeouts
+    job = async_db.aql.execute('RETURN SLEEP(0.5)')
+    with pytest.raises(AsyncJobTimeoutError):
+        list(async_db.as_completed([job], timeout=0.05))
+    assert async_db.wait([job], timeout=0.05) == ([], [job])
+    assert list(async_db.as_completed([job], max_interval=0.1)) == [job]
+    assert job.result().next() is None
+
+    # Test errors are kept in the jobs after harvesting
+    job = async_db.aql.execute('INVALID QUERY')
+    assert list(async_db.as_completed()) == [job]
+    with pytest.raises(AQLQueryExecuteError) as err:
+        job.result()
+    assert err.value.error_code == 1501
+
+    # Test jobs whose results were already retrieved
+    job = async_db.aql.execute('RETURN 1')
+    assert wait_on_job(job).result().next() == 1
+    assert async_db.wait([job]) == ([job], [])
+    with pytest.raises(AsyncJobResultError) as err:
+        job.result()
+    assert err.value.error_code == 404
+
+    # Test jobs no longer referenced are not tracked
+    async_col.insert({})
+    assert async_db.pending_jobs() == []
+
+    # Test jobs are not tracked without results
+    async_db = db.begin_async_execution(return_result=False)
+    async_db.collection(col.name).insert({})
+    assert async_db.pending_jobs() is None
+    assert async_db.wait() == ([], [])
+
+
+def test_async_job_futures(db, col, docs):
+    async_db = db.begin_async_execution(return_result=True)
+    async_col = async_db.collection(col.name)
+
+    # Test futures are resolved with job results
+    jobs = [async_col.insert(doc) for doc in docs]
+    futures = [job.to_future() for job in jobs]
+    assert jobs[0].to_future() is futures[0]
+    done, not_done = wait(futures, timeout=10)
+    assert len(done) == len(docs) and not not_done
+    for future, doc in zip(futures, docs):
+        assert future.result()['_key'] == doc['_key']
+
+    # Test futures are resolved with job errors
+    future = async_col.insert(docs[0]).to_future()
+    assert isinstance(future.exception(timeout=10), DocumentInsertError)
+
+    # Test callbacks
+    results = Queue()
+    future = async_db.aql.execute('RETURN 1').to_future()
+    future.add_done_callback(lambda f: results.put(f.result().next()))
+    assert results.get(timeout=10) == 1
+
+
+def test_async_job_poller_failures():
+
+    class FakeHTTPClient(HTTPClient):
+
+        def __init__(self, failures):
+            self.failures = failures
+
+        def send_request(self, method, url, **_):
+            if self.failures > 0:
+                self.failures -= 1
+                raise IOError('connection reset')
+            if method == 'put':
+                headers = {'x-arango-async-id': url.rsplit('/', 1)[-1]}
+                return Response(method, url, headers, 200, 'OK', '1')
+            return Response(method, url, {}, 200, 'OK', '')
+
+    def make_job(http_client):
+        conn = Connection('http://127.0.0.1:8529', '_system', 'root', '',
+                          http_client)
+        return AsyncJob(conn, '1', lambda resp: resp.body)
+
+    poller = _AsyncJobPoller(retry_delay=0.01, max_retries=2)
+
+    # Test transient errors are retried
+    flaky_future = poller.submit(make_job(FakeHTTPClient(failures=2)))
+    assert flaky_future.result(timeout=10) == 1
+
+    # Test persistent errors fail only the futures of the failing host
+    bad_future = poller.submit(make_job(FakeHTTPClient(failures=100)))
+    good_future = poller.submit(make_job(FakeHTTPClient(failures=0)))
+    assert good_future.result(timeout=10) == 1
+    assert isinstance(bad_future.exception(timeout=10), IOError)
@@ -1,9 +1,12 @@
 from __future__ import absolute_import, unicode_literals
 
+from io import BytesIO
+
 import mock
 import pytest
 from six import string_types
 
+from arango.connection import Connection
 from arango.database import BatchDatabase
 from arango.exceptions import (
     DocumentInsertError,
@@ -11,7 +14,10 @@ from arango.exceptions import (
     BatchJobResultError,
     BatchStateError
 )
+from arango.http import HTTPClient
 from arango.job import BatchJob
+from arango.request import Request
+from arango.response import Response
 from tests.helpers import extract, clean_doc
 
 
@@ -83,6 +89,45 @@ def test_batch_execute_with_result(db, col, docs):
     assert err.value.error_code == 1210
 
 
+def test_batch_execute_split(db, col, docs):
+    batch_db = db.begin_batch_execution(max_parts=2, workers=2)
+    batch_col = batch_db.collection(col.name)
+    # Queue the duplicate right after the original, so that both are sent in
+    # the same batch API request and executed in order.
+    jobs = [batch_col.insert(docs[0]), batch_col.insert(docs[0])]
+    jobs.extend(batch_col.insert(doc) for doc in docs[1:])
+
+    # Test results are mapped back to the jobs across batch API requests
+    with mock.patch.object(
+        batch_db._executor._conn,
+        'send_request',
+        wraps=batch_db._executor._conn.send_request
+    ) as send_request:
+        assert batch_db.commit() == jobs
+    assert send_request.call_count == (len(jobs) + 1) // 2
+    assert all(job.status() == 'done' for job in jobs)
+    for job, doc in zip(jobs[:1] + jobs[2:], docs):
+        assert job.result()['_key'] == doc['_key']
+    with pytest.raises(DocumentInsertError) as err:
+        jobs[1].result()
+    assert err.value.error_code == 1210
+    assert extract('_key', col.all()) == extract('_key', docs)
+
+    # Test oversized requests are sent in batch API requests of their own
+    col.truncate()
+    batch_db = db.begin_batch_execution(max_bytes=1)
+    batch_col = batch_db.collection(col.name)
+    jobs = [batch_col.insert(doc) for doc in docs[:2]]
+    with mock.patch.object(
+        batch_db._executor._conn,
+        'send_request',
+        wraps=batch_db._executor._conn.send_request
+    ) as send_request:
+        assert batch_db.commit() == jobs
+    assert send_request.call_count == 2
+    assert jobs[1].result()['_key'] == docs[1]['_key']
+
+
 def test_batch_empty_commit(db):
     batch_db = db.begin_batch_execution(return_result=False)
     assert batch_db.commit() is None
@@ -168,3 +213,57 @@ def test_batch_bad_state(db, col, docs):
     with pytest.raises(BatchStateError) as err:
         batch_db.commit()
     assert 'expecting 3 parts in batch response but got 0' in str(err.value)
+
+
+def test_batch_payload_serialized_on_queue():
+
+    class RecordingHTTPClient(HTTPClient):
+
+        def __init__(self):
+            self.bodies = []
+
+        def send_request(self, method, url, data=None, **_):
+            self.bodies.append(data)
+            return Response(method, url, {}, 200, 'OK', '')
+
+    http_client = RecordingHTTPClient()
+    conn = Connection('http://127.0.0.1:8529', 'test', 'root', '', http_client)
+    batch_col = BatchDatabase(conn, return_result=False).collection('test')
+
+    # Test changes to the document after queuing are not committed
+    doc = {'_key': '1'}
+    for i in range(3):
+        doc['v'] = i
+        batch_col.insert(doc)
+    batch_col._executor.commit()
+
+    body = http_client.bodies[0]
+    for i in range(3):
+        assert '"v": {}'.format(i) in body
+
+
+def test_batch_streamed_payload_read_on_queue():
+    conn = Connection('http://127.0.0.1:8529', 'test', 'root', '', None)
+    executor = BatchDatabase(conn, return_result=False)._executor
+
+    # Test streamed payloads are read, keeping the request semantics
+    chunks = (chunk for chunk in [b'[{"a"', b': 1}]'])
+    for data in [BytesIO(b'[{"a": 1}]'), chunks]:
+        executor.execute(Request(
+            method='post',
+            endpoint='/_api/import',
+            params={'collection': 'test'},
+            data=data,
+            command='db.test.insert({"a": 1})',
+            read='foo',
+            write='test'
+        ), lambda resp: resp)
+    assert len(executor._queue) == 2
+    for request, _ in executor._queue.values():
+        assert request.streamed is False
+        assert request.data == b'[{"a": 1}]'
+        assert request.endpoint == '/_api/import'
+        assert request.params == {'collection': 'test'}
+        assert request.command == 'db.test.insert({"a": 1})'
+        assert request.read == 'foo'
+        assert request.write == 'test'
@@ -0,0 +1,293 @@
+from __future__ import absolute_import, unicode_literals
+
+import json
+
+from arango.cache import DocumentCache, QueryResultCache
+from arango.connection import Connection, TransactionConnection
+from arango.database import StandardDatabase
+from arango.http import HTTPClient
+from arango.request import Request
+from arango.response import Response
+from tests.helpers import clean_doc, extract, generate_doc_key
+
+
+class CursorHTTPClient(HTTPClient):
+    """HTTP client returning canned cursor API responses."""
+
+    def __init__(self, *batches):
+        self.batches = list(batches)
+        self.requests = []
+
+    def send_request(self, method, url, **kwargs):
+        self.requests.append((method, url))
+        body = {'result': [], 'hasMore': False}
+        if self.batches:
+            body['result'] = self.batches.pop(0)
+            body['hasMore'] = bool(self.batches)
+            body['id'] = '1'
+        return Response(method, url, {}, 200, 'OK', json.dumps(body))
+
+
+def test_cache_attributes():
+    cache = DocumentCache(maxsize=2, ttl=10, revalidate=True)
+    assert cache.maxsize == 2
+    assert cache.ttl == 10
+    assert cache.revalidate is True
+    assert len(cache) == 0
+    assert repr(cache) == '<DocumentCache 0/2>'
+
+
+def test_cache_lru_and_ttl():
+    cache = DocumentCache(maxsize=2)
+    cache.put('col/1', '_r1', '{"_key": "1"}')
+    cache.put('col/2', '_r2', '{"_key": "2"}')
+    assert cache.get('col/1') == ('_r1', '{"_key": "1"}', True)
+
+    # Test least recently used entry is evicted
+    cache.put('col/3', '_r3', '{"_key": "3"}')
+    assert 'col/1' in cache
+    assert 'col/2' not in cache
+    assert cache.get('col/2') is None
+    assert cache.statistics()['evictions'] == 1
+
+    cache.invalidate('col/1')
+    assert 'col/1' not in cache
+    cache.clear()
+    assert len(cache) == 0
+
+    # Test expired entries are kept but not fresh
+    cache = DocumentCache(ttl=0)
+    cache.put('col/1', '_r1', '{"_key": "1"}')
+    assert cache.get('col/1') == ('_r1', '{"_key": "1"}', False)
+
+    cache = DocumentCache(revalidate=True)
+    cache.put('col/1', '_r1', '{"_key": "1"}')
+    assert cache.get('col/1')[2] is False
+
+    cache.record('hits')
+    assert cache.statistics() == {
+        'hits': 1,
+        'misses': 0,
+        'revalidations': 0,
+        'evictions': 0,
+        'size': 1
+    }
+
+
+def test_result_cache_lru_and_ttl():
+    cache = QueryResultCache(maxsize=2, ttl=10, max_rows=5)
+    assert cache.maxsize == 2
+    assert cache.ttl == 10
+    assert cache.max_rows == 5
+    assert repr(cache) == '<QueryResultCache 0/2>'
+
+    generation = cache.generation
+    cache.put(('db', 'q1'), {'result': [1]}, generation)
+    cache.put(('db', 'q2'), {'result': [2]}, generation)
+    assert cache.get(('db', 'q1')) == {'result': [1]}
+
+    # Test least recently used entry is evicted
+    cache.put(('db', 'q3'), {'result': [3]}, generation)
+    assert cache.get(('db', 'q2')) is None
+    assert len(cache) == 2
+
+    # Test results in flight while the cache was cleared are discarded
+    cache.clear()
+    assert cache.generation == generation + 1
+    cache.put(('db', 'q1'), {'result': [1]}, generation)
+    assert cache.get(('db', 'q1')) is None
+    assert cache.statistics() == {
+        'hits': 1,
+        'misses': 2,
+        'evictions': 1,
+        'invalidations': 2,
+        'size': 0
+    }
+
+    # Test expired entries are dropped
+    cache = QueryResultCache(ttl=0)
+    cache.put(('db', 'q1'), {'result': [1]}, cache.generation)
+    assert cache.get(('db', 'q1')) is None
+    assert len(cache) == 0
+
+
+def test_result_cache_aql_execute(db, col, docs):
+    col.import_bulk(docs)
+    cache = QueryResultCache()
+    cached_db = StandardDatabase(db._conn, result_cache=cache)
+    assert cached_db.result_cache is cache
+    assert db.result_cache is None
+
+    query = 'FOR d IN @@col SORT d._key RETURN d'
+    bind_vars = {'@col': col.name}
+
+    # Test result sets are fetched in full and replayed
+    cursor = cached_db.aql.execute(query, bind_vars=bind_vars, batch_size=1)
+    assert cursor.has_more() is False
+    assert extract('_key', cursor) == extract('_key', docs)
+    cursor = cached_db.aql.execute(query, bind_vars=bind_vars, batch_size=1)
+    assert cursor.id is None
+    assert cursor.count() is None
+    assert extract('_key', cursor) == extract('_key', docs)
+    assert cache.statistics()['hits'] == 1
+    assert cache.statistics()['misses'] == 1
+
+    # Test different options are cached separately
+    cursor = cached_db.aql.execute(query, bind_vars=bind_vars, count=True)
+    assert cursor.count() == len(docs)
+    assert cache.statistics()['misses'] == 2
+
+    # Test writes through the database invalidate the cache
+    cached_db.collection(col.name).delete(docs[0]['_key'])
+    assert len(cache) == 0
+    cursor = cached_db.aql.execute(query, bind_vars=bind_vars)
+    assert extract('_key', cursor) == extract('_key', docs[1:])
+
+    # Test write queries are not cached and invalidate the cache
+    cursor = cached_db.aql.execute(
+        'FOR d IN @@col REMOVE d IN @@col',
+        bind_vars=bind_vars
+    )
+    assert cursor.statistics()['modified'] == len(docs) - 1
+    assert len(cache) == 0
+    assert list(cached_db.aql.execute(query, bind_vars=bind_vars)) == []
+
+    # Test writes in other execution contexts invalidate the cache
+    batch_db = cached_db.begin_batch_execution(return_result=False)
+    batch_db.collection(col.name).insert(docs[0])
+    batch_db.commit()
+    assert len(cache) == 0
+    cursor = cached_db.aql.execute(query, bind_vars=bind_vars)
+    assert extract('_key', cursor) == [docs[0]['_key']]
+
+    # Test writes through other database API wrappers invalidate the cache
+    db.collection(col.name).insert(docs[1])
+    assert len(cache) == 0
+    cursor = cached_db.aql.execute(query, bind_vars=bind_vars)
+    assert extract('_key', cursor) == extract('_key', docs[:2])
+
+
+def test_result_cache_connection_invalidation():
+    conn = Connection(
+        'http://localhost:8529', '_system', 'root', 'passwd',
+        CursorHTTPClient()
+    )
+    cache = QueryResultCache()
+    StandardDatabase(conn, result_cache=cache)
+
+    def send(request, trx_id=None):
+        cache.put(('_system', 'root', 'q'), {'result': []}, cache.generation)
+        if trx_id is None:
+            conn.send_request(request)
+        else:
+            TransactionConnection(conn, trx_id).send_request(request)
+        return len(cache) == 0
+
+    # Test read-only requests keep the cache
+    assert not send(Request('get', '/_api/document/col/1'))
+    query = 'FOR d IN col RETURN d'
+    assert not send(Request('post', '/_api/cursor', data={'query': query}))
+    assert not send(Request(
+        'post', '/_api/cursor', data=json.dumps({'query': query})
+    ))
+    assert not send(Request('put', '/_api/cursor/1'))
+    assert not send(Request('put', '/_api/simple/all', data={}))
+    assert not send(Request('put', '/_api/job/1'))
+
+    # Test write requests clear the cache in any execution context
+    assert send(Request('post', '/_api/document/col', data={}))
+    assert send(Request('post', '/_api/import', data='{}'))
+    assert send(Request('post', '/_api/batch', data='--XXX--'))
+    assert send(Request('post', '/_api/document/col', data={}), trx_id='1')
+    assert send(Request('put', '/_api/transaction/1'))
+    assert send(Request(
+        'post', '/_api/cursor', data={'query': 'FOR d IN col REMOVE d IN col'}
+    ))
+    assert send(Request(
+        'post', '/_api/cursor', data=b'{"query": "INSERT {} INTO col"}'
+    ))
+    assert send(Request(
+        'put', '/_api/simple/remove-by-example', data={}, write='col'
+    ))
+
+
+def test_result_cache_max_rows():
+    http_client = CursorHTTPClient([1, 2], [3, 4], [5])
+    conn = Connection(
+        'http://localhost:8529', '_system', 'root', 'passwd', http_client
+    )
+    cache = QueryResultCache(max_rows=3)
+    db = StandardDatabase(conn, result_cache=cache)
+
+    # Test result sets above the limit are returned by live cursors
+    cursor = db.aql.execute('FOR d IN col RETURN d')
+    assert cursor.has_more() is True
+    assert list(cursor) == [1, 2, 3, 4, 5]
+    assert len(http_client.requests) == 3
+    assert len(cache) == 0
+
+    # Test result sets within the limit are cached
+    http_client.batches = [[1], [2, 3]]
+    assert list(db.aql.execute('FOR d IN col RETURN d')) == [1, 2, 3]
+    assert list(db.aql.execute('FOR d IN col RETURN d')) == [1, 2, 3]
+    assert len(http_client.requests) == 5
+    assert len(cache) == 1
+
+    # Test results are cached per user
+    conn._username = 'john'
+    assert list(db.aql.execute('FOR d IN col RETURN d')) == []
+    assert len(cache) == 2
+
+
+def test_cache_collection_get(db, col, docs):
+    col.import_bulk(docs)
+    cache = DocumentCache(maxsize=10)
+    cached_col = db.collection(col.name, cache=cache)
+    assert cached_col.cache is cache
+
+    doc = docs[0]
+    assert clean_doc(cached_col.get(doc['_key'])) == doc
+    assert clean_doc(cached_col.get(doc['_key'])) == doc
+    assert cache.statistics()['misses'] == 1
+    assert cache.statistics()['hits'] == 1
+
+    # Test returned documents are copies
+    cached_col.get(doc['_key'])['val'] = 100
+    assert cached_col.get(doc['_key'])['val'] == doc['val']
+
+    # Test inserts of new documents keep cached documents
+    hits = cache.statistics()['hits']
+    cached_col.insert({'_key': generate_doc_key()})
+    cached_col.insert({})
+    cached_col.insert_many([{'_key': generate_doc_key()}, {}])
+    assert clean_doc(cached_col.get(doc['_key'])) == doc
+    assert cache.statistics()['hits'] == hits + 1
+
+    # Test inserts overwriting documents invalidate them only
+    cached_col.get(docs[1]['_key'])
+    cached_col.insert({'_key': doc['_key'], 'val': 50}, overwrite=True)
+    assert cached_col.get(doc['_key'])['val'] == 50
+    assert clean_doc(cached_col.get(docs[1]['_key'])) == docs[1]
+    assert cache.statistics()['hits'] == hits + 2
+
+    # Test writes through the wrapper invalidate the cache
+    cached_col.update({'_key': doc['_key'], 'val': 100})
+    assert cached_col.get(doc['_key'])['val'] == 100
+    cached_col.delete(doc['_key'])
+    assert cached_col.get(doc['_key']) is None
+    cached_col.insert(doc)
+    cached_col.update_match({'_key': doc['_key']}, {'val': 200})
+    assert cached_col.get(doc['_key'])['val'] == 200
+
+    # Test revalidation of documents modified by other clients
+    cache = DocumentCache(revalidate=True)
+    cached_col = db.collection(col.name, cache=cache)
+    assert cached_col.get(doc['_key'])['val'] == 200
+    assert cached_col.get(doc['_key'])['val'] == 200
+    assert cache.statistics()['revalidations'] == 1
+    col.update({'_key': doc['_key'], 'val': 300})
+    assert cached_col.get(doc['_key'])['val'] == 300
+    assert cache.statistics()['misses'] == 2
+
+    # Test missing documents
+    assert cached_col.get('missing') is None
@@ -1,13 +1,23 @@
 from __future__ import absolute_import, unicode_literals
 
+import errno
+import json
+import zlib
+from decimal import Decimal
+
 import pytest
+from requests.exceptions import ReadTimeout
 
 from arango.client import ArangoClient
+from arango.connection import Connection
 from arango.database import StandardDatabase
-from arango.exceptions import ServerConnectionError
-from arango.http import DefaultHTTPClient
+from arango.exceptions import DocumentInsertError, ServerConnectionError
+from arango.http import DefaultHTTPClient, HTTPClient, _compress
+from arango.request import Request
+from arango.response import Response
 from arango.version import __version__
 from tests.helpers import (
+    clean_doc,
     generate_db_name,
     generate_username,
     generate_string
@@ -28,6 +38,10 @@ def test_client_attributes():
     assert client.port == 8529
     assert client.base_url == 'http://127.0.0.1:8529'
     assert repr(client) == '<ArangoClient http://127.0.0.1:8529>'
+    assert client.http_client is session
+
+    client = ArangoClient(protocol='http', host='127.0.0.1', port=8529)
+    assert isinstance(client.http_client, DefaultHTTPClient)
 
 
 def test_client_good_connection(db, username, password):
@@ -62,7 +76,7 @@ def test_client_bad_connection(db, username, password):
         client.db(bad_db_name, bad_username, bad_password, verify=True)
 
     # Test connection with invalid host URL
-    client._url = 'http://127.0.0.1:8500'
+    client._hosts = ['http://127.0.0.1:8500']
     with pytest.raises(ServerConnectionError) as err:
         client.db(db.name, username, password, verify=True)
     assert 'bad connection' in str(err.value)
@@ -99,3 +113,246 @@ def test_client_custom_http_client(db, username, password):
     # Set verify to True to send a test API call on initialization.
     client.db(db.name, username, password, verify=True)
     assert http_client.counter == 1
+
+
+def test_client_connection_pool(db, username, password):
+    client = ArangoClient(
+        protocol='http',
+        host='127.0.0.1',
+        port=8529,
+        pool_maxsize=4,
+        pool_block=True
+    )
+    http_client = client.http_client
+    assert http_client.pool_metrics() == {
+        'in_use': 0,
+        'idle': 0,
+        'discarded': 0,
+        'pools': 0
+    }
+
+    # Connections are shared by all databases returned from the client.
+    client.db(db.name, username, password, verify=True)
+    client.db(db.name, username, password, verify=True)
+    assert http_client.pool_metrics() == {
+        'in_use': 0,
+        'idle': 1,
+        'discarded': 0,
+        'pools': 1
+    }
+
+    # Test connection pool without keep-alive
+    client = ArangoClient(
+        protocol='http',
+        host='127.0.0.1',
+        port=8529,
+        keep_alive=False
+    )
+    client.db(db.name, username, password, verify=True)
+    assert client.http_client.pool_metrics()['in_use'] == 0
+
+
+def test_client_compression(db, username, password):
+    data = json.dumps([{'val': generate_string()}] * 100).encode('utf-8')
+    for encoding, wbits in [('gzip', 31), ('deflate', 15)]:
+        compressed = _compress(data, encoding, 6)
+        assert len(compressed) < len(data)
+        assert zlib.decompress(compressed, wbits) == data
+
+    with pytest.raises(ValueError):
+        DefaultHTTPClient(compression='br')
+
+    # Test transfer metrics
+    client = ArangoClient(
+        protocol='http',
+        host='127.0.0.1',
+        port=8529,
+        compression='gzip',
+        compression_threshold=2 ** 20
+    )
+    http_client = client.http_client
+    assert http_client.transfer_metrics() == {
+        'requests': 0,
+        'compressed': 0,
+        'sent': 0,
+        'sent_uncompressed': 0,
+        'received': 0,
+        'received_uncompressed': 0
+    }
+    client.db(db.name, username, password, verify=True).properties()
+    metrics = http_client.transfer_metrics()
+    assert metrics['requests'] == 2
+    assert metrics['compressed'] == 0
+    assert metrics['received'] > 0
+    assert metrics['received_uncompressed'] >= metrics['received']
+
+
+def test_client_compression_round_trip(db, col, username, password):
+    doc = {'_key': 'compressed', 'val': generate_string() * 100}
+
+    for encoding in ['gzip', 'deflate']:
+        client = ArangoClient(
+            protocol='http',
+            host='127.0.0.1',
+            port=8529,
+            compression=encoding,
+            compression_threshold=256
+        )
+        compressed_col = client.db(db.name, username, password).collection(
+            col.name)
+        compressed_col.insert(doc, overwrite=True)
+        assert clean_doc(compressed_col.get(doc['_key'])) == doc
+
+        # Test request bodies above the threshold are sent compressed
+        metrics = client.http_client.transfer_metrics()
+        assert metrics['compressed'] > 0
+        assert metrics['sent'] < metrics['sent_uncompressed']
+
+
+def test_client_custom_serializer(db, col, username, password):
+    dumped, loaded = [], []
+
+    def serializer(data):
+        dumped.append(data)
+        return json.dumps(data, default=str)
+
+    def deserializer(raw_body):
+        loaded.append(raw_body)
+        return json.loads(raw_body)
+
+    client = ArangoClient(
+        protocol='http',
+        host='127.0.0.1',
+        port=8529,
+        serializer=serializer,
+        deserializer=deserializer
+    )
+    custom_db = client.db(db.name, username, password)
+    custom_col = custom_db.collection(col.name)
+    custom_col.insert({'_key': '1', 'val': Decimal('1.5')})
+    assert custom_col.get('1')['val'] == '1.5'
+    assert {'_key': '1', 'val': Decimal('1.5')} in dumped
+    assert len(loaded) >= 2
+
+    # Batch requests and responses use the hooks too.
+    batch_db = custom_db.begin_batch_execution()
+    job = batch_db.collection(col.name).get('1')
+    batch_db.commit()
+    assert job.result()['val'] == '1.5'
+
+
+def test_client_velocypack(db, col, username, password, docs):
+    client = ArangoClient(
+        protocol='http',
+        host='127.0.0.1',
+        port=8529,
+        velocypack=True
+    )
+    vpack_db = client.db(db.name, username, password)
+    vpack_col = vpack_db.collection(col.name)
+
+    result = vpack_col.insert({'_key': 'vpack', 'val': [1, 2.5, None, 'a']})
+    assert result['_key'] == 'vpack'
+    assert vpack_col.get('vpack')['val'] == [1, 2.5, None, 'a']
+    assert vpack_col.get('missing') is None
+
+    vpack_col.insert_many(docs)
+    cursor = vpack_db.aql.execute(
+        'FOR doc IN @@col SORT doc._key RETURN doc._key',
+        bind_vars={'@col': col.name},
+        batch_size=2,
+        count=True
+    )
+    assert list(cursor) == sorted(
+        ['vpack'] + [doc['_key'] for doc in docs])
+
+    with pytest.raises(DocumentInsertError) as err:
+        vpack_col.insert({'_key': 'vpack'})
+    assert err.value.error_code == 1210
+
+
+def test_client_multiple_hosts(db, username, password):
+    hosts = ['http://127.0.0.1:8529', 'http://localhost:8529/']
+    for host_resolver in ('roundrobin', 'random', 'least_outstanding'):
+        client = ArangoClient(hosts=hosts, host_resolver=host_resolver)
+        assert client.hosts == hosts[:1] + ['http://localhost:8529']
+        assert client.base_url == 'http://127.0.0.1:8529'
+        assert repr(client) == (
+            '<ArangoClient http://127.0.0.1:8529,http://localhost:8529>'
+        )
+        assert client.host_resolver.host_count == 2
+
+        multi_db = client.db(db.name, username, password, verify=True)
+        assert multi_db.ping() == 200
+
+    with pytest.raises(ValueError):
+        ArangoClient(hosts=hosts, host_resolver='invalid')
+
+
+def test_client_host_failover(db, col, username, password, docs):
+    client = ArangoClient(
+        hosts=['http://127.0.0.1:8500', 'http://127.0.0.1:8529'],
+        host_recheck_interval=1000
+    )
+    resolver = client.host_resolver
+
+    # Requests to the bad host fail over to the good one.
+    multi_db = client.db(db.name, username, password, verify=True)
+    assert resolver.is_up(0) is False
+    assert resolver.is_up(1) is True
+    for _ in range(3):
+        assert multi_db.ping() == 200
+    assert resolver.outstanding() == [0, 0]
+
+    # Cursor requests stick to the host which created the cursor.
+    col.import_bulk(docs)
+    cursor = multi_db.aql.execute(
+        'FOR d IN {} RETURN d'.format(col.name),
+        batch_size=1
+    )
+    assert len(list(cursor)) == len(docs)
+
+    # Bad hosts are re-probed once the recheck interval passes.
+    resolver._recheck_interval = 0
+    multi_db.ping()
+    assert resolver.is_up(0) is False
+
+
+def test_client_host_failover_after_send():
+    class FlakyHTTPClient(HTTPClient):
+
+        def __init__(self, error):
+            self.error = error
+            self.urls = []
+
+        def send_request(self, method, url, **_):
+            self.urls.append(url)
+            if url.startswith('http://bad'):
+                raise self.error
+            return Response(method, url, {}, 200, 'OK', '{}')
+
+    hosts = ['http://bad:8529', 'http://good:8529']
+
+    # Requests which may have reached the server are never replayed, and do
+    # not take the host out of rotation.
+    http_client = FlakyHTTPClient(ReadTimeout('read timed out'))
+    conn = Connection(hosts, '_system', 'root', 'passwd', http_client)
+    with pytest.raises(ReadTimeout):
+        conn.send_request(Request('post', '/_api/document/col', data={}))
+    assert len(http_client.urls) == 1
+    assert conn.host_resolver.is_up(0) is True
+
+    # Idempotent requests fail over to the next host.
+    conn.host_resolver._next = 0
+    response = conn.send_request(Request('get', '/_api/collection'))
+    assert response.host_index == 1
+    assert conn.host_resolver.is_up(0) is True
+
+    # Connection failures mark the host down and fail over any request.
+    http_client = FlakyHTTPClient(IOError(errno.ECONNREFUSED, 'refused'))
+    conn = Connection(hosts, '_system', 'root', 'passwd', http_client)
+    response = conn.send_request(Request('post', '/_api/document/col'))
+    assert response.host_index == 1
+    assert http_client.urls[0].startswith('http://bad')
+    assert conn.host_resolver.is_up(0) is False
+    assert conn.host_resolver.outstanding() == [0, 0]
@@ -0,0 +1,131 @@
+from __future__ import absolute_import, unicode_literals
+
+from threading import Thread
+
+from arango.coalescer import WriteCoalescer
+from arango.exceptions import (
+    DocumentDeleteError,
+    DocumentInsertError,
+    DocumentRevisionError
+)
+from tests.helpers import assert_raises, extract
+
+
+class FakeCollection(object):
+
+    def __init__(self, name='col'):
+        self._conn = object()
+        self.name = name
+        self.requests = []
+
+    def insert_many(self, documents, **options):
+        self.requests.append((documents, options))
+        return [
+            ValueError(doc) if doc.get('bad') else doc
+            for doc in documents
+        ]
+
+
+def run_concurrently(func, items):
+    results = {}
+
+    def run(item):
+        try:
+            results[item] = func(item)
+        except Exception as err:
+            results[item] = err
+
+    threads = [Thread(target=run, args=(item,)) for item in items]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+def test_coalescer_attributes():
+    coalescer = WriteCoalescer(max_delay=0.1, max_size=10)
+    assert coalescer.max_delay == 0.1
+    assert coalescer.max_size == 10
+    assert repr(coalescer) == '<WriteCoalescer 0.1s/10>'
+    assert coalescer.statistics() == {'writes': 0, 'requests': 0}
+
+
+def test_coalescer_submit():
+    coalescer = WriteCoalescer(max_delay=5, max_size=4)
+    col = FakeCollection()
+
+    # Test writes are flushed together once the buffer is full
+    results = run_concurrently(
+        lambda i: coalescer.submit(col, 'insert', {'_key': i}, {}),
+        range(4)
+    )
+    assert results == {i: {'_key': i} for i in range(4)}
+    assert len(col.requests) == 1
+    assert sorted(doc['_key'] for doc in col.requests[0][0]) == [0, 1, 2, 3]
+    assert coalescer.statistics() == {'writes': 4, 'requests': 1}
+
+    # Test each caller gets its own error
+    results = run_concurrently(
+        lambda i: coalescer.submit(col, 'insert', {'bad': i == 2}, {}),
+        range(4)
+    )
+    assert isinstance(results[2], ValueError)
+    assert all(results[i] == {'bad': False} for i in (0, 1, 3))
+
+    # Test writes with different options are not coalesced
+    coalescer = WriteCoalescer(max_delay=0.01, max_size=4)
+    col = FakeCollection()
+    results = run_concurrently(
+        lambda i: coalescer.submit(col, 'insert', {}, {'sync': i % 2 == 0}),
+        range(2)
+    )
+    assert len(results) == 2
+    assert sorted(options['sync'] for _, options in col.requests) == [
+        False, True
+    ]
+
+    # Test a failed request is raised to every caller
+    col.insert_many = None
+    with assert_raises(TypeError):
+        coalescer.submit(col, 'insert', {}, {})
+
+
+def test_coalescer_collection_writes(db, col, docs):
+    coalescer = WriteCoalescer(max_delay=0.01, max_size=len(docs))
+    coalesced_col = db.collection(col.name, coalescer=coalescer)
+    assert coalesced_col.coalescer is coalescer
+
+    # Test concurrent inserts are coalesced
+    results = run_concurrently(
+        lambda i: coalesced_col.insert(docs[i], return_new=True),
+        range(len(docs))
+    )
+    assert all(
+        results[i]['new']['_key'] == docs[i]['_key'] for i in range(len(docs))
+    )
+    assert extract('_key', col.all()) == extract('_key', docs)
+    assert coalescer.statistics()['requests'] < len(docs)
+
+    # Test per-document errors are raised to their callers
+    results = run_concurrently(
+        lambda key: coalesced_col.insert({'_key': key}),
+        ['1', 'new']
+    )
+    assert isinstance(results['1'], DocumentInsertError)
+    assert results['new']['_key'] == 'new'
+
+    # Test updates and deletes
+    result = coalesced_col.update({'_key': '1', 'val': 100}, silent=True)
+    assert result is True
+    assert col['1']['val'] == 100
+
+    bad_rev = {'_key': '1', '_rev': col['1']['_rev'] + '0'}
+    with assert_raises(DocumentRevisionError):
+        coalesced_col.update(bad_rev)
+
+    assert coalesced_col.delete('1')['_key'] == '1'
+    assert coalesced_col.delete('1', ignore_missing=True) is False
+    with assert_raises(DocumentDeleteError) as err:
+        coalesced_col.delete('1')
+    assert err.value.error_code == 1202
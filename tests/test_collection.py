@@ -1,8 +1,10 @@
 from __future__ import absolute_import, unicode_literals
 
+import json
+
 from six import string_types
 
-from arango.collection import StandardCollection
+from arango.collection import StandardCollection, _export_lines
 from arango.exceptions import (
     CollectionChecksumError,
     CollectionConfigureError,
@@ -221,3 +223,49 @@ def test_collection_management(db, bad_db):
     with assert_raises(CollectionRenameError) as err:
         bad_db.collection(new_name).rename(new_name)
     assert err.value.error_code in {11, 1228}
+
+
+def test_collection_export_lines():
+    docs = [
+        {'_key': '1', 'val': 1, 'tags': ['a', 'b']},
+        {'_key': '2', 'text': 'x,y', 'flag': True, 'val': None},
+    ]
+
+    # Test JSON Lines
+    lines, count, fields = _export_lines(docs, 'jsonl', None, json.dumps)
+    assert [json.loads(line) for line in lines] == docs
+    assert count == 2
+    assert fields is None
+
+    # Test CSV with columns taken from the batch
+    lines, count, fields = _export_lines(
+        docs, 'csv', None, json.dumps, header=True)
+    assert fields == ['_key', 'val', 'tags', 'text', 'flag']
+    assert count == 2
+    assert lines == [
+        b'_key,val,tags,text,flag',
+        b'1,1,"[""a"", ""b""]",,',
+        b'2,,,"x,y",true',
+    ]
+
+    # Test CSV with given columns and no header
+    lines, count, fields = _export_lines(
+        docs, 'csv', ['val', 'missing'], json.dumps)
+    assert fields == ['val', 'missing']
+    assert lines == [b'1,', b',']
+
+    # Test empty batches write nothing and leave the columns unset
+    assert _export_lines([], 'csv', None, json.dumps, True) == ([], 0, None)
+    assert _export_lines([], 'jsonl', None, json.dumps) == ([], 0, None)
+    assert _export_lines({}, 'columns', None, json.dumps) == ([], 0, None)
+
+    # Test columns
+    batch = {'_key': ['1', '2'], 'val': [1, None]}
+    lines, count, _ = _export_lines(batch, 'columns', None, json.dumps)
+    assert [json.loads(line) for line in lines] == [batch]
+    assert count == 2
+
+    # Test serializers returning bytes
+    lines, _, _ = _export_lines(
+        docs[:1], 'jsonl', None, lambda d: json.dumps(d).encode('utf-8'))
+    assert json.loads(lines[0].decode('utf-8')) == docs[0]
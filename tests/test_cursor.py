@@ -272,3 +272,68 @@ def test_cursor_no_count(db, col):
     while cursor.has_more():
         assert cursor.count() is None
         assert cursor.fetch()
+
+
+def test_cursor_prefetch(db, col, docs):
+    cursor = db.aql.execute(
+        'FOR d IN {} SORT d._key RETURN d'.format(col.name),
+        count=True,
+        batch_size=1,
+        ttl=1000,
+        prefetch=2
+    )
+    assert clean_doc(cursor) == docs
+    assert not cursor.has_more()
+
+    # Test manual fetch with prefetching
+    cursor = db.aql.execute(
+        'FOR d IN {} SORT d._key RETURN d'.format(col.name),
+        count=True,
+        batch_size=1,
+        ttl=1000,
+        prefetch=1
+    )
+    result = cursor.fetch()
+    assert result['id'] == cursor.id
+    assert len(cursor.batch()) == 2
+
+    # Test premature close stops prefetching
+    assert cursor.close() is True
+    with pytest.raises(CursorCloseError) as err:
+        cursor.close(ignore_missing=False)
+    assert err.value.error_code == 1600
+
+
+def test_cursor_iter_batches(db, col, docs):
+    cursor = db.aql.execute(
+        'FOR d IN {} SORT d._key RETURN d'.format(col.name),
+        batch_size=2
+    )
+    batches = list(cursor.iter_batches())
+    assert [len(batch) for batch in batches] == [2, 2, 2]
+    assert clean_doc([doc for batch in batches for doc in batch]) == docs
+    assert cursor.empty()
+    assert not cursor.has_more()
+
+    # Test columnar batches
+    cursor = db.aql.execute(
+        'FOR d IN {} SORT d._key RETURN {{key: d._key, val: d.val}}'
+        .format(col.name),
+        batch_size=4
+    )
+    batches = list(cursor.iter_batches(columnar='array'))
+    assert len(batches) == 2
+    assert list(batches[0]['key']) == [doc['_key'] for doc in docs[:4]]
+    assert list(batches[0]['val']) == [doc['val'] for doc in docs[:4]]
+    assert batches[0]['val'].typecode == 'q'
+
+    cursor = db.aql.execute(
+        'FOR d IN {} SORT d._key RETURN {{key: d._key}}'.format(col.name),
+        batch_size=6
+    )
+    assert list(cursor.iter_batches(columnar='list')) == [
+        {'key': [doc['_key'] for doc in docs]}
+    ]
+
+    with pytest.raises(ValueError):
+        next(cursor.iter_batches(columnar='invalid'))
@@ -1,5 +1,7 @@
 from __future__ import absolute_import, unicode_literals
 
+import json
+
 import pytest
 from six import string_types
 
@@ -1544,6 +1546,22 @@ def test_document_get_many(col, bad_col, docs):
     result = col.get_many(docs)
     assert clean_doc(result) == docs
 
+    # Test get_many in chunks, keeping order and missing documents
+    missing_key = generate_doc_key()
+    handles = [docs[2], missing_key] + [doc['_key'] for doc in docs[:2]]
+    result = col.get_many(handles, chunk_size=1, workers=2, keep_order=True)
+    assert result[1] is None
+    assert clean_doc(result[0]) == docs[2]
+    assert [doc['_key'] for doc in result[2:]] == ['1', '2']
+
+    result = col.get_many(handles, chunk_size=3, as_dict=True)
+    assert result[missing_key] is None
+    assert clean_doc(result['3']) == docs[2]
+    assert sorted(result) == sorted(['1', '2', '3', missing_key])
+
+    result = col.get_many(docs, chunk_size=4, workers=2)
+    assert clean_doc(result) == docs
+
     # Test get_many in empty collection
     col.truncate()
     assert col.get_many([]) == []
@@ -2098,3 +2116,92 @@ def test_document_management_via_db(db, col):
     assert result['_id'] == doc1_id
     assert doc1_id not in col
     assert len(col) == 2
+
+
+def test_document_bulk_load(col, bad_col, docs):
+    # Test bulk_load from a generator
+    progress = []
+    result = col.bulk_load(
+        (doc for doc in docs),
+        chunk_size=2,
+        workers=2,
+        progress=progress.append
+    )
+    assert result['created'] == len(docs)
+    assert result['errors'] == 0
+    assert result['chunks'] == 3
+    assert result['details'] == []
+    assert [stats['chunks'] for stats in progress] == [1, 2, 3]
+    assert progress[-1] == result
+    assert clean_doc(col.all()) == docs
+    col.truncate()
+
+    # Test bulk_load chunked by size
+    result = col.bulk_load(docs, max_bytes=1, details=False)
+    assert result['created'] == len(docs)
+    assert result['chunks'] == len(docs)
+    assert 'details' not in result
+
+    # Test bulk_load duplicates without halt_on_error
+    result = col.bulk_load(docs, halt_on_error=False)
+    assert result['created'] == 0
+    assert result['errors'] == len(docs)
+    assert len(result['details']) == len(docs)
+
+    # Test bulk_load duplicates with halt_on_error
+    with assert_raises(DocumentInsertError):
+        col.bulk_load(docs, chunk_size=1, workers=3)
+
+    # Test bulk_load with bad database
+    with assert_raises(DocumentInsertError):
+        bad_col.bulk_load(docs)
+
+    # Test bulk_load with a failing progress callback
+    def bad_progress(_):
+        raise ValueError('progress failed')
+
+    col.truncate()
+    with pytest.raises(ValueError):
+        col.bulk_load(docs, chunk_size=1, workers=2, progress=bad_progress)
+    assert len(col) < len(docs)
+
+
+def test_document_import_jsonl(db, col, bad_col, docs, tmpdir):
+    # Test import_jsonl from a generator of documents
+    result = col.import_jsonl(doc for doc in docs)
+    assert result['created'] == len(docs)
+    assert result['errors'] == 0
+    assert clean_doc(col.all()) == docs
+    col.truncate()
+
+    # Test import_jsonl from a file path
+    path = tmpdir.join('docs.jsonl')
+    path.write('\n'.join(json.dumps(doc) for doc in docs))
+    result = col.import_jsonl(str(path), details=False, sync=True)
+    assert result['created'] == len(docs)
+    assert 'details' not in result
+    assert clean_doc(col.all()) == docs
+
+    # Test import_jsonl duplicates from a file object
+    with open(str(path), 'rb') as source:
+        result = col.import_jsonl(source, halt_on_error=False)
+    assert result['created'] == 0
+    assert result['errors'] == len(docs)
+
+    # Test import_jsonl with overwrite from serialized lines
+    lines = [json.dumps(doc) for doc in docs[:2]]
+    result = col.import_jsonl(iter(lines), overwrite=True)
+    assert result['created'] == 2
+    assert len(col) == 2
+
+    # Test import_jsonl from a file path in batch context
+    col.truncate()
+    batch_db = db.begin_batch_execution()
+    job = batch_db.collection(col.name).import_jsonl(str(path))
+    batch_db.commit()
+    assert job.result()['created'] == len(docs)
+    assert clean_doc(col.all()) == docs
+
+    # Test import_jsonl with bad database
+    with assert_raises(DocumentInsertError):
+        bad_col.import_jsonl(doc for doc in docs)
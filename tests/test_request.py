@@ -118,3 +118,41 @@ def test_request_transaction_data():
     assert request.command == 'return 1'
     assert request.read == 'one'
     assert request.write == 'two'
+
+
+def test_request_custom_serializer():
+    request = Request(
+        method='post',
+        endpoint='/_api/test',
+        data={'baz': 'qux'}
+    )
+
+    # Test reading data before serialization does not bypass the serializer
+    assert request.data == '{"baz": "qux"}'
+    assert str(request).endswith('\r\n\r\n{"baz": "qux"}')
+
+    serialized = request.serialize(lambda data: b'{"baz":"qux"}')
+    assert serialized == b'{"baz":"qux"}'
+    assert request.data == b'{"baz":"qux"}'
+    assert str(request).endswith('\r\n\r\n{"baz":"qux"}')
+
+    # Test payload is serialized only once
+    assert request.serialize(lambda data: 'ignored') == b'{"baz":"qux"}'
+
+    # Test string payloads are sent as is
+    request = Request(method='post', endpoint='/_api/test', data='test')
+    assert request.serialize(lambda data: 'ignored') == 'test'
+
+
+def test_request_streamed_data():
+    def generate():
+        yield b'{"baz": "qux"}\n'
+
+    stream = generate()
+    request = Request(method='post', endpoint='/_api/test', data=stream)
+    assert request.streamed is True
+    assert request.data is stream
+    assert str(request).endswith('\r\n\r\n<streamed>')
+
+    request = Request(method='post', endpoint='/_api/test', data=[1])
+    assert request.streamed is False
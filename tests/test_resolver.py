@@ -0,0 +1,87 @@
+from __future__ import absolute_import, unicode_literals
+
+import pytest
+
+from arango.resolver import (
+    LeastOutstandingHostResolver,
+    RandomHostResolver,
+    RoundRobinHostResolver,
+    get_host_resolver
+)
+
+
+def test_round_robin_host_resolver():
+    resolver = RoundRobinHostResolver(3)
+    assert resolver.host_count == 3
+
+    indexes = []
+    for _ in range(6):
+        index = resolver.get_host_index()
+        resolver.release(index)
+        indexes.append(index)
+    assert indexes == [0, 1, 2, 0, 1, 2]
+
+    # Test hosts marked down are skipped
+    resolver.mark_down(1)
+    assert resolver.is_up(1) is False
+    indexes = []
+    for _ in range(4):
+        index = resolver.get_host_index()
+        resolver.release(index)
+        indexes.append(index)
+    assert indexes == [0, 2, 0, 2]
+
+    # Test excluded hosts are skipped
+    assert resolver.get_host_index(exclude={0}) == 2
+
+    # Test down hosts are used as a last resort
+    assert resolver.get_host_index(exclude={0, 2}) == 1
+
+    resolver.mark_up(1)
+    assert resolver.is_up(1) is True
+
+
+def test_random_host_resolver():
+    resolver = RandomHostResolver(3)
+    resolver.mark_down(0)
+    for _ in range(10):
+        assert resolver.get_host_index() in {1, 2}
+
+
+def test_least_outstanding_host_resolver():
+    resolver = LeastOutstandingHostResolver(3)
+    assert resolver.get_host_index() == 0
+    assert resolver.get_host_index() == 1
+    assert resolver.get_host_index() == 2
+    assert resolver.outstanding() == [1, 1, 1]
+
+    resolver.release(1)
+    assert resolver.get_host_index() == 1
+    resolver.acquire(0)
+    assert resolver.outstanding() == [2, 1, 1]
+
+
+def test_host_resolver_probing():
+    resolver = RoundRobinHostResolver(2, recheck_interval=1000)
+    assert resolver.hosts_to_probe() == []
+    resolver.mark_down(1)
+    assert resolver.hosts_to_probe() == []
+
+    resolver._recheck_interval = 0
+    assert resolver.hosts_to_probe() == [1]
+    assert resolver.is_up(1) is False
+
+
+def test_get_host_resolver():
+    resolver = RandomHostResolver(1)
+    assert get_host_resolver(resolver, 1, 30) is resolver
+    assert isinstance(
+        get_host_resolver('roundrobin', 1, 30),
+        RoundRobinHostResolver
+    )
+    assert isinstance(
+        get_host_resolver('least_outstanding', 1, 30),
+        LeastOutstandingHostResolver
+    )
+    with pytest.raises(ValueError):
+        get_host_resolver('invalid', 1, 30)
@@ -1,5 +1,7 @@
 from __future__ import absolute_import, unicode_literals
 
+import json
+
 from requests.structures import CaseInsensitiveDict
 
 from arango.response import Response
@@ -60,3 +62,173 @@ def test_response():
     assert response.raw_body == 'invalid'
     assert response.error_code is None
     assert response.error_message is None
+
+
+def test_response_without_raw_body():
+    test_body = b'{"_key": "foo", "val": "\xc3\xa9"}'
+    response = Response(
+        method='get',
+        url='test_url',
+        headers=CaseInsensitiveDict({'foo': 'bar'}),
+        status_text='baz',
+        status_code=200,
+        raw_body=test_body,
+        keep_raw_body=False
+    )
+    assert response.is_success is True
+    assert response.body == {'_key': 'foo', 'val': '\u00e9'}
+    assert json.loads(response.raw_body) == response.body
+
+    # Test raw body is kept for failed responses
+    test_body = b'{"errorNum": 1, "errorMessage": "qux"}'
+    response = Response(
+        method='get',
+        url='test_url',
+        headers=CaseInsensitiveDict({'foo': 'bar'}),
+        status_text='baz',
+        status_code=400,
+        raw_body=test_body,
+        keep_raw_body=False
+    )
+    assert response.is_success is False
+    assert response.error_code == 1
+    assert response.error_message == 'qux'
+    assert response.raw_body == test_body.decode('utf-8')
+
+    # Test raw body is kept for non-JSON responses
+    response = Response(
+        method='get',
+        url='test_url',
+        headers=CaseInsensitiveDict({'foo': 'bar'}),
+        status_text='baz',
+        status_code=200,
+        raw_body=b'invalid',
+        keep_raw_body=False
+    )
+    assert response.body == 'invalid'
+    assert response.raw_body == 'invalid'
+
+
+def test_response_bytes_body():
+    calls = []
+
+    def deserializer(raw_body):
+        calls.append(raw_body)
+        return json.loads(raw_body)
+
+    # Test bytes are deserialized without decoding them first
+    response = Response(
+        method='get',
+        url='test_url',
+        headers=CaseInsensitiveDict({'foo': 'bar'}),
+        status_text='baz',
+        status_code=200,
+        raw_body=b'{"errorNum": 1, "errorMessage": "qux"}',
+        deserializer=deserializer
+    )
+    assert response.error_code == 1
+    assert calls == [b'{"errorNum": 1, "errorMessage": "qux"}']
+
+    # Test bytes are decoded for deserializers which reject them
+    def text_deserializer(raw_body):
+        if isinstance(raw_body, bytes):
+            raise TypeError('text expected')
+        calls.append(raw_body)
+        return json.loads(raw_body)
+
+    response = Response(
+        method='get',
+        url='test_url',
+        headers=CaseInsensitiveDict({'foo': 'bar'}),
+        status_text='baz',
+        status_code=400,
+        raw_body=b'{"errorNum": 2, "errorMessage": "qux"}',
+        deserializer=text_deserializer
+    )
+    assert response.error_code == 2
+    assert calls[-1] == '{"errorNum": 2, "errorMessage": "qux"}'
+    assert response.raw_body == '{"errorNum": 2, "errorMessage": "qux"}'
+
+
+def test_response_custom_deserializer():
+    calls = []
+
+    def deserializer(raw_body):
+        calls.append(raw_body)
+        return json.loads(raw_body)
+
+    response = Response(
+        method='get',
+        url='test_url',
+        headers=CaseInsensitiveDict({'foo': 'bar'}),
+        status_text='baz',
+        status_code=200,
+        raw_body='{"bar": "baz"}',
+        deserializer=deserializer
+    )
+    assert response.body == {'bar': 'baz'}
+    assert calls == ['{"bar": "baz"}']
+
+
+def test_response_lazy_body():
+    calls = []
+
+    def deserializer(raw_body):
+        calls.append(raw_body)
+        return json.loads(raw_body)
+
+    # Test status checks do not deserialize the body
+    response = Response(
+        method='delete',
+        url='test_url',
+        headers=CaseInsensitiveDict({'foo': 'bar'}),
+        status_text='baz',
+        status_code=202,
+        raw_body=b'{"_id": "col/1", "_key": "1", "_rev": "_r1"}',
+        deserializer=deserializer
+    )
+    assert response.is_success is True
+    assert calls == []
+    assert response.body['_key'] == '1'
+    assert response.body['_id'] == 'col/1'
+    assert len(calls) == 1
+
+    response = Response(
+        method='head',
+        url='test_url',
+        headers=CaseInsensitiveDict({'foo': 'bar'}),
+        status_text='baz',
+        status_code=404,
+        raw_body='',
+        deserializer=deserializer
+    )
+    assert response.is_success is False
+    assert len(calls) == 1
+
+    # Test bodies mentioning errors are deserialized
+    response = Response(
+        method='get',
+        url='test_url',
+        headers=CaseInsensitiveDict({'foo': 'bar'}),
+        status_text='baz',
+        status_code=200,
+        raw_body='{"errorNum": 1, "errorMessage": "qux"}',
+        deserializer=deserializer
+    )
+    assert response.is_success is False
+    assert response.error_code == 1
+    assert len(calls) == 2
+
+    # Test already deserialized bodies are used as is
+    response = Response(
+        method='get',
+        url='test_url',
+        headers=CaseInsensitiveDict({'foo': 'bar'}),
+        status_text='baz',
+        status_code=200,
+        raw_body={'errorNum': 1202, 'errorMessage': 'not found'},
+        deserializer=deserializer
+    )
+    assert response.is_success is False
+    assert response.body == {'errorNum': 1202, 'errorMessage': 'not found'}
+    assert response.error_message == 'not found'
@@ -3,14 +3,23 @@ from __future__ import absolute_import, unicode_literals
 import pytest
 from six import string_types
 
-from arango.database import TransactionDatabase
+from arango.database import StreamTransactionDatabase, TransactionDatabase
 from arango.exceptions import (
+    TransactionAbortError,
+    TransactionBeginError,
+    TransactionCommitError,
     TransactionStateError,
+    TransactionStatusError,
     TransactionExecuteError,
     TransactionJobResultError
 )
 from arango.job import TransactionJob
-from tests.helpers import clean_doc, extract, generate_string
+from tests.helpers import (
+    clean_doc,
+    extract,
+    generate_string,
+    skip_if_db_version_below
+)
 
 
 # noinspection PyUnresolvedReferences
@@ -249,3 +258,83 @@ def test_transaction_execute_raw(db, col, docs):
     with pytest.raises(TransactionExecuteError) as err:
         db.execute_transaction(command='INVALID COMMAND')
     assert err.value.error_code == 10
+
+
+def test_stream_transaction_commit(db, col, docs):
+    skip_if_db_version_below(db, (3, 5))
+    txn_db = db.begin_stream_transaction(write=col.name, sync=True)
+    assert isinstance(txn_db, StreamTransactionDatabase)
+    assert isinstance(txn_db.transaction_id, string_types)
+    assert txn_db.context == 'stream_transaction'
+    assert txn_db.db_name == db.name
+    assert repr(txn_db) == '<StreamTransactionDatabase {}>'.format(db.name)
+    assert txn_db.transaction_status() == 'running'
+
+    # Test results are returned right away, but hidden from others
+    txn_col = txn_db.collection(col.name)
+    assert txn_col.context == 'stream_transaction'
+    txn_col.insert_many(docs)
+    assert len(txn_col) == len(docs)
+    assert len(col) == 0
+
+    # Test cursors fetch their batches within the transaction
+    cursor = txn_db.aql.execute(
+        'FOR d IN @@col RETURN d',
+        bind_vars={'@col': col.name},
+        batch_size=1
+    )
+    assert extract('_key', cursor) == extract('_key', docs)
+
+    assert txn_db.commit() is True
+    assert extract('_key', col.all()) == extract('_key', docs)
+    assert db.collection(col.name).get(docs[0]['_key']) is not None
+
+    # Test actions after commit
+    with pytest.raises(TransactionStateError) as err:
+        txn_col.insert({})
+    assert 'already committed' in str(err.value)
+    with pytest.raises(TransactionStateError):
+        txn_db.commit()
+    with pytest.raises(TransactionStateError):
+        txn_db.abort()
+
+
+def test_stream_transaction_abort(db, col, docs):
+    skip_if_db_version_below(db, (3, 5))
+    txn_db = db.begin_stream_transaction(write=col.name)
+    txn_db.collection(col.name).insert(docs[0])
+    assert txn_db.abort() is True
+    assert len(col) == 0
+
+    # Test context manager
+    with pytest.raises(ValueError):
+        with db.begin_stream_transaction(write=col.name) as txn_db:
+            txn_db.collection(col.name).insert(docs[0])
+            raise ValueError
+    assert len(col) == 0
+
+    with db.begin_stream_transaction(write=col.name) as txn_db:
+        txn_db.collection(col.name).insert(docs[0])
+    assert len(col) == 1
+
+
+def test_stream_transaction_errors(db, bad_db, col):
+    skip_if_db_version_below(db, (3, 5))
+    with pytest.raises(TransactionBeginError) as err:
+        bad_db.begin_stream_transaction(write=col.name)
+    assert err.value.error_code in {11, 1228}
+
+    with pytest.raises(TransactionBeginError):
+        db.begin_stream_transaction(write=generate_string())
+
+    txn_db = db.begin_stream_transaction(write=col.name)
+    txn_db.abort()
+    txn_db._executor._status = 'running'
+    with pytest.raises(TransactionCommitError):
+        txn_db.commit()
+    with pytest.raises(TransactionAbortError):
+        txn_db.abort()
+
+    bad_txn_db = StreamTransactionDatabase(bad_db._conn, '0')
+    with pytest.raises(TransactionStatusError):
+        bad_txn_db.transaction_status()
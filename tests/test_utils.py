@@ -0,0 +1,80 @@
+from __future__ import absolute_import, unicode_literals
+
+import pytest
+
+from arango.utils import map_concurrently, parse_multipart
+
+
+def test_map_concurrently():
+    items = list(range(10))
+    assert map_concurrently(lambda x: x * 2, items, 1) == [
+        x * 2 for x in items
+    ]
+    assert map_concurrently(lambda x: x * 2, items, 4) == [
+        x * 2 for x in items
+    ]
+    assert map_concurrently(lambda x: x, [], 4) == []
+
+    def fail(item):
+        if item >= 5:
+            raise ValueError(item)
+        return item
+
+    with pytest.raises(ValueError) as err:
+        map_concurrently(fail, items, 1)
+    assert err.value.args == (5,)
+
+    with pytest.raises(ValueError):
+        map_concurrently(fail, items, 4)
+
+
+def test_parse_multipart():
+    body = '\r\n'.join([
+        '--XXX',
+        'Content-Type: application/x-arango-batchpart',
+        'Content-Id: 1',
+        '',
+        'HTTP/1.1 202 Accepted',
+        'Content-Type: application/json; charset=utf-8',
+        'Content-Length: 28',
+        '',
+        '{"_key": "a",\r\n "val": 1}',
+        '--XXX',
+        'Content-Id: 2',
+        '',
+        'HTTP/1.1 204 No Content',
+        '',
+        '',
+        '--XXX--',
+        ''
+    ])
+    expected = [
+        (
+            {
+                'content-type': 'application/x-arango-batchpart',
+                'content-id': '1'
+            },
+            202,
+            'Accepted',
+            {
+                'content-type': 'application/json; charset=utf-8',
+                'content-length': '28'
+            },
+            '{"_key": "a",\r\n "val": 1}'
+        ),
+        ({'content-id': '2'}, 204, 'No Content', {}, '')
+    ]
+    assert list(parse_multipart(body, 'XXX')) == expected
+
+    # Test bytes bodies
+    parts = list(parse_multipart(body.encode('utf-8'), 'XXX'))
+    assert parts[0][4] == b'{"_key": "a",\r\n "val": 1}'
+    assert parts[1][:4] == expected[1][:4]
+
+    # Test bodies without parts
+    assert list(parse_multipart('', 'XXX')) == []
+    assert list(parse_multipart('--XXX--', 'XXX')) == []
+
+    # Test truncated bodies
+    with pytest.raises(ValueError):
+        list(parse_multipart(body[:body.index('--XXX--')], 'XXX'))
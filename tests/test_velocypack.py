@@ -0,0 +1,122 @@
+from __future__ import absolute_import, unicode_literals
+
+import random
+
+import pytest
+
+from arango.response import Response
+from arango.velocypack import CONTENT_TYPE, dumps, loads
+
+
+def test_velocypack_scalars():
+    for value, data in [
+        (None, '18'),
+        (False, '19'),
+        (True, '1a'),
+        (0, '30'),
+        (9, '39'),
+        (-1, '3f'),
+        (-6, '3a'),
+        (10, '280a'),
+        (-7, '20f9'),
+        (2 ** 63, '2f0000000000000080'),
+        (1.5, '1b000000000000f83f'),
+        ('', '40'),
+        ('ab', '426162'),
+    ]:
+        assert dumps(value) == bytes(bytearray.fromhex(data))
+        assert loads(dumps(value)) == value
+
+    long_string = 'x' * 200
+    assert dumps(long_string)[:1] == b'\xbf'
+    assert loads(dumps(long_string)) == long_string
+    assert loads(dumps('ünïcödé')) == 'ünïcödé'
+
+    with pytest.raises(ValueError):
+        dumps(2 ** 64)
+    with pytest.raises(TypeError):
+        dumps(object())
+    with pytest.raises(TypeError):
+        dumps({1: 'a'})
+
+
+def test_velocypack_compound():
+    # Compact array and object examples from the VelocyPack specification
+    assert dumps([]) == b'\x01'
+    assert dumps({}) == b'\x0a'
+    assert dumps([1, 16]) == b'\x13\x06\x31\x28\x10\x02'
+    assert dumps({'a': 1}) == b'\x14\x06\x41\x61\x31\x01'
+
+    # Array without index table and indexed array
+    assert loads(b'\x02\x05\x31\x32\x33') == [1, 2, 3]
+    assert loads(b'\x06\x08\x02\x31\x41\x61\x03\x04') == [1, 'a']
+
+    # Indexed object
+    data = bytearray.fromhex('0b1303416128 0c41621a41634378797a 03070a')
+    assert loads(bytes(data)) == {'a': 12, 'b': True, 'c': 'xyz'}
+
+    # Object keys translated to integers by the server
+    data = bytearray.fromhex('0b0b02 31 4161 32 4162 0306')
+    assert loads(bytes(data)) == {'_key': 'a', '_rev': 'b'}
+
+    document = {
+        '_key': 'foo',
+        'numbers': [0, -1, 255, 2 ** 40, -2 ** 40, 0.25],
+        'nested': {'list': [[], {}, [None, True, False]]},
+        'text': 'bar' * 100,
+    }
+    assert loads(dumps(document)) == document
+    assert loads(dumps((1, 2))) == [1, 2]
+
+
+def test_velocypack_random_values():
+    rng = random.Random(1)
+
+    def value(depth):
+        kind = rng.randint(0, 6 if depth < 3 else 4)
+        if kind == 0:
+            return None
+        if kind == 1:
+            return rng.choice([True, False])
+        if kind == 2:
+            return rng.randint(-2 ** 63, 2 ** 63 - 1) >> rng.randint(0, 63)
+        if kind == 3:
+            return rng.random() * 1e6
+        if kind == 4:
+            return 'k' * rng.randint(0, 300)
+        if kind == 5:
+            return [value(depth + 1) for _ in range(rng.randint(0, 20))]
+        return {
+            'k{}'.format(i): value(depth + 1)
+            for i in range(rng.randint(0, 20))
+        }
+
+    for _ in range(200):
+        obj = value(0)
+        assert loads(dumps(obj)) == obj
+
+
+def test_velocypack_malformed():
+    with pytest.raises(ValueError):
+        loads(b'')
+    with pytest.raises(ValueError):
+        loads(dumps([1, 2, 3])[:-1])
+    with pytest.raises(ValueError):
+        loads(dumps('foo')[:-1])
+
+
+def test_velocypack_response():
+    headers = {'content-type': CONTENT_TYPE}
+    body = {'_key': 'a', 'val': 1}
+    resp = Response('get', 'url', headers, 200, 'OK', dumps(body))
+    resp._deserializer = loads
+    assert resp.is_success is True
+    assert resp.body == body
+    assert resp.raw_body == dumps(body)
+
+    error = {'error': True, 'errorNum': 1202, 'errorMessage': 'not found'}
+    resp = Response('get', 'url', headers, 404, 'Not Found', dumps(error))
+    resp._deserializer = loads
+    assert resp.is_success is False
+    assert resp.error_code == 1202
+    assert resp.error_message == 'not found'
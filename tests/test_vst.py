@@ -0,0 +1,261 @@
+from __future__ import absolute_import, unicode_literals
+
+import json
+import socket
+import struct
+import threading
+
+import pytest
+
+from arango import velocypack
+from arango.client import ArangoClient
+from arango.vst import VelocyStreamClient
+
+chunk_header = struct.Struct('<IIQQ')
+
+
+class StubServer(object):
+    """VelocyStream server which replays canned responses.
+
+    Request messages are collected until **group** of them arrived on a
+    connection, then answered in reverse order, so clients must match
+    responses to requests by message ID.
+    """
+
+    def __init__(self, group=1, chunk_size=30000, password='passwd'):
+        self.group = group
+        self.chunk_size = chunk_size
+        self.password = password
+        self.requests = []
+        self.connections = 0
+        self.sock = socket.socket()
+        self.sock.bind(('127.0.0.1', 0))
+        self.sock.listen(16)
+        self.url = 'http://127.0.0.1:{}'.format(self.sock.getsockname()[1])
+        thread = threading.Thread(target=self.accept)
+        thread.daemon = True
+        thread.start()
+
+    def accept(self):
+        while True:
+            try:
+                conn, _ = self.sock.accept()
+            except socket.error:
+                return
+            self.connections += 1
+            thread = threading.Thread(target=self.serve, args=(conn,))
+            thread.daemon = True
+            thread.start()
+
+    def close(self):
+        self.sock.close()
+
+    def serve(self, conn):
+        def recv(size):
+            data = b''
+            while len(data) < size:
+                part = conn.recv(size - len(data))
+                if not part:
+                    raise socket.error('closed')
+                data += part
+            return data
+
+        try:
+            assert recv(11) == b'VST/1.1\r\n\r\n'
+            chunks, waiting = {}, []
+            while True:
+                length, chunk_x, message_id, _ = chunk_header.unpack(
+                    recv(chunk_header.size))
+                payload = recv(length - chunk_header.size)
+                parts = chunks.setdefault(message_id, {})
+                if chunk_x & 1:
+                    parts['total'] = chunk_x >> 1
+                    parts[0] = payload
+                else:
+                    parts[chunk_x >> 1] = payload
+                if len(parts) - 1 != parts.get('total'):
+                    continue
+                del chunks[message_id]
+                message = b''.join(
+                    parts[index] for index in range(parts['total']))
+                header, size = velocypack.loads_prefix(message)
+                if header[1] == 1000:
+                    status = 200 if header[4] == self.password else 401
+                    self.reply(conn, message_id, [1, 2, status, {}], b'')
+                    continue
+                self.requests.append((header, message[size:]))
+                waiting.append((message_id, header, message[size:]))
+                if len(waiting) >= self.group:
+                    for message_id, header, body in reversed(waiting):
+                        self.reply(conn, message_id, *self.handle(
+                            header, body))
+                    waiting = []
+        except socket.error:
+            conn.close()
+
+    def handle(self, header, body):
+        path, meta = header[4], header[6]
+        if path == '/_api/version':
+            return [1, 2, 200, {'content-type': 'application/json'}], \
+                json.dumps({'server': 'arango', 'version': '3.4.0'}).encode()
+        if path == '/_api/echo':
+            result = {'params': header[5], 'body': body.decode('utf-8')}
+            if meta.get('accept') == velocypack.CONTENT_TYPE:
+                return [1, 2, 200, {}], velocypack.dumps(result)
+            return [1, 2, 200, {'content-type': 'application/json'}], \
+                json.dumps(result).encode()
+        if path == '/_api/close':
+            raise socket.error('closed')
+        return [1, 2, 404, {'content-type': 'application/json'}], \
+            json.dumps({'error': True, 'errorNum': 404}).encode()
+
+    def reply(self, conn, message_id, header, body):
+        message = velocypack.dumps(header) + body
+        size = self.chunk_size
+        total = max(1, -(-len(message) // size))
+        for index in range(total):
+            payload = message[index * size:(index + 1) * size]
+            chunk_x = (total << 1) | 1 if index == 0 else index << 1
+            conn.sendall(chunk_header.pack(
+                chunk_header.size + len(payload),
+                chunk_x,
+                message_id,
+                len(message)
+            ) + payload)
+
+
+@pytest.fixture
+def server():
+    stub = StubServer()
+    yield stub
+    stub.close()
+
+
+def test_vst_send_request(server):
+    client = VelocyStreamClient()
+    url = server.url + '/_db/test/_api/echo'
+    resp = client.send_request(
+        'post', url,
+        params={'foo': 1, 'bar': None},
+        data='{"a": 1}',
+        headers={'Content-Type': 'application/json'},
+        auth=('root', 'passwd')
+    )
+    assert resp.status_code == 200
+    assert resp.status_text == 'OK'
+    assert resp.body == {'params': {'foo': '1'}, 'body': '{"a": 1}'}
+    assert resp.raw_body == json.dumps(resp.body)
+
+    header, body = server.requests[0]
+    assert header[:5] == [1, 1, 'test', 2, '/_api/echo']
+    assert header[6] == {
+        'content-type': 'application/json',
+        'accept': 'application/json'
+    }
+    assert body == b'{"a": 1}'
+
+    # Test JSON bodies are sent with their content type by default
+    client.send_request('put', url, data=b'{"b": 2}', auth=('root', 'passwd'))
+    assert server.requests[-1][0][6] == {
+        'content-type': 'application/json',
+        'accept': 'application/json'
+    }
+
+    # Test VelocyPack responses
+    resp = client.send_request(
+        'get', url, headers={'accept': velocypack.CONTENT_TYPE}, auth=(
+            'root', 'passwd'))
+    assert resp.headers['content-type'] == velocypack.CONTENT_TYPE
+    assert resp.body == {'params': {}, 'body': ''}
+    assert 'content-type' not in server.requests[-1][0][6]
+
+    # Test error responses
+    resp = client.send_request('get', server.url + '/_api/missing')
+    assert resp.status_code == 404
+    assert resp.is_success is False
+    assert resp.error_code == 404
+    assert server.requests[-1][0][2:5] == ['_system', 1, '/_api/missing']
+
+    # One connection is kept per host and credentials.
+    assert client.pool_metrics() == {
+        'connections': 2,
+        'in_flight': 0,
+        'pools': 2
+    }
+    client.close()
+    assert client.pool_metrics()['connections'] == 0
+
+
+def test_vst_multiplexing():
+    server = StubServer(group=8)
+    client = VelocyStreamClient(max_connections=1)
+    url = server.url + '/_api/echo'
+    results = {}
+
+    def send(index):
+        resp = client.send_request('post', url, data=str(index))
+        results[index] = resp.body['body']
+
+    threads = [
+        threading.Thread(target=send, args=(index,)) for index in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(10)
+    assert results == {index: str(index) for index in range(8)}
+    assert server.connections == 1
+    client.close()
+    server.close()
+
+
+def test_vst_chunking():
+    server = StubServer(chunk_size=100)
+    client = VelocyStreamClient(chunk_size=64)
+    data = json.dumps(['x' * 10] * 100)
+    resp = client.send_request('post', server.url + '/_api/echo', data=data)
+    assert resp.body['body'] == data
+
+    # Test streamed payloads
+    resp = client.send_request(
+        'post', server.url + '/_api/echo', data=(p for p in ['a', b'b']))
+    assert resp.body['body'] == 'ab'
+    client.close()
+    server.close()
+
+
+def test_vst_errors(server):
+    client = VelocyStreamClient(timeout=5)
+
+    # Test authentication failures
+    with pytest.raises(socket.error) as err:
+        client.send_request(
+            'get', server.url + '/_api/version', auth=('root', 'bad'))
+    assert 'authentication failed (401)' in str(err.value)
+
+    # Test connections closed by the server
+    with pytest.raises(socket.error):
+        client.send_request('get', server.url + '/_api/close')
+    assert client.pool_metrics()['connections'] == 0
+
+    # Test timeouts
+    slow_server = StubServer(group=2)
+    client = VelocyStreamClient(timeout=0.2)
+    with pytest.raises(socket.timeout):
+        client.send_request('get', slow_server.url + '/_api/version')
+    client.close()
+    slow_server.close()
+
+    # Test unreachable hosts
+    with pytest.raises(socket.error):
+        client.send_request('get', 'http://127.0.0.1:1/_api/version')
+
+
+def test_vst_arango_client(server):
+    client = ArangoClient(
+        hosts=[server.url],
+        http_client=VelocyStreamClient()
+    )
+    db = client.db('test', 'root', 'passwd')
+    assert db.version() == '3.4.0'
+    assert server.requests[-1][0][2:5] == ['test', 1, '/_api/version']